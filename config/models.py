@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 from .settings import ModelConfig, validate_temperature, validate_token_limit
 
 # Agent-specific models
@@ -58,14 +58,48 @@ WORKFLOW_MODELS: Dict[str, ModelConfig] = {
     )
 }
 
+# Cheapest-first model cascades; the last entry is the escalation target
+MODEL_CASCADES: Dict[str, List[ModelConfig]] = {
+    'code_analysis': [
+        ModelConfig(
+            model="gpt-3.5-turbo-1106",
+            temperature=validate_temperature(0.2),
+            max_tokens=validate_token_limit(4000),
+            frequency_penalty=0.0,
+            presence_penalty=0.0
+        ),
+        AGENT_MODELS['code_analysis']
+    ],
+    # Keyed by the agent type DocReviewerAgent registers as
+    'doc_reviewer': [
+        ModelConfig(
+            model="gpt-3.5-turbo-1106",
+            temperature=validate_temperature(0.2),
+            max_tokens=validate_token_limit(4000),
+            frequency_penalty=0.1,
+            presence_penalty=0.1
+        ),
+        AGENT_MODELS['review']
+    ]
+}
+
 def get_agent_model(agent_type: str) -> ModelConfig:
     """Get model configuration for a specific agent type."""
-    if agent_type not in AGENT_MODELS:
-        raise ValueError(f"Unknown agent type: {agent_type}")
-    return AGENT_MODELS[agent_type]
+    if agent_type in AGENT_MODELS:
+        return AGENT_MODELS[agent_type]
+    # Agents with only a cascade default to its escalation target
+    if agent_type in MODEL_CASCADES:
+        return MODEL_CASCADES[agent_type][-1]
+    raise ValueError(f"Unknown agent type: {agent_type}")
 
 def get_workflow_model(workflow_type: str) -> ModelConfig:
     """Get model configuration for a specific workflow type."""
     if workflow_type not in WORKFLOW_MODELS:
         raise ValueError(f"Unknown workflow type: {workflow_type}")
-    return WORKFLOW_MODELS[workflow_type]
\ No newline at end of file
+    return WORKFLOW_MODELS[workflow_type]
+
+def get_model_cascade(agent_type: str) -> List[ModelConfig]:
+    """Get the cheapest-first model cascade for an agent type."""
+    if agent_type in MODEL_CASCADES:
+        return MODEL_CASCADES[agent_type]
+    return [get_agent_model(agent_type)]
\ No newline at end of file
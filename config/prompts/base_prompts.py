@@ -33,6 +33,71 @@ Code:
 
 Code:
 {code}
+"""),
+
+    "analyze_files": PromptTemplate(
+        """Analyze each of the following code files. Respond with a single JSON object
+keyed by the exact file path shown in each "### File:" header. Each value must be:
+{{"purpose": "main purpose and functionality",
+ "components": [{{"name": "...", "type": "...", "description": "..."}}],
+ "patterns": ["important patterns or practices"]}}
+Include every file and nothing else. Only describe components that are not
+listed as already documented.
+
+{files}
+"""),
+
+    "describe_endpoints": PromptTemplate(
+        """Describe each of the following API endpoints from its handler code. Respond
+with a single JSON object keyed by the exact id shown in each "### Endpoint:"
+header. Each value must be:
+{{"description": "one or two sentences on what the endpoint does",
+ "parameters": {{"parameter name": "short description"}}}}
+Only describe the parameters listed for each endpoint. Include every endpoint
+and nothing else.
+
+{endpoints}
+"""),
+
+    "describe_symbols": PromptTemplate(
+        """Write a one or two sentence description of each of the following code
+symbols. Respond with a single JSON object keyed by the exact id shown in each
+"### Symbol:" header. Each value must be: {{"description": "..."}}
+Include every symbol and nothing else.
+
+{symbols}
+"""),
+
+    "process_feedback": PromptTemplate(
+        """Turn the following documentation review feedback into concrete edit
+instructions grouped by documentation file. Respond with a single JSON object
+mapping each file path to a list of instructions, for example:
+{{"README.md": ["Document the --verbose flag in the Usage section"]}}
+Only include files that need changes.
+
+Feedback:
+{feedback}
+"""),
+
+    "patch_sections": PromptTemplate(
+        """Revise the markdown document {file_path} by returning section patches, not
+the whole document.
+
+Document outline (section id: heading):
+{outline}
+
+Sections shown in full:
+{sections}
+
+Requested changes:
+{changes}
+
+Respond with a single JSON object:
+{{"patches": [{{"section": "section id", "action": "replace" | "insert_after" | "delete",
+  "content": "markdown of the new section, heading included"}}]}}
+Only "replace" sections shown in full above. Use "insert_after" to add a new
+section after an existing one ("_preamble" for the top of the document).
+Return an empty list if no change is needed.
 """)
 }
 
@@ -58,6 +123,24 @@ Components:
 
 Component:
 {component}
+"""),
+
+    "summarize_file": PromptTemplate(
+        """Summarize the role of the following file in two or three sentences.
+Mention its key components and what other parts of the system it serves.
+
+File: {path}
+Code:
+{code}
+"""),
+
+    "summarize_directory": PromptTemplate(
+        """Summarize the responsibility of the directory "{path}" in a short paragraph,
+based on the summaries of its files and subdirectories. Describe how the
+children fit together rather than repeating each summary.
+
+Children:
+{children}
 """)
 }
 
@@ -108,6 +191,36 @@ Documentation:
 
 Current Documentation:
 {documentation}
+"""),
+
+    "verify_claims": PromptTemplate(
+        """Check each of the following documentation claims against the repository
+information and the code snippets listed under the claim. Respond with a single
+JSON object keyed by the exact claim id in brackets. Each value must be:
+{{"verdict": "supported" | "unsupported" | "unclear",
+ "evidence": "files or facts that support or contradict the claim",
+ "reason": "one sentence explaining the verdict"}}
+Include every claim and nothing else.
+
+Repository:
+{repo_info}
+
+Claims:
+{claims}
+"""),
+
+    "validate_endpoints": PromptTemplate(
+        """Validate the documentation of each of the following API endpoints. Check
+that the description matches the method and path, that parameter types and
+required flags are plausible, and that the examples fit the endpoint. Respond
+with a single JSON object keyed by the exact endpoint id in brackets. Each
+value must be:
+{{"valid": true | false,
+ "issues": [{{"field": "...", "message": "..."}}]}}
+Include every endpoint and nothing else.
+
+Endpoints:
+{endpoints}
 """)
 }
 
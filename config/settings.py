@@ -36,14 +36,26 @@ MAX_CONCURRENT_TASKS = 5
 LOG_LEVEL = "INFO"
 LOG_FILE = LOGS_DIR / "docsmith.log"
 
+# LLM transport settings
+LLM_MAX_CONNECTIONS = 50  # connections to the API across all concurrent requests
+LLM_MAX_KEEPALIVE = 20  # idle connections kept open for reuse
+LLM_KEEPALIVE_EXPIRY = 60.0  # seconds before an idle connection is closed
+LLM_CONNECT_TIMEOUT = 10.0  # seconds
+LLM_READ_TIMEOUT = 120.0  # seconds; long completions are slow to finish
+LLM_HTTP2 = os.getenv("DOCSMITH_LLM_HTTP2", "true").lower() == "true"  # needs the h2 package
+LLM_WARM_CONNECTIONS = int(os.getenv("DOCSMITH_LLM_WARM_CONNECTIONS", "0"))  # opened at startup
+
 # Repository settings
 REPO_CLONE_PATH = BASE_DIR / "repositories"
 REPO_CLONE_PATH.mkdir(exist_ok=True)
+CLONE_CACHE_BUDGET_MB = int(os.getenv("DOCSMITH_CLONE_CACHE_MB", "5120"))  # LRU eviction above this
+CLONE_DEPTH = 1  # commits fetched per branch; 0 fetches full history
 
 # Cache settings
 CACHE_DIR = BASE_DIR / "cache"
 CACHE_DIR.mkdir(exist_ok=True)
 CACHE_TTL = 3600  # 1 hour default
+CACHE_ENABLED = os.getenv("DOCSMITH_CACHE_ENABLED", "true").lower() == "true"
 
 # Rate limiting settings
 RATE_LIMIT_REQUESTS = 60  # requests per minute
@@ -51,4 +63,62 @@ RATE_LIMIT_TOKENS = 90000  # tokens per minute
 
 # Error handling settings
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
\ No newline at end of file
+RETRY_DELAY = 5  # seconds
+
+# Budget settings
+DOC_BUDGET_USD = float(os.getenv("DOCSMITH_BUDGET_USD", "0")) or None
+DOC_BUDGET_TOKENS = int(os.getenv("DOCSMITH_BUDGET_TOKENS", "0")) or None
+BUDGET_OUTPUT_RATIO = 0.25  # share of planned tokens reserved for completions
+PROMPT_OVERHEAD_TOKENS = 300  # prompt template tokens added to every file
+MIN_OUTPUT_TOKENS = 256
+SUMMARY_OUTPUT_TOKENS = 200  # completion cap of one architecture file or directory summary
+PLAN_RESERVED_REQUESTS = 6  # repository analysis, system overview, review and revision requests
+PLAN_RESERVED_REQUEST_TOKENS = 3000  # prompt plus completion set aside for each of them
+
+# Model routing settings
+CASCADE_ESCALATION_TOKENS = 2000  # prompts above this go straight to the strongest model
+CASCADE_ESCALATION_COMPLEXITY = 25  # e.g. number of components in a file
+
+# Batching settings
+BATCH_TOKEN_TARGET = 1800  # kept below CASCADE_ESCALATION_TOKENS
+SMALL_FILE_TOKENS = 600  # files above this are analyzed on their own
+
+# Prompt context settings
+REPO_CONTEXT_TOKENS = 2000  # budget for serialized repo_info in a prompt
+
+# Documentation coverage settings
+MIN_DOCSTRING_WORDS = 4  # shorter docstrings are re-described by the LLM
+
+# Sampling settings
+SAMPLING_FILE_THRESHOLD = 2000  # larger repos get sampled architecture analysis
+SAMPLING_COVERAGE_TARGET = 0.1  # fraction of each stratum to analyze
+SAMPLING_MAX_FILES = 400
+SAMPLING_STRATUM_DEPTH = 2  # directory levels that define a stratum
+SAMPLING_SEED = 0
+# Duplicate detection settings
+DUPLICATE_SIMILARITY_THRESHOLD = 0.85  # estimated Jaccard similarity of shingles
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16  # 4 rows per band: candidates from roughly 50% similarity
+SHINGLE_SIZE = 5  # tokens per shingle
+
+# Review settings
+CLAIM_BATCH_SIZE = 15  # claims verified per request
+ENDPOINT_BATCH_SIZE = 10  # endpoints validated per request
+REVIEW_CONTEXT_TOKENS = 500  # repo context per request; claims carry their own evidence
+EVIDENCE_TOP_K = 5  # evidence snippets attached to each ambiguous claim
+EVIDENCE_SUPPORT_COVERAGE = 0.75  # share of claim terms one symbol must match
+EVIDENCE_INDEXES_IN_MEMORY = 4  # repositories whose evidence index stays loaded
+
+# Blocking I/O settings
+IO_POOL_SIZES = {
+    "git": 4,  # git subprocesses; work on one mirror is serialized anyway
+    "github": 8,  # PyGithub requests
+    "disk": 8,  # file reads, hashing, cache access and documentation writes
+}
+IO_SLOW_WAIT_SECONDS = 1.0  # queue waits above this are logged as pool saturation
+
+# GitHub API settings
+GITHUB_PAGE_CONCURRENCY = 4  # pages of one list fetched at once
+GITHUB_RATE_LIMIT_RESERVE = 500  # below this many calls left, requests are spread until the reset
+GITHUB_MAX_RETRIES = 3  # retries after a rate-limited response
+GITHUB_TIMEOUT = 30  # seconds
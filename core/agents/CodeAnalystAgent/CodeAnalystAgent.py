@@ -1,8 +1,22 @@
-from typing import Dict, Any
+from typing import Dict, Any, Awaitable, List, Optional, Tuple
+from pathlib import Path
+import asyncio
 from ...base import BaseAgent
 from ...utils.logging_config import setup_logger
 from ...utils.error_handler import retry_with_exponential_backoff
+from ...llm.context_builder import context_builder
+from ...utils.cache.symbol_cache import symbol_cache
+from ...utils.duplicate_detector import DuplicateDetector
+from ...utils.openapi_spec import find_specs
+from ...utils.concurrency import gather_bounded
+from ...utils.blocking_io import blocking_io
+from ...utils.json_response import parse_json_object
+from ...output.markdown_sections import MarkdownSections
 from .tools.code_analyzer import CodeAnalyzer
+from .tools.file_batcher import FileBatcher
+from .tools.doc_coverage import DocCoveragePolicy
+from .tools.route_extractor import RouteExtractor
+from ....config.settings import MIN_OUTPUT_TOKENS
 
 logger = setup_logger(__name__)
 
@@ -11,11 +25,18 @@ class CodeAnalystAgent(BaseAgent):
         super().__init__("code_analysis")
         self.agency = agency
         self.analyzer = CodeAnalyzer()
+        self.batcher = FileBatcher()
+        self.coverage = DocCoveragePolicy()
+        self.routes = RouteExtractor()
 
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process tasks for code analysis."""
         task_types = {
             "analyze_repository": self._analyze_repo,
+            "analyze_files": self._analyze_files,
+            "detect_framework": self._detect_framework,
+            "extract_endpoints": self._extract_endpoints,
+            "describe_endpoints": self._describe_endpoints,
             "update_documentation": self._update_docs,
             "handle_review": self._handle_review
         }
@@ -44,6 +65,356 @@ class CodeAnalystAgent(BaseAgent):
         # If review wasn't approved, handle the review feedback
         return await self._handle_review(review)
 
+    async def _analyze_files(self, task: Dict) -> Dict:
+        """Analyze source files, reusing existing docs and cached descriptions.
+
+        Paths relative to ``repo_path`` are resolved against it; file purposes
+        are cached per ``repo_url`` and relative path, since every job checks
+        the repository out into a fresh worktree. With a budget
+        ``plan``, files it skipped are left out and each file's responses are
+        capped at its output allowance. ``duplicates`` is the repo scan's map
+        of each copy's path to its {"duplicate_of", "similarity"}.
+        """
+        def resolve(path: str) -> str:
+            return str(Path(task["repo_path"]) / path) if task.get("repo_path") else path
+
+        def relative(path: str) -> str:
+            return str(Path(path).relative_to(task["repo_path"])) if task.get("repo_path") else path
+
+        repo = task.get("repo_url", "")
+
+        plan = task.get("plan") or {}
+        skipped = set(plan.get("skipped", []))
+        paths = [resolve(path) for path in task["files"] if path not in skipped]
+        allowances = {resolve(a["file_path"]): a["output_tokens"] for a in plan.get("files", [])}
+
+        # Copies found during the repo scan reuse their representative's docs
+        duplicates = {
+            resolve(path): {**info, "duplicate_of": resolve(info["duplicate_of"])}
+            for path, info in task.get("duplicates", {}).items()
+            if resolve(info["duplicate_of"]) in paths and info["duplicate_of"] != path
+        }
+        files = await asyncio.gather(*[
+            blocking_io.run("disk", self.analyzer.analyze_file, path) for path in paths
+            if path not in duplicates
+        ])
+
+        # Descriptions are cached per symbol, keyed by a hash of its source
+        descriptions: Dict[str, str] = {}
+        fingerprints: Dict[str, str] = {}
+        file_fingerprints: Dict[str, List[str]] = {}
+        for f in files:
+            _, needs_llm = self.coverage.split_components(f["analysis"].get("components", []))
+            undocumented = {c["name"] for c in needs_llm}
+            file_fingerprints[f["file"]] = []
+
+            for component in f["analysis"].get("components", []):
+                if "start_line" not in component:
+                    continue
+                symbol_id = self._symbol_id(f, component)
+                fingerprints[symbol_id] = symbol_cache.fingerprint(
+                    component.get("signature", component["name"]),
+                    self._symbol_source(f, component),
+                    f["language"]
+                )
+                file_fingerprints[f["file"]].append(fingerprints[symbol_id])
+
+                if component["name"] in undocumented:
+                    cached = await blocking_io.run("disk", symbol_cache.get_description, fingerprints[symbol_id])
+                    if cached is not None:
+                        descriptions[symbol_id] = cached
+
+        cached_ids = set(descriptions)
+
+        # Files without module-level docs need an LLM-written purpose, unless
+        # a previous purpose still fits because no symbol has changed
+        file_level = []
+        for f in files:
+            overview = f["analysis"].get("overview", {})
+            if self.coverage.assess("", overview.get("docstring")) == self.coverage.DOCUMENTED:
+                continue
+
+            previous = await blocking_io.run("disk", symbol_cache.get_file_summary, repo, relative(f["file"]))
+            if previous and self._is_unchanged(previous["symbols"], file_fingerprints[f["file"]]):
+                f["purpose"] = previous["purpose"]
+                continue
+
+            pending = {c["name"] for c in self._undescribed(f, descriptions)}
+            known = [c["name"] for c in f["analysis"].get("components", []) if c["name"] not in pending]
+            if known:
+                f["note"] = "Already documented: " + ", ".join(known)
+            file_level.append(f)
+
+        file_results = await self._run_batched(
+            file_level, "analyze_files", "files", "File", "purpose",
+            {f["file"]: allowances[f["file"]] for f in file_level if f["file"] in allowances}
+        )
+        for f in file_level:
+            result = file_results.get(f["file"])
+            if not result:
+                continue
+            llm_components = {
+                c.get("name"): c.get("description") for c in result.get("components", [])
+                if isinstance(c, dict)
+            }
+            for component in self._undescribed(f, descriptions):
+                # Models often drop the class prefix from method names
+                description = (llm_components.get(component["name"]) or
+                               llm_components.get(component["name"].rsplit(".", 1)[-1]))
+                if description:
+                    descriptions[self._symbol_id(f, component)] = description
+            await blocking_io.run(
+                "disk", symbol_cache.set_file_summary,
+                repo, relative(f["file"]), result["purpose"], file_fingerprints[f["file"]]
+            )
+
+        # Remaining undocumented symbols are described on their own
+        symbols = [
+            self._symbol_item(f, component)
+            for f in files
+            for component in self._undescribed(f, descriptions)
+            if "start_line" in component
+        ]
+
+        # A file's leftover symbols share its allowance
+        symbol_files = {item["file"]: item["file"].split("::", 1)[0] for item in symbols}
+        symbol_counts: Dict[str, int] = {}
+        for path in symbol_files.values():
+            symbol_counts[path] = symbol_counts.get(path, 0) + 1
+        symbol_results = await self._run_batched(
+            symbols, "describe_symbols", "symbols", "Symbol", "description",
+            {
+                symbol_id: allowances[path] // symbol_counts[path]
+                for symbol_id, path in symbol_files.items() if path in allowances
+            }
+        )
+        for symbol_id, result in symbol_results.items():
+            descriptions[symbol_id] = result["description"]
+
+        for symbol_id, description in descriptions.items():
+            if symbol_id in fingerprints and symbol_id not in cached_ids:
+                await blocking_io.run("disk", symbol_cache.set_description, fingerprints[symbol_id], description)
+
+        file_docs = [
+            self._assemble_file_docs(f, file_results.get(f["file"]), descriptions)
+            for f in files
+        ]
+        representatives = {f["file"]: (f, docs) for f, docs in zip(files, file_docs)}
+        for path in paths:
+            if path in duplicates:
+                file_docs.append(await blocking_io.run(
+                    "disk", self._share_duplicate_docs, path, duplicates[path], representatives
+                ))
+
+        return {
+            "files": file_docs,
+            "symbol_cache": dict(symbol_cache.stats)
+        }
+
+    def _share_duplicate_docs(self, path: str, duplicate: Dict, representatives: Dict) -> Dict:
+        """Copy a representative's docs to a duplicate file, noting the differences."""
+        file_info, docs = representatives[duplicate["duplicate_of"]]
+        with open(path, 'r', errors='replace') as f:
+            code = f.read()
+        return {
+            **docs,
+            "file": path,
+            "duplicate_of": duplicate["duplicate_of"],
+            "diff_note": DuplicateDetector.diff_note(
+                duplicate["duplicate_of"], file_info["code"], code, duplicate["similarity"]
+            )
+        }
+
+    async def _detect_framework(self, task: Dict) -> Dict:
+        """Detect the API framework from imports and manifests, or a shipped OpenAPI spec."""
+        repo_info = task["repo_info"]
+        repo_path = repo_info.get("repo_path") or repo_info.get("path")
+        files = [t["file_path"] for t in repo_info.get("tasks", [])] or None
+        frameworks = await blocking_io.run("disk", self.routes.detect_frameworks, repo_path, files)
+        detected = {**frameworks, "repo_path": repo_path, "files": files}
+
+        # A spec the repository maintains is authoritative over its routes
+        specs = await blocking_io.run("disk", find_specs, repo_path)
+        if specs:
+            logger.info(f"Found API spec {specs[0]['path']}; skipping route extraction")
+            detected.update({"framework": "openapi", "version": specs[0]["version"], "specs": specs})
+        return detected
+
+    async def _extract_endpoints(self, task: Dict) -> Dict:
+        """Extract API endpoints statically from route declarations."""
+        framework_info = task["framework_info"]
+        endpoints = await blocking_io.run(
+            "disk",
+            self.routes.extract,
+            framework_info["repo_path"],
+            list(framework_info.get("frameworks") or []) or None,
+            framework_info.get("files")
+        )
+        logger.info(f"Extracted {len(endpoints)} endpoints without the LLM")
+        return {"endpoints": endpoints, "framework": framework_info.get("framework")}
+
+    async def _describe_endpoints(self, task: Dict) -> Dict:
+        """Write prose only for endpoints and parameters that have no description."""
+        endpoints = [dict(endpoint) for endpoint in task["endpoints"]]
+        items = {}
+        for position, endpoint in enumerate(endpoints, 1):
+            undescribed = [p["name"] for p in endpoint.get("parameters", []) if not p.get("description")]
+            if endpoint.get("description") and not undescribed:
+                continue
+            note = f"{endpoint['method']} {endpoint['path']} (handler {endpoint.get('handler')})"
+            if undescribed:
+                note += "; describe parameters: " + ", ".join(undescribed)
+            items[f"E{position}"] = {
+                "file": f"E{position}",
+                "language": "javascript" if endpoint.get("framework") == "express" else "python",
+                "code": endpoint.get("source") or "",
+                "note": note
+            }
+
+        results = await self._run_batched(
+            list(items.values()), "describe_endpoints", "endpoints", "Endpoint", "description"
+        )
+        for position, endpoint in enumerate(endpoints, 1):
+            result = results.get(f"E{position}")
+            if result:
+                endpoint["description"] = endpoint.get("description") or result["description"]
+                written = result.get("parameters") if isinstance(result.get("parameters"), dict) else {}
+                endpoint["parameters"] = [
+                    {**p, "description": p.get("description") or str(written.get(p["name"], ""))}
+                    for p in endpoint.get("parameters", [])
+                ]
+            endpoint.pop("source", None)
+
+        return {"endpoints": endpoints}
+
+    def _undescribed(self, file_info: Dict, descriptions: Dict[str, str]) -> List[Dict]:
+        """Get the symbols that have neither usable docs nor a description yet."""
+        _, needs_llm = self.coverage.split_components(file_info["analysis"].get("components", []))
+        return [c for c in needs_llm if self._symbol_id(file_info, c) not in descriptions]
+
+    def _is_unchanged(self, previous: List[str], current: List[str]) -> bool:
+        """Check whether a file has exactly the symbols its cached purpose covered."""
+        return bool(current) and sorted(previous) == sorted(current)
+
+    async def _run_batched(
+        self,
+        items: List[Dict],
+        prompt_name: str,
+        prompt_param: str,
+        header: str,
+        required_key: str,
+        allowances: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Dict]:
+        """Pack items into batched requests, retrying dropped items individually.
+
+        ``allowances`` maps item ids to output token allowances; a batch whose
+        items all have one is capped at their sum. A batch's complexity, which
+        can route it straight to the stronger model, is the most components
+        any of its files has.
+        """
+        results = {}
+        retries = []
+
+        def max_output_tokens(batch: List[Dict]) -> Optional[int]:
+            if not allowances or any(item["file"] not in allowances for item in batch):
+                return None
+            return max(MIN_OUTPUT_TOKENS, sum(allowances[item["file"]] for item in batch))
+
+        def complexity(batch: List[Dict]) -> Optional[int]:
+            return max((len(item.get("analysis", {}).get("components", [])) for item in batch), default=0) or None
+
+        def run(batches: List[List[Dict]]) -> Awaitable[List[Tuple[Dict[str, Dict], List[Dict]]]]:
+            return gather_bounded([
+                lambda batch=batch: self._analyze_batch(
+                    batch, prompt_name, prompt_param, header, required_key,
+                    max_output_tokens(batch), complexity(batch)
+                )
+                for batch in batches
+            ])
+
+        batches = self.batcher.pack(items)
+        for batch, (batch_results, missing) in zip(batches, await run(batches)):
+            results.update(batch_results)
+            # A batch of one has already been tried on its own
+            if len(batch) > 1:
+                retries.extend(missing)
+
+        # Retry items the batched responses dropped or mangled
+        for batch_results, _ in await run([[item] for item in retries]):
+            results.update(batch_results)
+
+        return results
+
+    async def _analyze_batch(
+        self,
+        batch: List[Dict],
+        prompt_name: str,
+        prompt_param: str,
+        header: str,
+        required_key: str,
+        max_output_tokens: Optional[int] = None,
+        complexity: Optional[int] = None
+    ) -> Tuple[Dict[str, Dict], List[Dict]]:
+        """Run one batched request and split it into per-item results."""
+        content = await self.get_completion(
+            "code_analysis",
+            prompt_name,
+            complexity=complexity,
+            max_output_tokens=max_output_tokens,
+            validator=lambda response: parse_json_object(
+                response.choices[0].message.content or ""
+            ) is not None,
+            **{prompt_param: self.batcher.render(batch, header)}
+        )
+        return self.batcher.split_response(content, batch, required_key)
+
+    def _symbol_id(self, file_info: Dict, component: Dict) -> str:
+        return f"{file_info['file']}::{component['name']}"
+
+    def _symbol_source(self, file_info: Dict, component: Dict) -> str:
+        lines = file_info["code"].splitlines()
+        return "\n".join(lines[component["start_line"] - 1:component["end_line"]])
+
+    def _symbol_item(self, file_info: Dict, component: Dict) -> Dict:
+        """Build a batch item holding just one symbol's source."""
+        return {
+            "file": self._symbol_id(file_info, component),
+            "language": file_info["language"],
+            "code": self._symbol_source(file_info, component)
+        }
+
+    def _assemble_file_docs(
+        self,
+        file_info: Dict,
+        llm_result: Dict,
+        descriptions: Dict[str, str]
+    ) -> Dict:
+        """Merge existing docs with generated descriptions for one file."""
+        analysis = file_info["analysis"]
+        documented, needs_llm = self.coverage.split_components(analysis.get("components", []))
+
+        components = [self.coverage.render(c) for c in documented]
+        for component in needs_llm:
+            description = descriptions.get(self._symbol_id(file_info, component))
+            components.append({
+                **component,
+                "description": description or component["description"],
+                "description_source": "llm" if description else "static"
+            })
+
+        purpose = ((llm_result or {}).get("purpose") or file_info.get("purpose") or
+                   analysis.get("overview", {}).get("purpose"))
+
+        return {
+            "file": file_info["file"],
+            "language": file_info["language"],
+            "analysis": analysis,
+            "purpose": purpose,
+            "components": components,
+            "patterns": (llm_result or {}).get("patterns", analysis.get("patterns", [])),
+            "coverage": self.coverage.coverage(analysis.get("components", []))
+        }
+
     def _generate_initial_docs(self, repo_info: Dict) -> Dict:
         """Generate initial documentation."""
         docs = {
@@ -57,7 +428,7 @@ class CodeAnalystAgent(BaseAgent):
         readme_content = await self.get_completion(
             "code_analysis",
             "generate_readme",
-            repo_info=repo_info
+            repo_info=context_builder.build_repo_context(repo_info)
         )
         return readme_content
 
@@ -66,7 +437,7 @@ class CodeAnalystAgent(BaseAgent):
         overview_content = await self.get_completion(
             "code_analysis",
             "generate_overview",
-            repo_info=repo_info
+            repo_info=context_builder.build_repo_context(repo_info)
         )
         return overview_content
 
@@ -76,31 +447,73 @@ class CodeAnalystAgent(BaseAgent):
         changes = await self._process_feedback(task["review_feedback"])
         return await self._apply_changes(docs, changes)
 
-    async def _process_feedback(self, feedback: Dict) -> Dict:
-        """Process review feedback using LLM."""
-        processed_feedback = await self.get_completion(
+    async def _process_feedback(self, feedback: Dict) -> Dict[str, List[str]]:
+        """Turn review feedback into edit instructions per documentation file."""
+        content = await self.get_completion(
             "code_analysis",
             "process_feedback",
+            validator=lambda response: parse_json_object(
+                response.choices[0].message.content or ""
+            ) is not None,
             feedback=feedback
         )
-        return processed_feedback
+        changes = parse_json_object(content or "") or {}
+        return {
+            file_path: change_list if isinstance(change_list, list) else [change_list]
+            for file_path, change_list in changes.items()
+        }
 
     async def _apply_changes(self, docs: Dict, changes: Dict) -> Dict:
-        """Apply changes to documentation."""
+        """Apply changes to documentation, revising different files concurrently."""
+        targets = [file_path for file_path in changes if file_path in docs]
+        revised = await gather_bounded([
+            lambda file_path=file_path: self._revise_sections(file_path, docs[file_path], changes[file_path])
+            for file_path in targets
+        ])
+
         updated_docs = docs.copy()
-        
-        for file_path, change_list in changes.items():
-            if file_path in updated_docs:
-                updated_content = await self.get_completion(
-                    "code_analysis",
-                    "apply_changes",
-                    original_content=docs[file_path],
-                    changes=change_list
-                )
-                updated_docs[file_path] = updated_content
-                
+        updated_docs.update(zip(targets, revised))
         return updated_docs
 
+    async def _revise_sections(self, file_path: str, content: str, change_list: List) -> str:
+        """Revise one document by requesting and applying section patches.
+
+        Only the outline and the sections the changes point at are sent, so a
+        revision costs tokens in proportion to the change, not the document.
+        """
+        document = MarkdownSections(content)
+        shown = []
+        for change in change_list:
+            for section_id in document.find(str(change)):
+                if section_id not in shown:
+                    shown.append(section_id)
+
+        response = await self.get_completion(
+            "code_analysis",
+            "patch_sections",
+            # Review-driven edits go straight to the stronger model
+            escalate=True,
+            validator=lambda r: isinstance(
+                (parse_json_object(r.choices[0].message.content or "") or {}).get("patches"), list
+            ),
+            file_path=file_path,
+            outline=document.outline(),
+            sections="\n\n".join(
+                f'<section id="{section_id}">\n{document.get(section_id)["text"].strip()}\n</section>'
+                for section_id in shown
+            ) or "(none)",
+            changes="\n".join(f"- {change}" for change in change_list)
+        )
+
+        patches = (parse_json_object(response or "") or {}).get("patches")
+        if not isinstance(patches, list):
+            logger.warning(f"No usable section patches for {file_path}; leaving it unchanged")
+            return content
+
+        rejected = document.apply(patches, editable=set(shown))
+        logger.info(f"Applied {len(patches) - len(rejected)} of {len(patches)} section patches to {file_path}")
+        return document.render()
+
     async def _handle_review(self, review: Dict) -> Dict:
         """Handle review feedback and update documentation."""
         if not review["issues"]:
@@ -27,6 +27,173 @@ class CodeAnalyzer:
             "analysis": analysis
         }
 
+    LANGUAGE_EXTENSIONS = {
+        '.py': 'python',
+        '.js': 'javascript',
+        '.mjs': 'javascript',
+        '.cjs': 'javascript',
+        '.ts': 'typescript',
+        '.jsx': 'react',
+        '.tsx': 'react'
+    }
+
+    def _detect_language(self, file_path: str) -> str:
+        """Detect the language of a file from its extension."""
+        _, ext = os.path.splitext(file_path)
+        return self.LANGUAGE_EXTENSIONS.get(ext.lower(), ext.lstrip('.').lower() or 'unknown')
+
+    def _get_analyzer(self, language: str):
+        """Get the language-specific analyzer, if there is one."""
+        return {
+            'python': self._analyze_python,
+            'javascript': self._analyze_javascript,
+            'typescript': self._analyze_typescript,
+            'react': self._analyze_react
+        }.get(language)
+
+    def _analyze_python(self, code: str) -> Dict[str, Any]:
+        """Analyze Python source code."""
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            return self._generic_analysis(code)
+
+        imports = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                imports.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                imports.append('.' * node.level + (node.module or ''))
+
+        components = self._python_symbols(tree.body, code.splitlines())
+        module_doc = ast.get_docstring(tree)
+
+        return {
+            "overview": {
+                "purpose": (self._first_paragraph(module_doc) if module_doc
+                            else self._extract_file_description(code)),
+                "docstring": module_doc,
+                "key_features": [c["name"] for c in components if "." not in c["name"]]
+            },
+            "components": components,
+            "patterns": self._detect_patterns(code),
+            "dependencies": [{"name": imp, "type": "import"} for imp in sorted(set(imports))]
+        }
+
+    def _python_symbols(
+        self,
+        body: List[ast.stmt],
+        lines: List[str],
+        prefix: str = ""
+    ) -> List[Dict[str, Any]]:
+        """Extract classes, functions and methods with their spans and docstrings."""
+        symbols = []
+        for node in body:
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                continue
+
+            is_class = isinstance(node, ast.ClassDef)
+            start = min([d.lineno for d in node.decorator_list] + [node.lineno])
+            docstring = ast.get_docstring(node)
+            symbol_type = "class" if is_class else ("method" if prefix else "function")
+
+            symbols.append({
+                "name": f"{prefix}{node.name}",
+                "type": symbol_type,
+                "signature": lines[node.lineno - 1].strip() if node.lineno <= len(lines) else node.name,
+                "start_line": start,
+                "end_line": node.end_lineno,
+                "docstring": docstring,
+                "description": (self._first_paragraph(docstring) if docstring
+                                else f"{symbol_type.capitalize()} definition")
+            })
+
+            if is_class:
+                symbols.extend(self._python_symbols(node.body, lines, f"{prefix}{node.name}."))
+
+        return symbols
+
+    def _analyze_javascript(self, code: str) -> Dict[str, Any]:
+        """Analyze JavaScript source code."""
+        symbol_pattern = re.compile(
+            r'^[ \t]*(?:export\s+(?:default\s+)?)?(?:'
+            r'(?:async\s+)?function\s*\*?\s*(?P<function>\w+)\s*\(|'
+            r'class\s+(?P<class>\w+)|'
+            r'(?:const|let|var)\s+(?P<arrow>\w+)\s*=\s*(?:async\s+)?(?:function\b|\([^)]*\)\s*=>|\w+\s*=>))',
+            re.MULTILINE
+        )
+        import_pattern = r'(?:import\s+(?:[^\'"]+\s+from\s+)?|require\s*\(\s*)[\'"]([^\'"]+)[\'"]'
+
+        components = []
+        for match in symbol_pattern.finditer(code):
+            name = match.group('function') or match.group('class') or match.group('arrow')
+            symbol_type = "class" if match.group('class') else "function"
+            start_line = code.count('\n', 0, match.start()) + 1
+            docstring = self._preceding_jsdoc(code, match.start())
+
+            components.append({
+                "name": name,
+                "type": symbol_type,
+                "signature": code[match.start():].split('\n', 1)[0].strip().rstrip('{').strip(),
+                "start_line": start_line,
+                "end_line": self._block_end_line(code, match.end(), start_line),
+                "docstring": docstring,
+                "description": (self._first_paragraph(docstring) if docstring
+                                else f"{symbol_type.capitalize()} definition")
+            })
+
+        return {
+            "overview": {
+                "purpose": self._extract_file_description(code),
+                "key_features": [c["name"] for c in components]
+            },
+            "components": components,
+            "patterns": self._detect_patterns(code),
+            "dependencies": [{"name": imp, "type": "import"}
+                             for imp in sorted(set(re.findall(import_pattern, code)))]
+        }
+
+    def _preceding_jsdoc(self, code: str, position: int) -> Optional[str]:
+        """Get the JSDoc/TSDoc block directly above a declaration."""
+        before = code[:position].rstrip()
+        if not before.endswith('*/'):
+            return None
+
+        start = before.rfind('/**')
+        if start == -1 or '*/' in before[start:-2]:
+            return None
+
+        lines = []
+        for line in before[start + 3:-2].split('\n'):
+            line = re.sub(r'^\s*\*?\s?', '', line).rstrip()
+            lines.append(line)
+        text = '\n'.join(lines).strip()
+        return text or None
+
+    def _block_end_line(self, code: str, position: int, start_line: int) -> int:
+        """Find the line closing the brace block that starts after position."""
+        open_brace = code.find('{', position)
+        # Single-expression arrow functions and the like have no block
+        if open_brace == -1 or ';' in code[position:open_brace]:
+            return start_line
+
+        depth = 0
+        for i in range(open_brace, len(code)):
+            if code[i] == '{':
+                depth += 1
+            elif code[i] == '}':
+                depth -= 1
+                if depth == 0:
+                    return code.count('\n', 0, i) + 1
+        return code.count('\n') + 1
+
+    def _first_paragraph(self, docstring: str) -> str:
+        """Get the first paragraph of a docstring as a single line."""
+        paragraph = docstring.strip().split('\n\n', 1)[0]
+        # JSDoc block tags (@param, @returns, ...) end the summary
+        paragraph = re.split(r'^\s*@', paragraph, maxsplit=1, flags=re.MULTILINE)[0]
+        return ' '.join(paragraph.split())
+
     def _analyze_typescript(self, code: str) -> Dict[str, Any]:
         """Analyze TypeScript source code."""
         # Extract interfaces
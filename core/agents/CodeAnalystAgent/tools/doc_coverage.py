@@ -0,0 +1,73 @@
+import re
+from typing import Dict, List, Any, Optional, Tuple
+from .....config.settings import MIN_DOCSTRING_WORDS
+
+class DocCoveragePolicy:
+    """Tool for deciding which symbols need LLM-written descriptions.
+
+    Symbols with a substantive docstring or JSDoc block are rendered from it
+    directly; missing or poor docs (too short, placeholders, or just the
+    symbol name restated) are left for the LLM.
+    """
+
+    DOCUMENTED = "documented"
+    POOR = "poor"
+    MISSING = "missing"
+
+    PLACEHOLDER_PATTERN = re.compile(r'^\s*(?:todo|fixme|xxx|tbd|docstring|description)\b', re.IGNORECASE)
+    FILLER_WORDS = {'a', 'an', 'the', 'this', 'of', 'for', 'to', 'and', 'function',
+                    'method', 'class', 'helper', 'get', 'set', 'returns', 'return'}
+
+    def __init__(self, min_words: int = MIN_DOCSTRING_WORDS):
+        self.min_words = min_words
+
+    def assess(self, name: str, docstring: Optional[str]) -> str:
+        """Classify the existing documentation for a symbol."""
+        if not docstring or not docstring.strip():
+            return self.MISSING
+
+        summary = docstring.strip().split('\n\n', 1)[0]
+        words = re.findall(r'[A-Za-z]+', summary)
+        if len(words) < self.min_words or self.PLACEHOLDER_PATTERN.match(summary):
+            return self.POOR
+
+        # "get_user: Get user." says nothing the name doesn't
+        name_words = {w.lower() for w in self._split_identifier(name.rsplit('.', 1)[-1])}
+        informative = {w.lower() for w in words} - name_words - self.FILLER_WORDS
+        if not informative:
+            return self.POOR
+
+        return self.DOCUMENTED
+
+    def split_components(
+        self,
+        components: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split components into (documented, needs_llm)."""
+        documented, needs_llm = [], []
+        for component in components:
+            if self.assess(component["name"], component.get("docstring")) == self.DOCUMENTED:
+                documented.append(component)
+            else:
+                needs_llm.append(component)
+        return documented, needs_llm
+
+    def render(self, component: Dict[str, Any]) -> Dict[str, Any]:
+        """Render a documented component without calling the LLM."""
+        return {**component, "description_source": "docstring"}
+
+    def coverage(self, components: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Summarize documentation coverage for a list of components."""
+        counts = {self.DOCUMENTED: 0, self.POOR: 0, self.MISSING: 0}
+        for component in components:
+            counts[self.assess(component["name"], component.get("docstring"))] += 1
+        total = len(components)
+        return {
+            **counts,
+            "total": total,
+            "ratio": counts[self.DOCUMENTED] / total if total else 1.0
+        }
+
+    def _split_identifier(self, name: str) -> List[str]:
+        """Split snake_case and camelCase identifiers into words."""
+        return re.findall(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+', name)
@@ -0,0 +1,99 @@
+from typing import Dict, List, Any, Tuple
+from ....llm.token_counter import count_tokens
+from ....utils.json_response import parse_json_object
+from .....config.settings import BATCH_TOKEN_TARGET, SMALL_FILE_TOKENS
+
+class FileBatcher:
+    """Tool for packing small files into shared analysis requests."""
+
+    # Tokens added per file for the "### File:" header and code fence
+    FILE_OVERHEAD_TOKENS = 20
+
+    def __init__(
+        self,
+        token_target: int = BATCH_TOKEN_TARGET,
+        small_file_tokens: int = SMALL_FILE_TOKENS,
+        model: str = "gpt-3.5-turbo"
+    ):
+        self.token_target = token_target
+        self.small_file_tokens = small_file_tokens
+        self.model = model
+
+    def pack(self, files: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Bin-pack analyzed files into batches up to the token target.
+
+        Args:
+            files: CodeAnalyzer.analyze_file results
+
+        Returns:
+            List of batches; large files end up in a batch of their own
+        """
+        sized = [
+            (count_tokens(f["code"], self.model) + self.FILE_OVERHEAD_TOKENS, f)
+            for f in files
+        ]
+
+        batches: List[List[Dict[str, Any]]] = []
+        remaining: List[int] = []
+
+        # First-fit decreasing keeps the number of requests close to optimal
+        for tokens, file_info in sorted(sized, key=lambda x: x[0], reverse=True):
+            if tokens > self.small_file_tokens:
+                batches.append([file_info])
+                remaining.append(0)
+                continue
+
+            for i, space in enumerate(remaining):
+                if tokens <= space:
+                    batches[i].append(file_info)
+                    remaining[i] -= tokens
+                    break
+            else:
+                batches.append([file_info])
+                remaining.append(self.token_target - tokens)
+
+        return batches
+
+    def render(self, batch: List[Dict[str, Any]], header: str = "File") -> str:
+        """Render a batch of files (or symbols) for a batched prompt."""
+        sections = []
+        for f in batch:
+            lines = [f"### {header}: {f['file']}"]
+            if f.get("note"):
+                lines.append(f["note"])
+            lines.append(f"```{f.get('language') or ''}\n{f['code']}\n```")
+            sections.append("\n".join(lines))
+        return "\n\n".join(sections)
+
+    def split_response(
+        self,
+        content: str,
+        batch: List[Dict[str, Any]],
+        required_key: str = "purpose"
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split a batch response into per-file results.
+
+        Returns:
+            Tuple of (results keyed by file path, files with missing or invalid results)
+        """
+        data = parse_json_object(content) or {}
+        results = {}
+        missing = []
+
+        for file_info in batch:
+            result = data.get(file_info["file"])
+            if self._is_valid_result(result, required_key):
+                results[file_info["file"]] = result
+            else:
+                missing.append(file_info)
+
+        return results, missing
+
+    def _is_valid_result(self, result: Any, required_key: str) -> bool:
+        """Check a single result against the expected shape."""
+        return (isinstance(result, dict) and
+                isinstance(result.get(required_key), str) and
+                bool(result[required_key].strip()) and
+                isinstance(result.get("components", []), list))
@@ -0,0 +1,518 @@
+import ast
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+class RouteExtractor:
+    """Tool for extracting API endpoints from source code without an LLM.
+
+    Python frameworks are read from the AST: Flask and FastAPI route
+    decorators (including blueprint and router prefixes) and Django
+    urlpatterns, following include() into nested url modules. Express routes
+    are matched lexically on router calls, with prefixes from app.use().
+    """
+
+    HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'head', 'options')
+    IGNORED_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build'}
+    SOURCE_LINES = 40  # handler lines kept for the prose-writing step
+
+    FRAMEWORK_MARKERS = {
+        'flask': re.compile(r'^\s*(?:from|import)\s+flask\b', re.MULTILINE),
+        'fastapi': re.compile(r'^\s*(?:from|import)\s+fastapi\b', re.MULTILINE),
+        'django': re.compile(r'^\s*(?:from|import)\s+django\b', re.MULTILINE),
+        'express': re.compile(r'''require\(\s*['"]express['"]\s*\)|from\s+['"]express['"]'''),
+    }
+    PACKAGE_NAMES = {'flask': 'flask', 'fastapi': 'fastapi', 'django': 'django', 'express': 'express'}
+
+    # Path converters: Flask <int:id>, Django <int:id>, FastAPI {id}, Express :id
+    ANGLE_PARAMETER = re.compile(r'<(?:(\w+):)?(\w+)>')
+    BRACE_PARAMETER = re.compile(r'\{(\w+)(?::[^}]*)?\}')
+    COLON_PARAMETER = re.compile(r':(\w+)')
+    CONVERTER_TYPES = {'int': 'integer', 'float': 'number', 'path': 'string', 'uuid': 'string',
+                       'string': 'string', 'slug': 'string', 'str': 'string'}
+    ANNOTATION_TYPES = {'int': 'integer', 'float': 'number', 'str': 'string', 'bool': 'boolean'}
+
+    EXPRESS_ROUTE = re.compile(
+        r'\b(\w+)\s*\.\s*(get|post|put|patch|delete|head|options|all)\s*\(\s*([\'"`])([^\'"`]+)\3'
+    )
+    EXPRESS_MODULE = r'''(?:express|require\(\s*['"]express['"]\s*\))'''
+    EXPRESS_ROUTER = re.compile(
+        r'\b(?:const|let|var)\s+(\w+)\s*=\s*(?:' + EXPRESS_MODULE + r'\s*\.\s*)?Router\s*\('
+    )
+    EXPRESS_APP = re.compile(r'\b(?:const|let|var)\s+(\w+)\s*=\s*' + EXPRESS_MODULE + r'\s*\(\s*\)')
+    EXPRESS_REQUIRE = re.compile(r'''\b(?:const|let|var)\s+(\w+)\s*=\s*require\(\s*['"](\.[^'"]+)['"]\s*\)''')
+    EXPRESS_IMPORT = re.compile(r'''\bimport\s+(\w+)\s+from\s+['"](\.[^'"]+)['"]''')
+    EXPRESS_MOUNT = re.compile(
+        r'''\b\w+\s*\.\s*use\(\s*['"`]([^'"`]+)['"`]\s*,\s*(?:(\w+)|require\(\s*['"](\.[^'"]+)['"]\s*\))'''
+    )
+    JSDOC = re.compile(r'/\*\*(.*?)\*/\s*$', re.DOTALL)
+
+    def detect_frameworks(self, repo_path: str, files: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Detect web frameworks from imports.
+
+        Returns:
+            Dict with the primary "framework", its "version" (if pinned in a
+            manifest) and per-framework file counts under "frameworks"
+        """
+        root = Path(repo_path)
+        counts: Dict[str, int] = {}
+        for path in self._source_files(root, files):
+            text = self._read(root / path)
+            for framework, marker in self.FRAMEWORK_MARKERS.items():
+                if marker.search(text):
+                    counts[framework] = counts.get(framework, 0) + 1
+
+        framework = max(sorted(counts), key=counts.get) if counts else None
+        return {
+            "framework": framework,
+            "version": self._manifest_version(root, framework) if framework else None,
+            "frameworks": counts
+        }
+
+    def extract(
+        self,
+        repo_path: str,
+        frameworks: Optional[List[str]] = None,
+        files: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract endpoints for the given frameworks (all supported by default).
+
+        Returns:
+            Endpoints with method, path, description, parameters, handler,
+            file, line and the handler's source, sorted by path and method
+        """
+        root = Path(repo_path)
+        frameworks = set(frameworks or self.FRAMEWORK_MARKERS)
+        sources = self._source_files(root, files)
+        endpoints: List[Dict[str, Any]] = []
+
+        python_files = [p for p in sources if p.endswith('.py')]
+        if frameworks & {'flask', 'fastapi'}:
+            for path in python_files:
+                endpoints.extend(self._extract_decorated(root, path, frameworks))
+        if 'django' in frameworks:
+            endpoints.extend(self._extract_django(root, python_files))
+        if 'express' in frameworks:
+            script_files = [p for p in sources if not p.endswith('.py')]
+            endpoints.extend(self._extract_express(root, script_files))
+
+        return sorted(endpoints, key=lambda e: (e["path"], e["method"], e["file"]))
+
+    # Flask / FastAPI
+
+    def _extract_decorated(self, root: Path, path: str, frameworks: set) -> List[Dict[str, Any]]:
+        """Extract routes declared with @app.route / @router.get style decorators."""
+        code = self._read(root / path)
+        # Flask 2 shares FastAPI's @app.get shortcuts, so go by the imports
+        framework = 'fastapi' if self.FRAMEWORK_MARKERS['fastapi'].search(code) else 'flask'
+        tree = self._parse(code) if framework in frameworks else None
+        if tree is None:
+            return []
+
+        prefixes = self._router_prefixes(tree)
+        lines = code.splitlines()
+        endpoints = []
+        for node in ast.walk(tree):
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            for decorator in node.decorator_list:
+                route = self._decorator_route(decorator)
+                if route is None:
+                    continue
+                owner, route_path, methods = route
+                full_path = self._join_paths(prefixes.get(owner, ''), route_path)
+                for method in methods:
+                    endpoints.append(self._endpoint(
+                        framework, method, full_path, node.name, path, node.lineno,
+                        ast.get_docstring(node) or '',
+                        self._python_parameters(node, full_path, framework),
+                        "\n".join(lines[node.lineno - 1:node.lineno - 1 + self.SOURCE_LINES])
+                    ))
+        return endpoints
+
+    def _decorator_route(self, decorator: ast.AST) -> Optional[Tuple[str, str, List[str]]]:
+        """Read (owner, path, methods) from a route decorator."""
+        if not (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute)):
+            return None
+        attribute = decorator.func.attr
+        owner = decorator.func.value.id if isinstance(decorator.func.value, ast.Name) else ''
+        route_path = self._string_arg(decorator, 0, 'path') or self._string_arg(decorator, 0, 'rule')
+        # Routers may mount a handler on their bare prefix with ""
+        if route_path is None or (route_path and not route_path.startswith('/')):
+            return None
+
+        if attribute == 'route':
+            methods = self._keyword(decorator, 'methods')
+            if isinstance(methods, (ast.List, ast.Tuple, ast.Set)):
+                names = [e.value.upper() for e in methods.elts
+                         if isinstance(e, ast.Constant) and isinstance(e.value, str)]
+            else:
+                names = ['GET']
+            return owner, route_path, names or ['GET']
+        if attribute in self.HTTP_METHODS:
+            return owner, route_path, [attribute.upper()]
+        if attribute == 'api_route':
+            methods = self._keyword(decorator, 'methods')
+            names = [e.value.upper() for e in getattr(methods, 'elts', [])
+                     if isinstance(e, ast.Constant) and isinstance(e.value, str)]
+            return owner, route_path, names or ['GET']
+        return None
+
+    def _router_prefixes(self, tree: ast.AST) -> Dict[str, str]:
+        """Map Blueprint / APIRouter variables to their URL prefixes."""
+        prefixes = {}
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)):
+                continue
+            func = node.value.func
+            name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', '')
+            if name not in ('Blueprint', 'APIRouter'):
+                continue
+            keyword = 'url_prefix' if name == 'Blueprint' else 'prefix'
+            prefix = self._keyword(node.value, keyword)
+            if isinstance(prefix, ast.Constant) and isinstance(prefix.value, str):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        prefixes[target.id] = prefix.value
+        return prefixes
+
+    def _python_parameters(self, node: ast.AST, route_path: str, framework: str) -> List[Dict[str, Any]]:
+        """Path parameters from the route, plus FastAPI query parameters from the signature."""
+        parameters = self._path_parameters(route_path)
+        documented = {p["name"] for p in parameters}
+        annotations = {}
+        if framework != 'fastapi':
+            return parameters
+
+        args = node.args.args + node.args.kwonlyargs
+        defaults = dict(zip(
+            [a.arg for a in node.args.args][len(node.args.args) - len(node.args.defaults):],
+            node.args.defaults
+        ))
+        defaults.update({
+            a.arg: d for a, d in zip(node.args.kwonlyargs, node.args.kw_defaults) if d is not None
+        })
+
+        for arg in args:
+            annotation = self._annotation_type(arg.annotation)
+            annotations[arg.arg] = annotation
+            if arg.arg in documented or arg.arg in ('self', 'cls', 'request', 'response'):
+                continue
+            default = defaults.get(arg.arg)
+            # Depends()/Body() defaults and model-typed args aren't query parameters
+            if isinstance(default, ast.Call) or annotation is None:
+                continue
+            parameters.append({
+                "name": arg.arg,
+                "in": "query",
+                "type": annotation,
+                "required": default is None,
+                "description": ""
+            })
+
+        for parameter in parameters:
+            if parameter["in"] == "path" and annotations.get(parameter["name"]):
+                parameter["type"] = annotations[parameter["name"]]
+        return parameters
+
+    def _annotation_type(self, annotation: Optional[ast.AST]) -> Optional[str]:
+        """Map simple annotations (int, Optional[str], ...) to a parameter type."""
+        if isinstance(annotation, ast.Name):
+            return self.ANNOTATION_TYPES.get(annotation.id)
+        if isinstance(annotation, ast.Subscript) and getattr(annotation.value, 'id', '') == 'Optional':
+            return self._annotation_type(annotation.slice)
+        return None
+
+    # Django
+
+    def _extract_django(self, root: Path, python_files: List[str]) -> List[Dict[str, Any]]:
+        """Extract urlpatterns, starting from url modules nothing else includes."""
+        modules = {p: self._parse(self._read(root / p)) for p in python_files if p.endswith('urls.py')}
+        modules = {p: tree for p, tree in modules.items() if tree is not None}
+        included = {
+            target
+            for path, tree in modules.items()
+            for _, _, target in self._urlpatterns(tree, path, modules)
+            if target
+        }
+
+        endpoints = []
+        for path in sorted(set(modules) - included):
+            endpoints.extend(self._django_routes(root, path, modules, '', {path}))
+        return endpoints
+
+    def _django_routes(
+        self,
+        root: Path,
+        path: str,
+        modules: Dict[str, ast.AST],
+        prefix: str,
+        visited: set
+    ) -> List[Dict[str, Any]]:
+        endpoints = []
+        for route, view, target in self._urlpatterns(modules[path], path, modules):
+            full_path = self._join_paths(prefix, route)
+            if target:
+                if target not in visited:
+                    endpoints.extend(self._django_routes(root, target, modules, full_path, visited | {target}))
+                continue
+            # admin.site.urls and similar are url modules, not views
+            if isinstance(view, ast.Attribute) and view.attr == 'urls':
+                continue
+            handler, views_path, docstring, line, source = self._resolve_view(root, path, view)
+            endpoints.append(self._endpoint(
+                'django', 'ANY', full_path, handler, views_path, line, docstring,
+                self._path_parameters(full_path), source
+            ))
+        return endpoints
+
+    def _urlpatterns(
+        self,
+        tree: ast.AST,
+        path: str,
+        modules: Dict[str, ast.AST]
+    ) -> List[Tuple[str, Optional[ast.AST], Optional[str]]]:
+        """Read (route, view, included module path) entries from urlpatterns."""
+        entries = []
+        for node in ast.walk(tree):
+            if not isinstance(node, (ast.Assign, ast.AugAssign)):
+                continue
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if not any(isinstance(t, ast.Name) and t.id == 'urlpatterns' for t in targets):
+                continue
+            for call in getattr(node.value, 'elts', []):
+                if not isinstance(call, ast.Call) or len(call.args) < 2:
+                    continue
+                route = self._string_arg(call, 0, 'route')
+                if route is None:
+                    continue
+                if getattr(call.func, 'id', getattr(call.func, 'attr', '')) in ('re_path', 'url'):
+                    route = self._regex_to_path(route)
+                view = call.args[1]
+                target = None
+                if isinstance(view, ast.Call) and getattr(view.func, 'id', '') == 'include':
+                    module = self._string_arg(view, 0, 'arg')
+                    target = self._module_path(module, path, modules) if module else None
+                    if target is None:
+                        continue
+                entries.append((route, view, target))
+        return entries
+
+    def _resolve_view(self, root: Path, urls_path: str, view: ast.AST) -> Tuple[str, str, str, int, str]:
+        """Find a view's name, file, docstring, line and source in the sibling views module."""
+        if isinstance(view, ast.Call) and isinstance(view.func, ast.Attribute) and view.func.attr == 'as_view':
+            view = view.func.value
+        name = view.attr if isinstance(view, ast.Attribute) else getattr(view, 'id', 'view')
+        module = view.value.id if isinstance(view, ast.Attribute) and isinstance(view.value, ast.Name) else 'views'
+
+        views_path = str(Path(urls_path).parent / f"{module}.py")
+        code = self._read(root / views_path) if (root / views_path).is_file() else ''
+        tree = self._parse(code) if code else None
+        for node in (ast.walk(tree) if tree else []):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.name == name:
+                lines = code.splitlines()
+                return (name, views_path, ast.get_docstring(node) or '', node.lineno,
+                        "\n".join(lines[node.lineno - 1:node.lineno - 1 + self.SOURCE_LINES]))
+        return name, urls_path, '', 1, ''
+
+    def _module_path(self, module: str, urls_path: str, modules: Dict[str, ast.AST]) -> Optional[str]:
+        """Resolve an include('app.urls') module name to a known urls file."""
+        relative = module.replace('.', '/') + '.py'
+        for candidate in modules:
+            if candidate == relative or candidate.endswith('/' + relative):
+                return candidate
+        return None
+
+    def _regex_to_path(self, pattern: str) -> str:
+        """Turn a re_path() regex into a readable path, keeping named groups."""
+        path = re.sub(r'\(\?P<(\w+)>[^)]*\)', r'<\1>', pattern)
+        return path.lstrip('^').rstrip('$')
+
+    # Express
+
+    def _extract_express(self, root: Path, script_files: List[str]) -> List[Dict[str, Any]]:
+        """Extract router calls, applying app.use() prefixes across files.
+
+        Only calls on an app or router are routes: one created in the file by
+        express() or Router(), or required from a file that creates one. Any
+        other ``client.get('/x')`` is an HTTP client call.
+        """
+        texts = {path: self._read(root / path) for path in script_files}
+        created = {
+            path: set(self.EXPRESS_ROUTER.findall(text)) | set(self.EXPRESS_APP.findall(text))
+            for path, text in texts.items()
+        }
+        prefixes: Dict[str, str] = {}
+        owners: Dict[str, Set[str]] = {}
+        for path, text in texts.items():
+            required = {
+                name: self._resolve_script(path, target, texts)
+                for pattern in (self.EXPRESS_REQUIRE, self.EXPRESS_IMPORT)
+                for name, target in pattern.findall(text)
+            }
+            owners[path] = created[path] | {name for name, target in required.items() if created.get(target)}
+            for prefix, name, target in self.EXPRESS_MOUNT.findall(text):
+                mounted = required.get(name) if name else self._resolve_script(path, target, texts)
+                if mounted:
+                    prefixes[mounted] = prefix
+
+        endpoints = []
+        for path, text in texts.items():
+            if not owners[path]:
+                continue
+            # Routers created and mounted in the same file
+            local_prefixes = {
+                name: prefix for prefix, name, _ in self.EXPRESS_MOUNT.findall(text)
+                if name in created[path]
+            }
+            lines = text.splitlines()
+            for match in self.EXPRESS_ROUTE.finditer(text):
+                owner, method, _, route = match.groups()
+                if owner not in owners[path]:
+                    continue
+                if not route.startswith('/') and route != '*':
+                    continue
+                full_path = self._join_paths(
+                    prefixes.get(path, '') + local_prefixes.get(owner, ''), route
+                )
+                line = text.count('\n', 0, match.start()) + 1
+                jsdoc = self.JSDOC.search(text[:match.start()].rstrip())
+                endpoints.append(self._endpoint(
+                    'express', 'ANY' if method == 'all' else method.upper(), full_path,
+                    f"{owner}.{method}", path, line,
+                    self._jsdoc_text(jsdoc.group(1)) if jsdoc else '',
+                    self._path_parameters(full_path),
+                    "\n".join(lines[line - 1:line - 1 + self.SOURCE_LINES])
+                ))
+        return endpoints
+
+    def _resolve_script(self, path: str, target: str, texts: Dict[str, str]) -> Optional[str]:
+        """Resolve a relative require()/import target to a known script file."""
+        base = (Path(path).parent / target).as_posix()
+        parts = []
+        for part in base.split('/'):
+            if part == '..' and parts:
+                parts.pop()
+            elif part not in ('.', ''):
+                parts.append(part)
+        base = '/'.join(parts)
+        for candidate in (base, base + '.js', base + '.ts', base + '/index.js', base + '/index.ts'):
+            if candidate in texts:
+                return candidate
+        return None
+
+    def _jsdoc_text(self, block: str) -> str:
+        """Description lines of a JSDoc block, without the tags."""
+        lines = []
+        for line in block.splitlines():
+            line = line.strip().lstrip('*').strip()
+            if line.startswith('@'):
+                break
+            if line:
+                lines.append(line)
+        return " ".join(lines)
+
+    # Shared helpers
+
+    def _endpoint(
+        self,
+        framework: str,
+        method: str,
+        path: str,
+        handler: str,
+        file: str,
+        line: int,
+        description: str,
+        parameters: List[Dict[str, Any]],
+        source: str
+    ) -> Dict[str, Any]:
+        return {
+            "method": method,
+            "path": path,
+            "description": description.strip(),
+            "parameters": parameters,
+            "handler": handler,
+            "file": file,
+            "line": line,
+            "framework": framework,
+            "source": source
+        }
+
+    def _path_parameters(self, route_path: str) -> List[Dict[str, Any]]:
+        """Parameters embedded in a route path, in any supported syntax."""
+        parameters = []
+        for converter, name in self.ANGLE_PARAMETER.findall(route_path):
+            parameters.append(self._path_parameter(name, self.CONVERTER_TYPES.get(converter or 'str', 'string')))
+        for name in self.BRACE_PARAMETER.findall(route_path):
+            parameters.append(self._path_parameter(name, 'string'))
+        remaining = self.BRACE_PARAMETER.sub('', self.ANGLE_PARAMETER.sub('', route_path))
+        for name in self.COLON_PARAMETER.findall(remaining):
+            parameters.append(self._path_parameter(name, 'string'))
+        return parameters
+
+    def _path_parameter(self, name: str, type_name: str) -> Dict[str, Any]:
+        return {"name": name, "in": "path", "type": type_name, "required": True, "description": ""}
+
+    def _join_paths(self, prefix: str, route: str) -> str:
+        joined = '/'.join(part.strip('/') for part in (prefix, route) if part.strip('/'))
+        # Django routes are significant about their trailing slash
+        trailing = '/' if route.strip('/') and route.endswith('/') else ''
+        return '/' + joined + trailing
+
+    def _string_arg(self, call: ast.Call, position: int, keyword: str) -> Optional[str]:
+        node = call.args[position] if len(call.args) > position else self._keyword(call, keyword)
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        return None
+
+    def _keyword(self, call: ast.Call, name: str) -> Optional[ast.AST]:
+        for keyword in call.keywords:
+            if keyword.arg == name:
+                return keyword.value
+        return None
+
+    def _manifest_version(self, root: Path, framework: str) -> Optional[str]:
+        """Read a framework's version pin from requirements, pyproject or package.json."""
+        package = self.PACKAGE_NAMES[framework]
+        if framework == 'express':
+            manifest = root / 'package.json'
+            if manifest.is_file():
+                try:
+                    data = json.loads(self._read(manifest))
+                except json.JSONDecodeError:
+                    return None
+                for section in ('dependencies', 'devDependencies'):
+                    version = (data.get(section) or {}).get(package)
+                    if version:
+                        return version
+            return None
+
+        pin = re.compile(rf'^\s*["\']?{package}\s*(?:\[[^\]]*\])?\s*([=<>~!]=?\s*[\w.*]+)', re.IGNORECASE | re.MULTILINE)
+        for name in ('requirements.txt', 'pyproject.toml', 'setup.py', 'Pipfile'):
+            manifest = root / name
+            if manifest.is_file():
+                match = pin.search(self._read(manifest))
+                if match:
+                    return match.group(1).replace(' ', '')
+        return None
+
+    def _source_files(self, root: Path, files: Optional[List[str]]) -> List[str]:
+        if files is not None:
+            return sorted(files)
+        return sorted(
+            str(p.relative_to(root)) for p in root.rglob('*')
+            if p.is_file() and p.suffix in ('.py', '.js', '.mjs', '.cjs', '.ts')
+            and not self.IGNORED_DIRS & set(p.relative_to(root).parts)
+        )
+
+    def _parse(self, code: str) -> Optional[ast.AST]:
+        try:
+            return ast.parse(code)
+        except (SyntaxError, ValueError):
+            return None
+
+    def _read(self, path: Path) -> str:
+        return path.read_text(encoding='utf-8', errors='replace')
@@ -2,7 +2,12 @@ from typing import Dict, Any, List
 from ...base import BaseAgent
 from ...utils.logging_config import setup_logger
 from ...utils.error_handler import retry_with_exponential_backoff
+from ...utils.concurrency import gather_bounded, chunked
+from ...utils.blocking_io import blocking_io
+from ...llm.context_builder import context_builder
+from ....config.settings import CLAIM_BATCH_SIZE, ENDPOINT_BATCH_SIZE, REVIEW_CONTEXT_TOKENS
 from .tools.doc_reviewer import DocReviewer
+from .tools.endpoint_checker import EndpointChecker
 
 logger = setup_logger(__name__)
 
@@ -11,6 +16,7 @@ class DocReviewerAgent(BaseAgent):
         super().__init__("doc_reviewer")
         self.agency = agency
         self.reviewer = DocReviewer()
+        self.endpoint_checker = EndpointChecker()
 
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process review tasks."""
@@ -31,15 +37,51 @@ class DocReviewerAgent(BaseAgent):
         documentation = task["documentation"]
         repo_info = task.get("repo_info", {})
 
-        # Extract claims for verification
+        # Extract claims for verification, once per distinct claim
         claims = self.reviewer.extract_claims(documentation)
-        verification_results = []
 
-        for claim in claims:
-            # Verify each claim against the codebase
-            evidence = await self._find_evidence(claim, repo_info)
-            result = self.reviewer.verify_claim(claim, evidence)
-            verification_results.append(result)
+        # Verdicts from earlier runs stand while their evidence is unchanged
+        index = await blocking_io.run("disk", self.reviewer.index_repository, repo_info)
+        verdicts, pending = await blocking_io.run(
+            "disk", self.reviewer.cached_verdicts, claims, repo_info, index
+        )
+
+        # Settle what the local evidence index can; the rest goes to the LLM
+        # along with its best evidence snippets
+        checked = []
+        ambiguous = []
+        for claim in pending:
+            if index is None:
+                ambiguous.append(claim)
+                continue
+            check = self.reviewer.check_claim(claim["claim"], index)
+            claim = {**claim, "evidence": check["evidence"]}
+            checked.append(claim)
+            if check["verdict"] == "ambiguous":
+                ambiguous.append(claim)
+            else:
+                verdicts[claim["id"]] = self.reviewer.local_verdict(check)
+
+        # Verify the remaining claims in batches, several batches at a time
+        repo_context = context_builder.build_repo_context(repo_info, REVIEW_CONTEXT_TOKENS)
+        batches = chunked(ambiguous, CLAIM_BATCH_SIZE)
+        batch_verdicts = await gather_bounded(
+            lambda batch=batch: self._verify_claims(batch, repo_context)
+            for batch in batches
+        )
+        for result in batch_verdicts:
+            verdicts.update(result)
+        await blocking_io.run("disk", self.reviewer.remember_verdicts, checked, verdicts, repo_info, index)
+        logger.info(
+            f"Verified {len(claims)} distinct claims: {len(claims) - len(pending)} cached, "
+            f"{len(pending) - len(ambiguous)} from the evidence index, "
+            f"{len(ambiguous)} in {len(batches)} requests"
+        )
+
+        verification_results = [
+            self.reviewer.verify_claim(claim, verdicts.get(claim["id"]))
+            for claim in claims
+        ]
 
         # Generate feedback based on verification results
         feedback = await self._generate_feedback(verification_results)
@@ -63,8 +105,8 @@ class DocReviewerAgent(BaseAgent):
         """Validate API documentation."""
         documentation = task["documentation"]
 
-        # Validate API endpoints
-        endpoints = await self._extract_endpoints(documentation)
+        # Validate API endpoints, extracting them from the docs only if needed
+        endpoints = task.get("endpoints") or await self._extract_endpoints(documentation)
         validation_results = await self._validate_endpoints(endpoints)
 
         # Generate feedback for API documentation
@@ -84,19 +126,22 @@ class DocReviewerAgent(BaseAgent):
             "validation": validation_results
         }
 
-    async def _find_evidence(
-        self, 
-        claim: str, 
-        repo_info: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Find supporting evidence for a documentation claim."""
-        evidence = await self.get_completion(
-            "doc_reviewer",
-            "find_evidence",
-            claim=claim,
-            repo_info=repo_info
+    async def _verify_claims(
+        self,
+        claims: List[Dict[str, Any]],
+        repo_context: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Verify a batch of claims in one request, returning verdicts by claim id."""
+        content = await self.get_completion(
+            "review",
+            "verify_claims",
+            validator=lambda response: bool(self.reviewer.parse_verdicts(
+                response.choices[0].message.content, claims
+            )),
+            claims=self.reviewer.render_claims(claims),
+            repo_info=repo_context
         )
-        return evidence
+        return self.reviewer.parse_verdicts(content, claims)
 
     async def _generate_feedback(
         self,
@@ -126,16 +171,60 @@ class DocReviewerAgent(BaseAgent):
         self,
         endpoints: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Validate extracted API endpoints."""
-        validation_results = []
-        for endpoint in endpoints:
-            result = await self.get_completion(
-                "doc_reviewer",
-                "validate_endpoint",
-                endpoint=endpoint
-            )
-            validation_results.append(result)
-        return validation_results
+        """Validate extracted API endpoints, in their original order."""
+        items = [
+            {"id": f"E{position}", "endpoint": endpoint}
+            for position, endpoint in enumerate(endpoints, 1)
+        ]
+
+        # Structural problems are reported without asking the LLM
+        results = {}
+        sound = []
+        for item in items:
+            issues = self.endpoint_checker.check(item["endpoint"])
+            if issues:
+                results[item["id"]] = {"valid": False, "issues": issues, "source": "structure"}
+            else:
+                sound.append(item)
+
+        batches = chunked(sound, ENDPOINT_BATCH_SIZE)
+        batch_results = await gather_bounded(
+            lambda batch=batch: self._validate_endpoint_batch(batch)
+            for batch in batches
+        )
+        for batch_result in batch_results:
+            results.update(batch_result)
+        logger.info(
+            f"Validated {len(items)} endpoints: {len(items) - len(sound)} failed structural "
+            f"checks, {len(sound)} checked in {len(batches)} requests"
+        )
+
+        return [
+            {
+                "endpoint": self.endpoint_checker.label(item["endpoint"]),
+                **results.get(item["id"], {
+                    "valid": False,
+                    "issues": [{"field": "validation", "message": "No result returned"}],
+                    "source": "llm"
+                })
+            }
+            for item in items
+        ]
+
+    async def _validate_endpoint_batch(self, items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Validate a batch of endpoints in one request, returning results by id."""
+        content = await self.get_completion(
+            "review",
+            "validate_endpoints",
+            validator=lambda response: bool(self.endpoint_checker.parse_results(
+                response.choices[0].message.content, items
+            )),
+            endpoints=self.endpoint_checker.render(items)
+        )
+        return {
+            endpoint_id: {**result, "source": "llm"}
+            for endpoint_id, result in self.endpoint_checker.parse_results(content, items).items()
+        }
 
     async def _generate_api_feedback(
         self,
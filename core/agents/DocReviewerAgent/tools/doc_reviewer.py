@@ -1,15 +1,183 @@
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Any, Optional, Tuple
+from collections import OrderedDict
+import hashlib
 import re
+from pathlib import Path
+from .evidence_index import EvidenceIndex
+from ....utils.cache.claim_cache import claim_cache
+from ....utils.json_response import parse_json_object
+from .....config.settings import EVIDENCE_TOP_K, EVIDENCE_SUPPORT_COVERAGE, EVIDENCE_INDEXES_IN_MEMORY
 
 class DocReviewer:
+    CLAIM_KEYWORDS = {
+        'feature': r'provides|supports|implements|has|contains',
+        'behavior': r'will|can|allows|enables',
+        'structure': r'consists of|composed of|structured as',
+        'requirement': r'requires|needs|depends on'
+    }
+    # One pass per sentence: the first claim keyword up to the sentence end
+    CLAIM_PATTERN = re.compile(
+        r'\b(?:' + '|'.join(f'(?P<{kind}>{words})' for kind, words in CLAIM_KEYWORDS.items()) +
+        r')\b\s+\S.*',
+        re.IGNORECASE | re.DOTALL
+    )
+    SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n\s*\n|\n(?=\s*(?:[-*+>#|]|\d+\.)\s)')
+    CODE_BLOCK = re.compile(r'```.*?(?:```|$)', re.DOTALL)
+
     def __init__(self):
-        self.claim_patterns = {
-            'feature': r'(?:provides|supports|implements|has|contains)\s+([^.]+)',
-            'behavior': r'(?:will|can|allows|enables)\s+([^.]+)',
-            'structure': r'(?:consists of|composed of|structured as)\s+([^.]+)',
-            'requirement': r'(?:requires|needs|depends on)\s+([^.]+)'
-        }
+        # Bounded, least recently used out first: every job reviews a fresh checkout
+        self._indexes: "OrderedDict[str, EvidenceIndex]" = OrderedDict()
         
+    VERDICTS = ("supported", "unsupported", "unclear")
+
+    def extract_claims(self, documentation: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Extract claims from all documentation files, merging repeated claims."""
+        claims: Dict[str, Dict[str, Any]] = {}
+        for file_path, content in documentation.items():
+            if not isinstance(content, str):
+                continue
+            for claim in self._extract_claims(content):
+                fingerprint = claim_cache.fingerprint(self._normalize_claim(claim))
+                entry = claims.setdefault(fingerprint, {
+                    "id": f"C{len(claims) + 1}",
+                    "claim": claim,
+                    "fingerprint": fingerprint,
+                    "files": []
+                })
+                if file_path not in entry["files"]:
+                    entry["files"].append(file_path)
+        return list(claims.values())
+
+    def index_repository(self, repo_info: Dict[str, Any]) -> Optional[EvidenceIndex]:
+        """Get the evidence index for a prepared repository, if it has a local path."""
+        repo_path = repo_info.get("repo_path") or repo_info.get("path")
+        if not repo_path:
+            return None
+        if repo_path in self._indexes:
+            self._indexes.move_to_end(repo_path)
+        else:
+            file_paths = [task["file_path"] for task in repo_info.get("tasks", [])] or None
+            self._indexes[repo_path] = EvidenceIndex.for_repository(repo_path, file_paths)
+            while len(self._indexes) > EVIDENCE_INDEXES_IN_MEMORY:
+                self._indexes.popitem(last=False)
+        return self._indexes[repo_path]
+
+    def check_claim(
+        self,
+        claim: str,
+        index: EvidenceIndex,
+        top_k: int = EVIDENCE_TOP_K
+    ) -> Dict[str, Any]:
+        """
+        Check a claim against the local evidence index.
+
+        Term matching can confirm a claim but not refute one: high-level
+        claims rarely share vocabulary with the code they describe.
+
+        Returns:
+            Dict with a verdict ("supported" or "ambiguous") and the top
+            evidence hits
+        """
+        terms = set(index.tokenize(claim))
+        hits = index.search(claim, top_k)
+
+        # Supported when one symbol or file accounts for most of the claim
+        best = max((len(hit["matched"]) / len(terms) for hit in hits), default=0.0)
+        if terms and best >= EVIDENCE_SUPPORT_COVERAGE:
+            return {"verdict": "supported", "evidence": hits}
+
+        return {"verdict": "ambiguous", "evidence": hits}
+
+    def cached_verdicts(
+        self,
+        claims: List[Dict[str, Any]],
+        repo_info: Dict[str, Any],
+        index: Optional[EvidenceIndex]
+    ) -> Tuple[Dict[str, Dict], List[Dict[str, Any]]]:
+        """
+        Reuse verdicts from earlier runs whose evidence is unchanged.
+
+        Returns:
+            Tuple of (verdicts by claim id, claims that still need verifying)
+        """
+        if index is None:
+            return {}, claims
+        file_hash = self._file_hasher(repo_info, index.file_hashes)
+
+        verdicts, remaining = {}, []
+        for claim in claims:
+            verdict = claim_cache.get_verdict(self._repo_id(repo_info), claim["fingerprint"], file_hash, index.snapshot)
+            if verdict is not None:
+                verdicts[claim["id"]] = {**verdict, "source": "cache"}
+            else:
+                remaining.append(claim)
+        return verdicts, remaining
+
+    def remember_verdicts(
+        self,
+        claims: List[Dict[str, Any]],
+        verdicts: Dict[str, Dict],
+        repo_info: Dict[str, Any],
+        index: Optional[EvidenceIndex]
+    ) -> None:
+        """Cache new verdicts along with hashes of the files they rest on."""
+        if index is None:
+            return
+        file_hash = self._file_hasher(repo_info, index.file_hashes)
+
+        for claim in claims:
+            verdict = verdicts.get(claim["id"])
+            if verdict is None or verdict.get("source") == "cache":
+                continue
+            files = {hit["path"]: file_hash(hit["path"]) for hit in claim.get("evidence", [])}
+            # Anything short of "supported" by specific files rests on what the
+            # code lacks, so it only holds for this exact repository snapshot
+            snapshot = None if verdict["verdict"] == "supported" and files else index.snapshot
+            claim_cache.set_verdict(self._repo_id(repo_info), claim["fingerprint"], verdict, files, snapshot)
+
+    def render_claims(self, claims: List[Dict[str, Any]]) -> str:
+        """Render claims, with any local evidence snippets, for a batched prompt."""
+        lines = []
+        for claim in claims:
+            lines.append(f"[{claim['id']}] {claim['claim']}")
+            for hit in claim.get("evidence", []):
+                lines.append(f"    {hit['path']}:{hit['line']}: {hit['snippet']}")
+        return "\n".join(lines)
+
+    def parse_verdicts(self, content: str, claims: List[Dict[str, Any]]) -> Dict[str, Dict]:
+        """Parse per-claim verdicts from a batched response, dropping malformed ones."""
+        data = parse_json_object(content) or {}
+        verdicts = {}
+        for claim in claims:
+            result = data.get(claim["id"])
+            if isinstance(result, dict) and result.get("verdict") in self.VERDICTS:
+                verdicts[claim["id"]] = result
+        return verdicts
+
+    def verify_claim(self, claim: Dict[str, Any], verdict: Optional[Dict] = None) -> Dict[str, Any]:
+        """Build the verification result for a claim from its verdict."""
+        verdict = verdict or {"verdict": "unclear", "reason": "No verdict returned"}
+        return {
+            "claim": claim["claim"],
+            "files": claim["files"],
+            "verdict": verdict["verdict"],
+            "verified": verdict["verdict"] == "supported",
+            "evidence": verdict.get("evidence", ""),
+            "reason": verdict.get("reason", ""),
+            "source": verdict.get("source", "llm")
+        }
+
+    def local_verdict(self, check: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a supported local check into a verdict."""
+        hit = check["evidence"][0]
+        location = f"{hit['path']}:{hit['line']}"
+        return {
+            "verdict": "supported",
+            "evidence": ", ".join(f"{h['path']}:{h['line']}" for h in check["evidence"]),
+            "reason": f"Matched {', '.join(hit['matched'])} in {location}",
+            "source": "index"
+        }
+
     def review_documentation(self, documentation: Dict, repo_info: Dict) -> Dict:
         """Review documentation for accuracy"""
         review_result = {
@@ -42,14 +210,43 @@ class DocReviewer:
         return issues
         
     def _extract_claims(self, content: str) -> List[str]:
-        """Extract verifiable claims from content"""
+        """Extract verifiable claims from content, at most one per sentence"""
         claims = []
-        for pattern_type, pattern in self.claim_patterns.items():
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            claims.extend([m.group(0) for m in matches])
+        prose = self.CODE_BLOCK.sub('\n\n', content)
+        for sentence in self.SENTENCE_BOUNDARY.split(prose):
+            match = self.CLAIM_PATTERN.search(sentence)
+            if match:
+                claims.append(" ".join(match.group(0).split()).rstrip(" .!?"))
         return claims
         
+    def _normalize_claim(self, claim: str) -> str:
+        """Normalize a claim so rewordings in case, punctuation or articles match."""
+        words = re.findall(r'[a-z0-9]+', claim.lower())
+        return " ".join(w for w in words if w not in ('a', 'an', 'the'))
+
+    def _repo_id(self, repo_info: Dict[str, Any]) -> str:
+        """Identify a repository across checkouts: its URL, else its local path."""
+        if repo_info.get("url"):
+            return repo_info["url"].rstrip('/').removesuffix('.git')
+        return str(Path(repo_info.get("repo_path") or repo_info.get("path")).resolve())
+
+    def _file_hasher(self, repo_info: Dict[str, Any], known: Optional[Dict[str, str]] = None):
+        """Build a memoized content hasher for files in the repository, seeded with ``known`` hashes."""
+        root = Path(repo_info.get("repo_path") or repo_info.get("path"))
+        hashes: Dict[str, Optional[str]] = dict(known or {})
+
+        def file_hash(path: str) -> Optional[str]:
+            if path not in hashes:
+                try:
+                    hashes[path] = hashlib.sha256((root / path).read_bytes()).hexdigest()
+                except OSError:
+                    hashes[path] = None
+            return hashes[path]
+
+        return file_hash
+
     def _verify_claim(self, claim: str, repo_info: Dict) -> bool:
         """Verify if a claim is supported by repository evidence"""
-        # Basic verification - can be enhanced
-        return True  # Placeholder implementation
\ No newline at end of file
+        # The evidence index can only confirm claims; rejecting one takes the
+        # LLM, which the agent asks about everything the index leaves ambiguous
+        return True
\ No newline at end of file
@@ -0,0 +1,96 @@
+import json
+import re
+from typing import Dict, List, Any
+from ....utils.json_response import parse_json_object
+
+class EndpointChecker:
+    """Tool for structural checks on documented API endpoints.
+
+    Problems that need no judgement (missing fields, undocumented path
+    parameters, examples that aren't valid JSON) are caught locally, so only
+    structurally sound endpoints are sent to the LLM for validation.
+    """
+
+    # "ANY" covers handlers bound to every method (Django views, Express all())
+    HTTP_METHODS = {'GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS', 'ANY'}
+    PARAMETER_FIELDS = ('name', 'type', 'required', 'description')
+    EXAMPLE_FIELDS = ('request_example', 'response_example')
+    # {id} (OpenAPI, FastAPI), :id (Express) and <int:id> (Flask)
+    PATH_PARAMETER = re.compile(r'\{(\w+)\}|:(\w+)|<(?:\w+:)?(\w+)>')
+
+    def label(self, endpoint: Dict[str, Any]) -> str:
+        """Human-readable endpoint label, e.g. "GET /users/{id}"."""
+        return f"{str(endpoint.get('method', '?')).upper()} {endpoint.get('path', '?')}"
+
+    def check(self, endpoint: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Find structural problems in an endpoint's documentation."""
+        issues = []
+        method = str(endpoint.get('method') or '').upper()
+        path = endpoint.get('path') or ''
+
+        if method not in self.HTTP_METHODS:
+            issues.append(self._issue('method', f"Unknown or missing HTTP method: {method or 'none'}"))
+        if not path.startswith('/'):
+            issues.append(self._issue('path', f"Path must start with '/': {path or 'none'}"))
+        if not str(endpoint.get('description') or '').strip():
+            issues.append(self._issue('description', "Missing description"))
+
+        parameters = endpoint.get('parameters') or []
+        names = []
+        for position, param in enumerate(parameters, 1):
+            if not isinstance(param, dict):
+                issues.append(self._issue('parameters', f"Parameter {position} is not an object"))
+                continue
+            missing = [field for field in self.PARAMETER_FIELDS if param.get(field) in (None, '')]
+            if missing:
+                issues.append(self._issue(
+                    'parameters',
+                    f"Parameter {param.get('name') or position} is missing {', '.join(missing)}"
+                ))
+            names.append(param.get('name'))
+
+        for name in sorted({n for n in names if n and names.count(n) > 1}):
+            issues.append(self._issue('parameters', f"Parameter {name} is documented more than once"))
+
+        for match in self.PATH_PARAMETER.finditer(path):
+            name = next(group for group in match.groups() if group)
+            if name not in names:
+                issues.append(self._issue('parameters', f"Path parameter {name} is not documented"))
+
+        for field in self.EXAMPLE_FIELDS:
+            example = endpoint.get(field)
+            if isinstance(example, str) and example.strip():
+                try:
+                    json.loads(example)
+                except json.JSONDecodeError as e:
+                    issues.append(self._issue(field, f"Example is not valid JSON: {e.msg}"))
+
+        return issues
+
+    def render(self, endpoints: List[Dict[str, Any]]) -> str:
+        """Render id-tagged endpoints for a batched validation prompt."""
+        return "\n\n".join(
+            f"[{item['id']}] {self.label(item['endpoint'])}\n"
+            f"{json.dumps(item['endpoint'], indent=2, default=str)}"
+            for item in endpoints
+        )
+
+    def parse_results(self, content: str, endpoints: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Parse per-endpoint results from a batched response, dropping malformed ones."""
+        data = parse_json_object(content) or {}
+        results = {}
+        for item in endpoints:
+            result = data.get(item["id"])
+            if isinstance(result, dict) and isinstance(result.get("valid"), bool):
+                issues = result.get("issues") or []
+                results[item["id"]] = {
+                    "valid": result["valid"],
+                    "issues": [
+                        issue if isinstance(issue, dict) else self._issue('semantics', str(issue))
+                        for issue in issues
+                    ]
+                }
+        return results
+
+    def _issue(self, field: str, message: str) -> Dict[str, str]:
+        return {"field": field, "message": message}
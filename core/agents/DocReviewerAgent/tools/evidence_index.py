@@ -0,0 +1,154 @@
+import hashlib
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set
+from ....utils.cache.cache_manager import CacheManager
+from .....config.settings import CACHE_DIR
+
+class EvidenceIndex:
+    """Tool for BM25 search over a repository's symbols, docstrings and paths.
+
+    Every file is indexed as a whole (path, identifiers, comments) and every
+    function or class once more on its own (name, signature and the lines
+    below it, which hold its docstring), so claims can be matched to the
+    specific symbol that backs them.
+    """
+
+    K1 = 1.5
+    B = 0.75
+    SNIPPET_LINES = 4
+    SNIPPET_CHARS = 240
+    SOURCE_SUFFIXES = {'.py', '.js', '.mjs', '.cjs', '.ts', '.jsx', '.tsx'}
+    IGNORED_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build'}
+
+    SYMBOL_PATTERN = re.compile(
+        r'^[ \t]*(?:export\s+)?(?:default\s+)?(?:async\s+)?(?:def|class|function)\s+(\w+)|'
+        r'^[ \t]*(?:export\s+)?(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?(?:\([^)]*\)\s*=>|function)',
+        re.MULTILINE
+    )
+    WORD_PATTERN = re.compile(r'[A-Za-z][A-Za-z0-9_]*')
+    STOPWORDS = {
+        'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'for', 'from', 'has', 'have',
+        'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'will',
+        'with', 'which', 'allows', 'allow', 'enables', 'enable', 'provides', 'provide',
+        'supports', 'support', 'implements', 'contains', 'requires', 'needs', 'depends',
+        'consists', 'composed', 'structured', 'self', 'none', 'true', 'false', 'return'
+    }
+
+    def __init__(self):
+        self.documents: List[Dict[str, Any]] = []
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.lengths: List[int] = []
+        # Signature of the file set the index was built from
+        self.snapshot: Optional[str] = None
+        # Content hash of each indexed file, by repository-relative path
+        self.file_hashes: Dict[str, str] = {}
+
+    @classmethod
+    def for_repository(
+        cls,
+        repo_path: str,
+        file_paths: Optional[List[str]] = None,
+        cache: Optional[CacheManager] = None
+    ) -> "EvidenceIndex":
+        """
+        Load the persisted index for a repository, building it if files changed.
+
+        Args:
+            repo_path: Local repository path
+            file_paths: Repository-relative files to index; defaults to all source files
+        """
+        root = Path(repo_path)
+        if file_paths is None:
+            file_paths = [
+                str(p.relative_to(root)) for p in root.rglob('*')
+                if p.is_file() and p.suffix in cls.SOURCE_SUFFIXES
+                and not cls.IGNORED_DIRS & set(p.relative_to(root).parts)
+            ]
+
+        # Keyed by file contents only, so fresh checkouts of the same code
+        # (a new worktree per job) share one index and any edit rebuilds it
+        contents = {file_path: (root / file_path).read_bytes() for file_path in sorted(file_paths)}
+        file_hashes = {file_path: hashlib.sha256(data).hexdigest() for file_path, data in contents.items()}
+        signature = hashlib.sha256()
+        for file_path, digest in file_hashes.items():
+            signature.update(f"{file_path}\0{digest}\n".encode())
+        cache = cache or CacheManager(CACHE_DIR / "evidence", ttl=0)
+        key = f"evidence:{signature.hexdigest()}"
+
+        index = cache.get(key)
+        if index is None:
+            index = cls()
+            index.snapshot = signature.hexdigest()
+            index.file_hashes = file_hashes
+            for file_path, data in contents.items():
+                index.add_file(file_path, data.decode('utf-8', errors='replace'))
+            cache.set(key, index)
+        return index
+
+    def add_file(self, path: str, code: str) -> None:
+        """Index a file and each function or class defined in it."""
+        lines = code.splitlines()
+        self._add_document({"path": path, "line": 1, "name": None, "snippet": path},
+                           self.tokenize(path) + self.tokenize(code))
+
+        for match in self.SYMBOL_PATTERN.finditer(code):
+            name = match.group(1) or match.group(2)
+            line = code.count('\n', 0, match.start()) + 1
+            body = lines[line - 1:line - 1 + self.SNIPPET_LINES]
+            snippet = " ".join(" ".join(body).split())[:self.SNIPPET_CHARS]
+            self._add_document({"path": path, "line": line, "name": name, "snippet": snippet},
+                               self.tokenize(path) + self.tokenize(name) * 2 + self.tokenize(" ".join(body)))
+
+    def search(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        """Rank documents against a query, returning the best matches."""
+        terms = set(self.tokenize(query))
+        scores: Dict[int, float] = {}
+        matched: Dict[int, Set[str]] = {}
+        average_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0
+
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (len(self.documents) - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = self.K1 * (1 - self.B + self.B * self.lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.K1 + 1) / (frequency + norm)
+                matched.setdefault(doc_id, set()).add(term)
+
+        ranked = sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id))[:top_k]
+        return [
+            {**self.documents[doc_id], "score": scores[doc_id], "matched": sorted(matched[doc_id])}
+            for doc_id in ranked
+        ]
+
+    def tokenize(self, text: str) -> List[str]:
+        """Split text into normalized terms, breaking up snake_case and camelCase."""
+        terms = []
+        for word in self.WORD_PATTERN.findall(text):
+            parts = re.findall(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+', word)
+            for part in ([word] if len(parts) > 1 else []) + parts:
+                term = self._stem(part.lower())
+                if len(term) > 1 and term not in self.STOPWORDS:
+                    terms.append(term)
+        return terms
+
+    def _stem(self, term: str) -> str:
+        """Strip simple plural endings so "handlers" matches "handler"."""
+        if term.endswith('ies') and len(term) > 4:
+            return term[:-3] + 'y'
+        if term.endswith(('ches', 'shes', 'sses', 'xes')):
+            return term[:-2]
+        if term.endswith('s') and not term.endswith('ss') and len(term) > 3:
+            return term[:-1]
+        return term
+
+    def _add_document(self, document: Dict[str, Any], terms: List[str]) -> None:
+        doc_id = len(self.documents)
+        self.documents.append(document)
+        self.lengths.append(len(terms))
+        for term, frequency in Counter(terms).items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import os
 from pathlib import Path
@@ -7,6 +7,7 @@ from github import Github
 from ...base import BaseAgent
 from ...utils.logging_config import setup_logger
 from ...utils.error_handler import retry_with_exponential_backoff
+from ...utils.blocking_io import blocking_io
 from .tools.github_manager import GitHubManager
 from ...config.settings import GITHUB_TOKEN, REPO_CLONE_PATH
 
@@ -18,13 +19,16 @@ class GitHubAgent(BaseAgent):
         self.agency = agency
         self.manager = GitHubManager(GITHUB_TOKEN)
         self.repos: Dict[str, Repo] = {}
+        # Every worktree prepared per repository URL, until it is released
+        self.worktrees: Dict[str, List[str]] = {}
 
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process GitHub-related tasks."""
         task_types = {
             "prepare_repository": self._prepare_repository,
             "create_pull_request": self._create_pull_request,
-            "update_documentation": self._update_documentation
+            "update_documentation": self._update_documentation,
+            "release_repository": self._release_repository
         }
 
         handler = task_types.get(task["type"])
@@ -38,9 +42,10 @@ class GitHubAgent(BaseAgent):
         """Prepare a repository for documentation."""
         repo_url = task["repo_url"]
 
-        # Clone or update repository
-        repo_info = await self.manager.setup_repository(repo_url)
+        # Reuse the cached clone, in a worktree of this job's own
+        repo_info = await blocking_io.run("git", self.manager.setup_repository, repo_url)
         self.repos[repo_url] = repo_info
+        self.worktrees.setdefault(repo_url, []).append(repo_info["path"])
 
         # Generate repository metadata using LLM
         metadata = await self._generate_repo_metadata(repo_info)
@@ -58,33 +63,82 @@ class GitHubAgent(BaseAgent):
         if not repo_info:
             raise ValueError(f"Repository not prepared: {repo_url}")
 
-        # Create documentation branch
-        branch_name = await self.manager.setup_documentation_branch(
-            repo_info["path"]
-        )
+        if os.getenv('DOCSMITH_GITHUB_PR_MODE', 'upsert') == 'upsert':
+            return await self._upsert_pull_request(repo_info, documentation)
 
-        # Write documentation files
-        await self.manager.write_documentation(
-            repo_info["path"],
-            documentation
+        # Commit straight to a new branch ref; the clone is never checked out
+        branch_name = self.manager.documentation_branch_name()
+        commit_sha = await blocking_io.run(
+            "git",
+            self.manager.commit_documentation_tree,
+            repo_info["mirror"],
+            documentation,
+            branch_name,
+            message="docs: Update documentation"
+        )
+        if not commit_sha:
+            # The base branch already has these docs; no branch was created to push
+            logger.info("Documentation unchanged; no pull request needed")
+            return {
+                "pr_number": None,
+                "pr_url": None,
+                "branch": None,
+                "commit": None,
+                "status": "unchanged"
+            }
+        await blocking_io.run("git", self.manager.push_branch, repo_info["mirror"], branch_name)
+
+        pr_info = await blocking_io.run(
+            "github",
+            self.manager.create_pull_request,
+            title="Documentation Update",
+            body=await self._generate_pr_description(documentation),
+            branch=branch_name,
+            repo_path=repo_info["mirror"]
         )
 
-        # Create commit and PR
-        commit_sha = await self.manager.commit_documentation(
+        return {
+            "pr_number": pr_info["pr_number"],
+            "pr_url": pr_info["pr_url"],
+            "branch": branch_name,
+            "commit": commit_sha
+        }
+
+    async def _release_repository(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Remove every worktree prepared for a repository; its mirror stays cached."""
+        released = self.worktrees.pop(task["repo_url"], [])
+        for path in released:
+            await blocking_io.run("git", self.manager.release_repository, path)
+        return {"released": len(released)}
+
+    async def _upsert_pull_request(self, repo_info: Dict[str, Any], documentation: Dict[str, str]) -> Dict[str, Any]:
+        """Reuse DocSmith's open PR on the stable branch, creating one only if needed."""
+        # Mostly git work (the commit and push); one API call finds the open PR
+        prepared = await blocking_io.run(
+            "git",
+            self.manager.prepare_pr_branch,
+            repo_info["mirror"],
             documentation,
             "docs: Update documentation"
         )
-
-        pr_info = await self.manager.create_pull_request(
+        # The description costs an LLM call, so only write it when there is a new commit
+        body = await self._generate_pr_description(documentation) if prepared["changed"] else None
+        pr_info = await blocking_io.run(
+            "github",
+            self.manager.upsert_pull_request,
+            repo_info["mirror"],
+            prepared,
             title="Documentation Update",
-            body=await self._generate_pr_description(documentation)
+            body=body
         )
+        logger.info(f"Documentation PR {pr_info['status']} on {prepared['branch']}")
 
         return {
             "pr_number": pr_info["pr_number"],
             "pr_url": pr_info["pr_url"],
-            "branch": branch_name,
-            "commit": commit_sha
+            "branch": prepared["branch"],
+            "commit": prepared["commit"],
+            "status": pr_info["status"]
         }
 
     @retry_with_exponential_backoff()
@@ -98,21 +152,23 @@ class GitHubAgent(BaseAgent):
         if not repo_info:
             raise ValueError(f"Repository not prepared: {repo_url}")
 
-        # Update documentation files
-        await self.manager.write_documentation(
-            repo_info["path"],
-            documentation
-        )
-
-        # Create commit
-        commit_sha = await self.manager.commit_documentation(
+        # Advance the PR branch without touching the working tree
+        branch_name = task["branch"]
+        commit_sha = await blocking_io.run(
+            "git",
+            self.manager.commit_documentation_tree,
+            repo_info["mirror"],
             documentation,
-            "docs: Update documentation based on review"
+            branch_name,
+            message="docs: Update documentation based on review"
         )
+        if commit_sha:
+            await blocking_io.run("git", self.manager.push_branch, repo_info["mirror"], branch_name)
 
         return {
             "status": "updated",
             "pr_number": pr_number,
+            "branch": branch_name,
             "commit": commit_sha
         }
 
@@ -0,0 +1,198 @@
+from git import Git, Repo
+from git.exc import GitCommandError
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Iterator, Optional
+import fcntl
+import hashlib
+import os
+import re
+import shutil
+import threading
+import uuid
+from .....config.settings import REPO_CLONE_PATH, CLONE_CACHE_BUDGET_MB, CLONE_DEPTH
+
+class CloneCache:
+    """Tool for reusing repository clones across runs and concurrent jobs.
+
+    Each repository is kept as one bare, blob-filtered (partial) mirror,
+    shallow by default; later runs only fetch what changed. Jobs never work
+    in the mirror itself: each gets its own detached worktree, optionally
+    sparse-checked-out to the files it will read, so blobs are downloaded
+    on demand for just those paths. Mirrors not used recently are evicted
+    once the cache exceeds its disk budget.
+    """
+
+    # Files kept in sparse worktrees whatever the include patterns say
+    SPARSE_ALWAYS = (
+        'README*', 'requirements*.txt', 'pyproject.toml', 'setup.py', 'setup.cfg',
+        'Pipfile', 'package.json', '*openapi*', '*swagger*'
+    )
+    LAST_USED = "docsmith-last-used"
+
+    def __init__(
+        self,
+        root: Path = REPO_CLONE_PATH,
+        budget_mb: int = CLONE_CACHE_BUDGET_MB,
+        depth: int = CLONE_DEPTH
+    ):
+        self.root = Path(root)
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.depth = depth
+        for directory in ("mirrors", "worktrees", "locks"):
+            (self.root / directory).mkdir(parents=True, exist_ok=True)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def mirror(self, url: str) -> Path:
+        """
+        Return an up-to-date mirror of a repository.
+
+        The first call clones (partial, and shallow unless depth is 0); later
+        calls fetch incrementally. Safe to call from concurrent jobs and
+        processes.
+        """
+        path = self.mirror_path(url)
+        with self._locked(path.name):
+            if (path / "HEAD").exists():
+                self._fetch(Repo(path))
+            else:
+                self._clone(url, path)
+            (path / self.LAST_USED).touch()
+        self.evict(keep={path})
+        return path
+
+    def mirror_path(self, url: str) -> Path:
+        """Where the mirror of ``url`` lives (whether or not it exists yet)."""
+        parts = [p for p in re.split(r'[/:]', url.rstrip('/')) if p][-2:]
+        name = re.sub(r'[^A-Za-z0-9_.-]+', '-', '-'.join(parts)).removesuffix('.git')
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]
+        return self.root / "mirrors" / f"{name}-{digest}.git"
+
+    def checkout(self, url: str, include_patterns: Optional[List[str]] = None) -> Path:
+        """
+        Create a private worktree of the default branch for one job.
+
+        Args:
+            url: Repository URL (or local path)
+            include_patterns: Glob patterns to sparse-check-out; all files if None
+
+        Returns:
+            Path of the new worktree; pass it to release() when done
+        """
+        mirror = self.mirror(url)
+        worktree = self.root / "worktrees" / f"{mirror.stem}-{uuid.uuid4().hex[:8]}"
+        with self._locked(mirror.name):
+            Repo(mirror).git.worktree('add', '--detach', '--no-checkout', str(worktree), 'origin/HEAD')
+        # The mirror's core.bare=true is shared; each worktree overrides it
+        Git(str(worktree)).config('--worktree', 'core.bare', 'false')
+
+        repo = Repo(worktree)
+        if include_patterns:
+            # Non-cone mode understands gitignore-style globs such as *.py
+            repo.git.sparse_checkout('set', '--no-cone', *include_patterns, *self.SPARSE_ALWAYS)
+        repo.git.checkout('--detach')
+        return worktree
+
+    def release(self, worktree: Path) -> None:
+        """Remove a job's worktree; the mirror stays cached."""
+        worktree = Path(worktree)
+        mirror = Path(Repo(worktree).common_dir).resolve()
+        with self._locked(mirror.name):
+            try:
+                Repo(mirror).git.worktree('remove', '--force', str(worktree))
+            except GitCommandError:
+                shutil.rmtree(worktree, ignore_errors=True)
+                Repo(mirror).git.worktree('prune')
+
+    @contextmanager
+    def lease(self, url: str, include_patterns: Optional[List[str]] = None) -> Iterator[Path]:
+        """Check out a worktree for the duration of a with block."""
+        worktree = self.checkout(url, include_patterns)
+        try:
+            yield worktree
+        finally:
+            self.release(worktree)
+
+    @contextmanager
+    def branch_lock(self, mirror: Path, branch: str) -> Iterator[None]:
+        """Hold a branch of a mirror exclusively, e.g. while rebuilding and pushing it."""
+        with self._locked(f"{Path(mirror).resolve().name}-{re.sub(r'[^A-Za-z0-9_.-]+', '-', branch)}"):
+            yield
+
+    def evict(self, keep: Optional[set] = None) -> List[Path]:
+        """
+        Delete least recently used mirrors until the cache fits its budget.
+
+        Mirrors with live worktrees, and those in ``keep``, are never evicted.
+
+        Returns:
+            The mirrors that were removed
+        """
+        keep = {Path(p).resolve() for p in keep or ()}
+        mirrors = [p for p in (self.root / "mirrors").iterdir() if (p / "HEAD").exists()]
+        sizes = {p: self._size(p) for p in mirrors}
+        total = sum(sizes.values()) + self._size(self.root / "worktrees")
+
+        evicted = []
+        for path in sorted(mirrors, key=self._last_used):
+            if total <= self.budget_bytes:
+                break
+            if path.resolve() in keep or self._has_worktrees(path):
+                continue
+            with self._locked(path.name):
+                shutil.rmtree(path, ignore_errors=True)
+            total -= sizes[path]
+            evicted.append(path)
+        return evicted
+
+    def _clone(self, url: str, path: Path) -> None:
+        temp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            repo = Repo.init(temp, bare=True)
+            repo.git.remote('add', 'origin', url)
+            # Remote-tracking refs, so fetches never clobber local docs branches
+            repo.git.config('remote.origin.fetch', '+refs/heads/*:refs/remotes/origin/*')
+            # Per-worktree config (for sparse checkout) without git moving
+            # core.bare out of the shared config, where GitPython looks for it
+            repo.git.config('extensions.worktreeConfig', 'true')
+            self._fetch(repo)
+            repo.git.remote('set-head', 'origin', '--auto')
+            # Only a fully built mirror becomes visible to other jobs
+            os.replace(temp, path)
+        finally:
+            shutil.rmtree(temp, ignore_errors=True)
+
+    def _fetch(self, repo: Repo) -> None:
+        depth = ['--depth', str(self.depth)] if self.depth else []
+        repo.git.fetch('--prune', '--filter=blob:none', *depth, 'origin')
+
+    @contextmanager
+    def _locked(self, name: str) -> Iterator[None]:
+        """Serialize work on one mirror across threads and processes."""
+        with self._locks_guard:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock, open(self.root / "locks" / f"{name}.lock", 'w') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _has_worktrees(self, mirror: Path) -> bool:
+        worktrees = mirror / "worktrees"
+        return worktrees.is_dir() and any(worktrees.iterdir())
+
+    def _last_used(self, mirror: Path) -> float:
+        marker = mirror / self.LAST_USED
+        return marker.stat().st_mtime if marker.exists() else 0.0
+
+    def _size(self, path: Path) -> int:
+        total = 0
+        for dirpath, _, filenames in os.walk(path):
+            for filename in filenames:
+                try:
+                    total += os.lstat(os.path.join(dirpath, filename)).st_size
+                except FileNotFoundError:
+                    pass
+        return total
@@ -1,25 +1,85 @@
-from github import Github
-from git import Repo
+from git import Repo, Blob, Actor
+from git.exc import GitCommandError
+from gitdb import IStream
+from io import BytesIO
 import os
-from typing import Dict, List, Any
+import random
+import tempfile
+import time
+import uuid
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
+from pathlib import Path
+from ....output.document_writer import DocumentWriter
+from ....utils.github_api import shared_github_api
+from .clone_cache import CloneCache
+
+DEFAULT_PR_BODY = '''
+## Documentation Update
+
+This PR contains automatically generated documentation updates from DocSmith.
+
+### Changes
+- Updated documentation files
+- Generated API references
+- Added usage examples
+- Updated setup instructions
+
+Please review the changes and ensure they meet the project's documentation standards.
+'''
 
 class GitHubManager:
     """Tool for managing GitHub operations."""
     
-    def __init__(self, github_token: str = None):
-        self.github_token = github_token or os.getenv('GITHUB_TOKEN')
-        if not self.github_token:
-            raise ValueError("GitHub token not provided and GITHUB_TOKEN env var not set")
-        self.github = Github(self.github_token)
+    # Attempts to move a branch ref when another job moved it first
+    REF_UPDATE_RETRIES = 5
+    NULL_SHA = "0" * 40
+    
+    def __init__(self, github_token: str = None, github: Any = None, clone_cache: CloneCache = None):
+        """
+        Args:
+            github_token: Token for the GitHub API; defaults to GITHUB_TOKEN
+            github: Client to use instead of creating one, e.g. a local
+                stand-in for the GitHub API in tests
+            clone_cache: Where repositories are cloned; defaults to REPO_CLONE_PATH
+        """
+        self.clone_cache = clone_cache or CloneCache()
+        if github is not None:
+            self.github = github
+            self.api = None
+            return
+        # Shares its connection pool, response cache and quota with RepoAnalyzer
+        self.api = shared_github_api(github_token)
+        self.github = self.api.client
+
+    def setup_repository(self, repo_url: str) -> Dict[str, Any]:
+        """
+        Check out a private worktree of a repository from the clone cache.
+
+        Only files matching the analysis include patterns are checked out.
+
+        Returns:
+            {"url", "path": the worktree, "mirror": the shared bare clone,
+            which is where documentation commits should go}
+        """
+        patterns = os.getenv('DOCSMITH_INCLUDE_PATTERNS', '*.py,*.js,*.ts,*.jsx,*.tsx').split(',')
+        worktree = self.clone_cache.checkout(repo_url, [p.strip() for p in patterns if p.strip()])
+        return {
+            "url": repo_url,
+            "path": str(worktree),
+            "mirror": str(self.clone_cache.mirror_path(repo_url))
+        }
+
+    def release_repository(self, path: str) -> None:
+        """Give a worktree from setup_repository back to the clone cache."""
+        self.clone_cache.release(Path(path))
 
     def setup_documentation_branch(self, repo_path: str, branch_name: str = None) -> str:
         """Create and checkout documentation branch."""
         self.repo = Repo(repo_path)
         
         if branch_name is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            branch_name = f"{os.getenv('DOCSMITH_GITHUB_BRANCH_PREFIX', 'docs/update_')}{timestamp}"
+            branch_name = self.documentation_branch_name()
         
         current = self.repo.active_branch
         new_branch = self.repo.create_head(branch_name)
@@ -27,6 +87,11 @@ class GitHubManager:
         
         return branch_name
 
+    def documentation_branch_name(self) -> str:
+        """Timestamped name for a new documentation branch."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{os.getenv('DOCSMITH_GITHUB_BRANCH_PREFIX', 'docs/update_')}{timestamp}"
+
     def commit_documentation(self, files: List[Dict[str, str]], message: str = None) -> str:
         """Commit documentation changes."""
         if message is None:
@@ -35,59 +100,226 @@ class GitHubManager:
         
         docs_dir = os.path.join(self.repo.working_dir, 
                                os.getenv('DOCSMITH_DOCS_PATH', 'docs/'))
-        os.makedirs(docs_dir, exist_ok=True)
         
+        docs = {}
         for file_info in files:
             original_path = file_info['file']
             relative_path = os.path.relpath(original_path, self.repo.working_dir)
             doc_path = os.path.join(docs_dir, f"{relative_path}.md")
-            
-            os.makedirs(os.path.dirname(doc_path), exist_ok=True)
-            
-            with open(doc_path, 'w') as f:
-                f.write(file_info['documentation'])
-            
-            self.repo.index.add([doc_path])
+            docs[os.path.relpath(doc_path, self.repo.working_dir)] = file_info['documentation']
         
-        if self.repo.is_dirty():
-            commit = self.repo.index.commit(message)
-            return commit.hexsha
+        # Unchanged files are skipped, so re-runs only touch what changed
+        changed = DocumentWriter(Path(self.repo.working_dir)).write_sync(docs)
+        if not changed:
+            return None
         
+        # One index update for all paths instead of a rewrite per file
+        self.repo.index.add(changed)
+        commit = self.repo.index.commit(message)
+        return commit.hexsha
+
+    def commit_documentation_tree(
+        self,
+        repo_path: str,
+        docs: Dict[str, Union[str, Path]],
+        branch: str,
+        base: str = None,
+        message: str = None
+    ) -> Optional[str]:
+        """
+        Commit documentation straight into the object database.
+
+        Blobs and a tree are built on top of the branch tip (or ``base`` for a
+        new branch) in a private index, and only the branch ref is moved. The
+        working tree, HEAD and the clone's own index are never touched, so
+        this works on bare and partial clones and concurrent jobs can share
+        one clone.
+
+        Args:
+            repo_path: Path to the clone (bare or not)
+            docs: Content keyed by repository-relative path; a Path value
+                is committed from that file, streamed rather than read in
+            branch: Branch to create or advance
+            base: Commit-ish new branches start from; defaults to the PR base branch
+            message: Commit message
+
+        Returns:
+            The new commit SHA, or None if the branch already has this content
+        """
+        repo = Repo(repo_path)
+        if message is None:
+            message = os.getenv('DOCSMITH_GITHUB_COMMIT_MESSAGE',
+                              'Update documentation\n\nAutomatically generated by DocSmith')
+        if base is None:
+            base = os.getenv('DOCSMITH_GITHUB_BASE_BRANCH', 'main')
+
+        ref = f"refs/heads/{branch}"
+        entries = "".join(
+            f"100644 {self._store_blob(repo, content)}\t{path}\n"
+            for path, content in sorted(docs.items())
+        )
+
+        for attempt in range(self.REF_UPDATE_RETRIES):
+            tip = self._resolve_ref(repo, ref)
+            parent = tip or self._base_commit(repo, base)
+            tree = self._write_tree(repo, parent, entries)
+            if tree == repo.commit(parent).tree.hexsha:
+                return None
+
+            commit = repo.git.commit_tree(tree, '-p', parent, '-m', message, env=self._identity_env(repo))
+            try:
+                # Compare-and-swap: fails if another job moved the ref meanwhile
+                repo.git.update_ref(ref, commit, tip or self.NULL_SHA)
+                return commit
+            except GitCommandError:
+                if attempt == self.REF_UPDATE_RETRIES - 1:
+                    raise
+                # Jitter so racing jobs don't collide again on the retry
+                time.sleep(random.uniform(0, 0.05 * (attempt + 1)))
+
         return None
 
-    def create_pull_request(self, title: str = None, body: str = None) -> Dict[str, Any]:
-        """Create pull request with documentation changes."""
+    def push_branch(self, repo_path: str, branch: str, remote: str = 'origin') -> None:
+        """Push a branch by ref, without needing it checked out."""
+        ref = f"refs/heads/{branch}"
+        Repo(repo_path).remote(remote).push(f"{ref}:{ref}").raise_if_error()
+
+    def stable_branch_name(self) -> str:
+        """Branch reused by every run in upsert mode."""
+        return os.getenv('DOCSMITH_GITHUB_BRANCH', 'docsmith/documentation')
+
+    def prepare_pr_branch(self, repo_path: str, docs: Dict[str, Union[str, Path]], message: str = None) -> Dict[str, Any]:
+        """
+        Commit docs to the stable branch, on top of DocSmith's open PR if there is one.
+
+        With an open PR the commit goes on its branch tip; otherwise the
+        branch restarts from the base branch, replacing whatever an old,
+        closed PR left there. Nothing is pushed when the tree is unchanged.
+        The branch stays locked from the reset through the push, so
+        concurrent jobs cannot reset it under each other's commits.
+
+        Returns:
+            {"branch", "commit", "changed", "pull"} where "pull" is the open
+            PR (or None) and "commit" is None when nothing changed
+        """
+        self._throttle()
+        repo = Repo(repo_path)
+        repo_name = self._get_repo_name(repo.remotes.origin.url)
+        # Lazy: listing pulls is the only call needed to find the PR
+        github_repo = self.github.get_repo(repo_name, lazy=True)
+        branch = self.stable_branch_name()
+        base = os.getenv('DOCSMITH_GITHUB_BASE_BRANCH', 'main')
+        ref = f"refs/heads/{branch}"
+
+        with self.clone_cache.branch_lock(repo_path, branch):
+            pull = self.find_open_pull_request(github_repo, repo_name.split('/')[0], branch, base)
+            remote_tip = self._resolve_ref(repo, f"refs/remotes/origin/{branch}")
+            # Start the local ref where this run should build: the PR's tip or the base
+            start = remote_tip if pull is not None and remote_tip else self._base_commit(repo, base)
+            # Compare-and-swap, in case anything outside the lock moved the ref
+            repo.git.update_ref(ref, start, self._resolve_ref(repo, ref) or self.NULL_SHA)
+
+            commit = self.commit_documentation_tree(repo_path, docs, branch, base, message)
+            if commit:
+                # Without an open PR the old branch history is discarded
+                force = '' if pull is not None else '+'
+                repo.remote('origin').push(f"{force}{ref}:{ref}").raise_if_error()
+
+        return {"branch": branch, "commit": commit, "changed": commit is not None, "pull": pull}
+
+    def find_open_pull_request(self, github_repo: Any, owner: str, branch: str, base: str) -> Any:
+        """DocSmith's open PR from ``branch`` into ``base``, if any."""
+        return next(iter(github_repo.get_pulls(state='open', head=f"{owner}:{branch}", base=base)), None)
+
+    def upsert_pull_request(
+        self,
+        repo_path: str,
+        prepared: Dict[str, Any],
+        title: str = None,
+        body: str = None
+    ) -> Dict[str, Any]:
+        """
+        Create the docs PR, or bring the open one up to date.
+
+        Title, body, labels and reviewers are only written when they differ
+        from what the PR already has; an unchanged tree makes no API calls.
+        """
+        pull = prepared["pull"]
+        if pull is not None and not prepared["changed"]:
+            return {"pr_number": pull.number, "pr_url": pull.html_url,
+                    "branch": prepared["branch"], "status": "unchanged"}
+        if pull is None and not prepared["changed"]:
+            return {"pr_number": None, "pr_url": None, "branch": prepared["branch"], "status": "unchanged"}
+
+        self._throttle()
+        title = title or os.getenv('DOCSMITH_GITHUB_PR_TITLE', 'Documentation Update')
+        body = body or os.getenv('DOCSMITH_GITHUB_PR_BODY', DEFAULT_PR_BODY)
+        labels, reviewers = self._pr_labels(), self._pr_reviewers()
+
+        if pull is None:
+            repo = Repo(repo_path)
+            github_repo = self.github.get_repo(self._get_repo_name(repo.remotes.origin.url), lazy=True)
+            pull = github_repo.create_pull(
+                title=title,
+                body=body,
+                head=prepared["branch"],
+                base=os.getenv('DOCSMITH_GITHUB_BASE_BRANCH', 'main'),
+                draft=os.getenv('DOCSMITH_GITHUB_PR_DRAFT', 'false').lower() == 'true'
+            )
+            status = "created"
+        else:
+            if (pull.title, pull.body or '') != (title, body):
+                pull.edit(title=title, body=body)
+            status = "updated"
+
+        # Only add what is missing; labels and reviewers people added stay
+        missing_labels = sorted(set(labels) - {label.name for label in pull.labels})
+        if missing_labels:
+            pull.add_to_labels(*missing_labels)
+
+        missing_reviewers = set(reviewers) - {user.login for user in pull.requested_reviewers}
+        if missing_reviewers and status == "updated":
+            # Reviewers who already reviewed are no longer "requested"
+            missing_reviewers -= self._reviewed_by(pull)
+        if missing_reviewers:
+            pull.create_review_request(reviewers=sorted(missing_reviewers))
+
+        return {"pr_number": pull.number, "pr_url": pull.html_url, "branch": prepared["branch"], "status": status}
+
+    def create_pull_request(
+        self,
+        title: str = None,
+        body: str = None,
+        branch: str = None,
+        repo_path: str = None
+    ) -> Dict[str, Any]:
+        """Create pull request with documentation changes.
+
+        ``branch`` and ``repo_path`` default to the branch checked out by
+        setup_documentation_branch.
+        """
+        self._throttle()
+        repo = Repo(repo_path) if repo_path else self.repo
+        branch = branch or repo.active_branch.name
         if title is None:
             title = os.getenv('DOCSMITH_GITHUB_PR_TITLE', 'Documentation Update')
         
         if body is None:
-            body = os.getenv('DOCSMITH_GITHUB_PR_BODY', '''
-## Documentation Update
-
-This PR contains automatically generated documentation updates from DocSmith.
-
-### Changes
-- Updated documentation files
-- Generated API references
-- Added usage examples
-- Updated setup instructions
-
-Please review the changes and ensure they meet the project's documentation standards.
-''')
+            body = os.getenv('DOCSMITH_GITHUB_PR_BODY', DEFAULT_PR_BODY)
         
-        remote_url = self.repo.remotes.origin.url
+        remote_url = repo.remotes.origin.url
         repo_name = self._get_repo_name(remote_url)
         github_repo = self.github.get_repo(repo_name)
         
         base_branch = os.getenv('DOCSMITH_GITHUB_BASE_BRANCH', 'main')
         draft = os.getenv('DOCSMITH_GITHUB_PR_DRAFT', 'false').lower() == 'true'
-        labels = os.getenv('DOCSMITH_GITHUB_PR_LABELS', 'documentation,automated').split(',')
-        reviewers = os.getenv('DOCSMITH_GITHUB_REVIEWERS', '').split(',')
+        labels = self._pr_labels()
+        reviewers = self._pr_reviewers()
         
         pr = github_repo.create_pull(
             title=title,
             body=body,
-            head=self.repo.active_branch.name,
+            head=branch,
             base=base_branch,
             draft=draft
         )
@@ -95,15 +327,85 @@ Please review the changes and ensure they meet the project's documentation stand
         if labels:
             pr.add_to_labels(*labels)
         
-        if reviewers and reviewers[0]:  # Only add reviewers if the list is not empty
+        if reviewers:
             pr.create_review_request(reviewers=reviewers)
         
         return {
             "pr_number": pr.number,
             "pr_url": pr.html_url,
-            "branch": self.repo.active_branch.name
+            "branch": branch
+        }
+
+    def _throttle(self) -> None:
+        """Pace API calls by the quota the shared GitHub layer has seen."""
+        if self.api is not None:
+            self.api.throttle()
+
+    def _reviewed_by(self, pull: Any) -> set:
+        """Logins that have reviewed a PR."""
+        if self.api is None:
+            return {review.user.login for review in pull.get_reviews() if review.user}
+        # Conditional and cached: unchanged reviews cost no quota on re-runs
+        reviews = self.api.paginate(f"{pull.url}/reviews")
+        return {review["user"]["login"] for review in reviews if review.get("user")}
+
+    def _pr_labels(self) -> List[str]:
+        labels = os.getenv('DOCSMITH_GITHUB_PR_LABELS', 'documentation,automated').split(',')
+        return [label.strip() for label in labels if label.strip()]
+
+    def _pr_reviewers(self) -> List[str]:
+        reviewers = os.getenv('DOCSMITH_GITHUB_REVIEWERS', '').split(',')
+        return [reviewer.strip() for reviewer in reviewers if reviewer.strip()]
+
+    def _store_blob(self, repo: Repo, content: Union[str, Path]) -> str:
+        if isinstance(content, Path):
+            with open(content, 'rb') as stream:
+                return repo.odb.store(IStream(Blob.type, os.fstat(stream.fileno()).st_size, stream)).hexsha.decode('ascii')
+        data = content.encode('utf-8')
+        return repo.odb.store(IStream(Blob.type, len(data), BytesIO(data))).hexsha.decode('ascii')
+
+    def _base_commit(self, repo: Repo, base: str) -> str:
+        """Resolve a base branch locally, or from origin in cached mirrors."""
+        commit = self._resolve_ref(repo, base) or self._resolve_ref(repo, f"refs/remotes/origin/{base}")
+        if not commit:
+            raise ValueError(f"Base branch not found: {base}")
+        return commit
+
+    def _resolve_ref(self, repo: Repo, ref: str) -> Optional[str]:
+        try:
+            return repo.git.rev_parse('--verify', '-q', f"{ref}^{{commit}}")
+        except GitCommandError:
+            return None
+
+    def _identity_env(self, repo: Repo) -> Dict[str, str]:
+        """Author/committer environment, resolved the way index.commit resolves it."""
+        reader = repo.config_reader()
+        author, committer = Actor.author(reader), Actor.committer(reader)
+        return {
+            **os.environ,
+            "GIT_AUTHOR_NAME": author.name,
+            "GIT_AUTHOR_EMAIL": author.email,
+            "GIT_COMMITTER_NAME": committer.name,
+            "GIT_COMMITTER_EMAIL": committer.email
         }
 
+    def _write_tree(self, repo: Repo, parent: str, entries: str) -> str:
+        """Build a tree from the parent's tree plus the given index entries."""
+        # A private index keeps concurrent jobs and the clone's own index apart
+        index_path = os.path.join(repo.git_dir, f"docsmith-index-{uuid.uuid4().hex}")
+        env = {**os.environ, "GIT_INDEX_FILE": index_path}
+        try:
+            repo.git.read_tree(parent, env=env)
+            with tempfile.TemporaryFile() as index_info:
+                index_info.write(entries.encode('utf-8'))
+                index_info.seek(0)
+                repo.git.update_index('--index-info', istream=index_info, env=env)
+            # Partial clones may lack untouched blobs; don't fetch them just to check
+            return repo.git.write_tree('--missing-ok', env=env)
+        finally:
+            if os.path.exists(index_path):
+                os.unlink(index_path)
+
     def _get_repo_name(self, remote_url: str) -> str:
         """Extract repository name from remote URL."""
         if remote_url.startswith('https'):
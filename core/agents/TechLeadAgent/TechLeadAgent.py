@@ -1,9 +1,19 @@
 from typing import Dict, Any, List
+import asyncio
+import hashlib
+from pathlib import Path
 from ...base import BaseAgent
 from ...utils.logging_config import setup_logger
 from ...utils.error_handler import retry_with_exponential_backoff
+from ...utils.blocking_io import blocking_io
 from ...workflows.workflow_coordinator import workflow_coordinator
+from ...llm.budget_planner import budget_planner
+from ...llm.context_builder import context_builder
+from ...llm.token_counter import truncate_to_token_limit
+from ....config.models import get_agent_model
+from ....config.settings import DOC_BUDGET_USD, DOC_BUDGET_TOKENS, SUMMARY_OUTPUT_TOKENS
 from .tools.repo_analyzer import RepoAnalyzer
+from .tools.tree_summarizer import TreeSummarizer
 
 logger = setup_logger(__name__)
 
@@ -31,23 +41,30 @@ class TechLeadAgent(BaseAgent):
     @retry_with_exponential_backoff()
     async def _document_repository(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Coordinate repository documentation process."""
-        # Analyze repository first
-        repo_analysis = await self._analyze_repository(task)
-
-        # Determine required documentation workflows
-        workflows = await self._plan_documentation_workflows(repo_analysis)
-
-        # Execute workflows in appropriate order
-        results = {}
-        for workflow in workflows:
-            workflow_id = await workflow_coordinator.start_workflow(
-                workflow["type"],
-                {**workflow["params"], "repo_analysis": repo_analysis}
-            )
-            results[workflow["type"]] = await self._monitor_workflow(workflow_id)
-
-        # Compile final documentation
-        return await self._compile_documentation(results)
+        try:
+            # Analyze repository first
+            repo_analysis = await self._analyze_repository(task)
+
+            # Determine required documentation workflows
+            workflows = await self._plan_documentation_workflows(repo_analysis)
+
+            # Execute workflows in appropriate order
+            results = {}
+            for workflow in workflows:
+                workflow_id = await workflow_coordinator.start_workflow(
+                    workflow["type"],
+                    {**workflow["params"], "repo_analysis": repo_analysis}
+                )
+                results[workflow["type"]] = await self._monitor_workflow(workflow_id)
+
+            # Compile final documentation
+            return await self._compile_documentation(results)
+        finally:
+            # Failed runs too: the clone cache never evicts a mirror that has worktrees
+            await self.agency.delegate("tech_lead", "github", {
+                "type": "release_repository",
+                "repo_url": task["repo_url"]
+            })
 
     async def _analyze_repository(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze repository structure and characteristics."""
@@ -55,14 +72,25 @@ class TechLeadAgent(BaseAgent):
             "type": "prepare_repository",
             "repo_url": task["repo_url"]
         })
+        # Scan the checkout for the files to document and their duplicates
+        scan = await blocking_io.run("disk", self.analyzer.analyze_repository, repo_info["path"])
+        repo_info = {**repo_info, **scan}
 
         analysis = await self.get_completion(
             "tech_lead",
             "analyze_repository",
-            repo_info=repo_info
+            repo_info=context_builder.build_repo_context(repo_info)
+        )
+
+        # Bound the documentation run by the configured budget
+        plan = budget_planner.plan(
+            repo_info.get("tasks", []),
+            get_agent_model("code_analysis").model,
+            budget_usd=task.get("budget_usd", DOC_BUDGET_USD),
+            token_budget=task.get("token_budget", DOC_BUDGET_TOKENS)
         )
 
-        return {**repo_info, "analysis": analysis}
+        return {**repo_info, "analysis": analysis, "plan": plan.to_dict()}
 
     async def _plan_documentation_workflows(
         self,
@@ -129,19 +157,81 @@ class TechLeadAgent(BaseAgent):
 
     @retry_with_exponential_backoff()
     async def _analyze_architecture(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze repository architecture."""
-        arch_analysis = await self.analyzer.analyze_architecture(
-            task["repo_path"]
+        """Analyze repository architecture from bottom-up directory summaries.
+
+        Only ``files`` (the planned or sampled selection) get leaf summaries.
+        Without it, every file in ``tasks`` (or a fresh scan) is summarized,
+        except duplicates, which would only repeat their original's summary.
+        """
+        repo_path = Path(task["repo_path"])
+        file_paths = task.get("files")
+        if file_paths is None:
+            tasks = task.get("tasks")
+            if tasks is None:
+                tasks = (await blocking_io.run("disk", self.analyzer.analyze_repository, str(repo_path)))["tasks"]
+            file_paths = [file_task["file_path"] for file_task in tasks if "duplicate_of" not in file_task]
+
+        files = dict(zip(file_paths, await asyncio.gather(*[
+            blocking_io.run("disk", self._hash_file, repo_path / file_path)
+            for file_path in file_paths
+        ])))
+
+        async def summarize_file(path: str) -> str:
+            code = await blocking_io.run(
+                "disk", (repo_path / path).read_text, encoding="utf-8", errors="replace"
+            )
+            return await self.get_completion(
+                "architecture",
+                "summarize_file",
+                max_output_tokens=SUMMARY_OUTPUT_TOKENS,
+                path=path,
+                code=truncate_to_token_limit(
+                    code, self.model_config.model, self.model_config.max_tokens // 2
+                )
+            )
+
+        async def summarize_directory(path: str, children: Dict[str, str]) -> str:
+            return await self.get_completion(
+                "architecture",
+                "summarize_directory",
+                max_output_tokens=SUMMARY_OUTPUT_TOKENS,
+                path=path,
+                children="\n".join(f"- {name}: {summary}" for name, summary in sorted(children.items()))
+            )
+
+        summarizer = TreeSummarizer(summarize_file, summarize_directory)
+        summaries = await summarizer.summarize(files)
+        logger.info(
+            f"Directory summaries: {summarizer.stats['generated']} generated, "
+            f"{summarizer.stats['cached']} reused from cache"
         )
 
-        # Enhance analysis with LLM insights
-        enhanced_analysis = await self.get_completion(
-            "tech_lead",
-            "analyze_architecture",
-            analysis=arch_analysis
+        # Describe the system from the top-level summaries only
+        top_level = {
+            path: summary for path, summary in summaries.items()
+            if path and "/" not in path
+        }
+        overview = await self.get_completion(
+            "architecture",
+            "system_overview",
+            components="\n".join(
+                [f"Repository: {summaries[TreeSummarizer.ROOT]}"] +
+                [f"- {path}: {summary}" for path, summary in sorted(top_level.items())]
+            )
         )
 
-        return enhanced_analysis
+        return {
+            "overview": overview,
+            "components": [
+                {"name": path, "description": summary}
+                for path, summary in sorted(top_level.items())
+            ],
+            "summaries": summaries
+        }
+
+    def _hash_file(self, path: Path) -> str:
+        """Content hash of a file, used to key its cached summary."""
+        return hashlib.sha256(path.read_bytes()).hexdigest()
 
     async def _review_documentation_plan(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Review and validate documentation plan."""
@@ -0,0 +1,139 @@
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Optional
+
+@dataclass
+class FileClassification:
+    action: str  # "keep", "downgrade" or "skip"
+    reason: Optional[str] = None
+    encoding: Optional[str] = None
+
+class FileClassifier:
+    """Tool for spotting binary, minified, generated and vendored files.
+
+    Only the first few KB of each file are read, so classification is cheap
+    enough to run on every file during a repository scan.
+    """
+
+    SNIFF_BYTES = 8192
+    MAX_LINE_LENGTH = 1000
+    MAX_AVERAGE_LINE_LENGTH = 200
+    # Bits per character; hand-written code sits around 4.5-5.2
+    MAX_ENTROPY = 5.8
+    HEADER_LINES = 15
+    COMMENT_PREFIXES = ('#', '//', '/*', '*', '<!--', '--', ';')
+
+    VENDOR_DIRS = {
+        'vendor', 'vendors', 'third_party', 'third-party', 'thirdparty',
+        'node_modules', 'bower_components', 'external', 'externals',
+        'site-packages', '.venv', 'venv', 'Pods', 'Carthage'
+    }
+    GENERATED_NAMES = {
+        'minified': ['*.min.js', '*.min.css', '*.bundle.js', '*.chunk.js', '*-min.js'],
+        'lockfile': ['package-lock.json', 'yarn.lock', 'pnpm-lock.yaml', 'poetry.lock',
+                     'Pipfile.lock', 'composer.lock', 'Gemfile.lock', 'Cargo.lock', '*.lock'],
+        'generated': ['*_pb2.py', '*_pb2_grpc.py', '*.pb.go', '*_pb.js', '*_pb.d.ts',
+                      '*.pb.ts', '*_grpc_pb.js', '*.generated.*', '*.g.dart', '*.designer.cs',
+                      '*.map']
+    }
+    GENERATED_MARKER = re.compile(
+        r'@generated|do not edit|auto-?generated|automatically generated|'
+        r'generated by (?:the )?[\w\- ]+|this file (?:was|is) generated|'
+        r'openapi generator|swagger codegen|protoc-gen|code generated .* do not edit',
+        re.IGNORECASE
+    )
+
+    def classify_file(self, file_path: Path, relative_path: str) -> FileClassification:
+        """Classify a file on disk, reading only its first few KB."""
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(self.SNIFF_BYTES)
+        except OSError:
+            return FileClassification("skip", "unreadable")
+        return self.classify(relative_path, head)
+
+    def classify(self, path: str, head: Optional[bytes] = None) -> FileClassification:
+        """
+        Classify a file from its path and, when available, its leading bytes.
+
+        Args:
+            path: Repository-relative path
+            head: First bytes of the file; path-only checks run when omitted
+        """
+        name = path.replace('\\', '/').rsplit('/', 1)[-1]
+        for reason, patterns in self.GENERATED_NAMES.items():
+            if any(fnmatch(name, pattern) for pattern in patterns):
+                return FileClassification("skip", reason)
+
+        parts = path.replace('\\', '/').split('/')[:-1]
+        if any(part in self.VENDOR_DIRS for part in parts):
+            return FileClassification("downgrade", "vendored")
+
+        if head is None:
+            return FileClassification("keep")
+
+        if b'\0' in head and not head.startswith((b'\xff\xfe', b'\xfe\xff')):
+            return FileClassification("skip", "binary")
+
+        text, encoding = self._decode(head)
+        if text is None:
+            return FileClassification("skip", "binary")
+
+        # Markers only count in comments, not in prose that mentions generation
+        header = '\n'.join(
+            line for line in text.splitlines()[:self.HEADER_LINES]
+            if line.lstrip().startswith(self.COMMENT_PREFIXES)
+        )
+        if self.GENERATED_MARKER.search(header):
+            return FileClassification("skip", "generated", encoding)
+
+        lines = text.splitlines() or ['']
+        # The sniffed chunk may end mid-line, so only judge complete lines
+        complete = lines[:-1] if len(head) == self.SNIFF_BYTES and len(lines) > 1 else lines
+        longest = max(len(line) for line in complete)
+        average = sum(len(line) for line in complete) / len(complete)
+        if longest > self.MAX_LINE_LENGTH or average > self.MAX_AVERAGE_LINE_LENGTH:
+            return FileClassification("skip", "minified", encoding)
+        if len(head) == self.SNIFF_BYTES and len(lines) == 1:
+            return FileClassification("skip", "minified", encoding)
+
+        if self._entropy(text) > self.MAX_ENTROPY:
+            return FileClassification("skip", "high_entropy", encoding)
+
+        return FileClassification("keep", encoding=encoding)
+
+    def _decode(self, head: bytes):
+        """Decode sniffed bytes, returning (text, encoding) or (None, None)."""
+        if head.startswith((b'\xff\xfe', b'\xfe\xff')):
+            candidates = ['utf-16']
+        else:
+            candidates = ['utf-8', 'cp1252']
+
+        for encoding in candidates:
+            try:
+                text = head.decode(encoding)
+            except UnicodeDecodeError as e:
+                # A multi-byte character cut off by the sniff window is fine
+                if encoding == 'utf-8' and e.start >= len(head) - 3:
+                    return head[:e.start].decode(encoding), encoding
+                continue
+
+            # Mostly control characters means binary data in disguise
+            control = sum(1 for c in text if ord(c) < 32 and c not in '\n\r\t\f')
+            if control > len(text) * 0.05:
+                return None, None
+            return text, encoding
+
+        return None, None
+
+    def _entropy(self, text: str) -> float:
+        """Shannon entropy of the text in bits per character."""
+        if not text:
+            return 0.0
+        counts = Counter(text)
+        total = len(text)
+        return -sum(n / total * math.log2(n / total) for n in counts.values())
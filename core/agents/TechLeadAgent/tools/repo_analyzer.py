@@ -1,17 +1,19 @@
-from github import Github
 from typing import Dict, List, Any
 import os
 from fnmatch import fnmatch
 from pathlib import Path
+from ....llm.token_counter import estimate_tokens_from_char_length
+from ....utils.duplicate_detector import DuplicateDetector
+from ....utils.github_api import shared_github_api
+from .file_classifier import FileClassifier
 
 class RepoAnalyzer:
-    """Tool for analyzing repository structure and content using GitHub API."""
+    """Tool for analyzing repository structure and content, locally or through the GitHub API."""
     
     def __init__(self, github_token: str = None):
-        self.github_token = github_token or os.getenv('GITHUB_TOKEN')
-        if not self.github_token:
-            raise ValueError("GitHub token not provided and GITHUB_TOKEN env var not set")
-        self.github = Github(self.github_token)
+        # Shares its connection pool, response cache and quota with GitHubManager
+        self.api = shared_github_api(github_token)
+        self.classifier = FileClassifier()
 
     def analyze_repository(self, repo_path_or_url: str) -> Dict[str, Any]:
         """
@@ -21,7 +23,8 @@ class RepoAnalyzer:
             repo_path_or_url: Local path or GitHub URL of the repository
             
         Returns:
-            Dict containing repository structure and tasks
+            Dict containing repository structure, tasks and duplicates, which
+            maps each duplicate file to its {"duplicate_of", "similarity"}
         """
         if repo_path_or_url.startswith(('http://', 'https://', 'git@')):
             return self._analyze_remote_repo(repo_path_or_url)
@@ -37,53 +40,109 @@ class RepoAnalyzer:
             parts = repo_url.split('/')[-2:]
         owner, repo_name = parts
 
-        repo = self.github.get_repo(f"{owner}/{repo_name}")
-        contents = repo.get_contents("")
+        repo = self.api.get(f"/repos/{owner}/{repo_name}")
+        branch = repo["default_branch"]
         structure = {}
         tasks = []
+        report = {"skipped": {}, "downgraded": {}}
+        # Contents aren't downloaded, so only identical blobs are grouped
+        duplicates = DuplicateDetector()
 
-        while contents:
-            file_content = contents.pop(0)
-            if file_content.type == "dir":
-                contents.extend(repo.get_contents(file_content.path))
-            else:
-                if self._should_document(file_content.path):
-                    relative_path = file_content.path
-                    self._add_to_structure(structure, relative_path)
-                    tasks.append({
-                        "type": "documentation",
-                        "file_path": relative_path,
-                        "priority": self._calculate_priority(relative_path),
-                        "url": file_content.html_url,
-                        "sha": file_content.sha
-                    })
+        for entry in self._list_tree(f"/repos/{owner}/{repo_name}", branch):
+            if entry["type"] != "blob" or not self._should_document(entry["path"]):
+                continue
+            relative_path = entry["path"]
+            # Contents aren't downloaded here, so only path checks apply
+            classification = self.classifier.classify(relative_path)
+            if not self._record_classification(report, relative_path, classification):
+                continue
+            self._add_to_structure(structure, relative_path)
+            tasks.append({
+                "type": "documentation",
+                "file_path": relative_path,
+                "priority": self._classified_priority(relative_path, classification),
+                "url": f"{repo['html_url']}/blob/{branch}/{relative_path}",
+                "sha": entry["sha"],
+                "size": entry.get("size", 0),
+                "estimated_tokens": estimate_tokens_from_char_length(entry.get("size", 0)),
+                **(duplicates.add_exact(relative_path, entry["sha"]) or {})
+            })
 
         return {
             "structure": structure,
-            "tasks": sorted(tasks, key=lambda x: x['priority'], reverse=True)
+            "tasks": sorted(tasks, key=lambda x: x['priority'], reverse=True),
+            "classification": report,
+            "duplicates": duplicates.by_path()
         }
 
+    def _list_tree(self, repo_api: str, tree: str, prefix: str = "") -> List[Dict[str, Any]]:
+        """
+        List every entry under a tree with the git trees API.
+
+        One request covers the whole repository unless GitHub truncates the
+        listing; then each subtree is listed on its own.
+        """
+        listing = self.api.get(f"{repo_api}/git/trees/{tree}", {"recursive": 1})
+        if not listing.get("truncated"):
+            return [{**entry, "path": prefix + entry["path"]} for entry in listing["tree"]]
+
+        entries = []
+        for entry in self.api.get(f"{repo_api}/git/trees/{tree}")["tree"]:
+            if entry["type"] == "tree":
+                entries.extend(self._list_tree(repo_api, entry["sha"], f"{prefix}{entry['path']}/"))
+            else:
+                entries.append({**entry, "path": prefix + entry["path"]})
+        return entries
+
     def _analyze_local_repo(self, repo_path: str) -> Dict[str, Any]:
         """Analyze a local repository."""
         structure = {}
         tasks = []
+        report = {"skipped": {}, "downgraded": {}}
+        duplicates = DuplicateDetector()
         repo_path = Path(repo_path)
 
         for filepath in repo_path.rglob('*'):
             if filepath.is_file() and self._should_document(filepath.name):
                 relative_path = str(filepath.relative_to(repo_path))
+                classification = self.classifier.classify_file(filepath, relative_path)
+                if not self._record_classification(report, relative_path, classification):
+                    continue
+                size = filepath.stat().st_size
+                text = filepath.read_text(encoding=classification.encoding or 'utf-8', errors='replace')
                 self._add_to_structure(structure, relative_path)
                 tasks.append({
                     "type": "documentation",
                     "file_path": relative_path,
-                    "priority": self._calculate_priority(relative_path)
+                    "priority": self._classified_priority(relative_path, classification),
+                    "size": size,
+                    "estimated_tokens": estimate_tokens_from_char_length(size),
+                    # Copies carry "duplicate_of" and reuse their representative's docs
+                    **(duplicates.add(relative_path, text) or {})
                 })
 
         return {
             "structure": structure,
-            "tasks": sorted(tasks, key=lambda x: x['priority'], reverse=True)
+            "tasks": sorted(tasks, key=lambda x: x['priority'], reverse=True),
+            "classification": report,
+            "duplicates": duplicates.by_path()
         }
 
+    def _record_classification(self, report: Dict, path: str, classification) -> bool:
+        """Record a skipped or downgraded file; returns whether to keep it."""
+        if classification.action == "skip":
+            report["skipped"].setdefault(classification.reason, []).append(path)
+            return False
+        if classification.action == "downgrade":
+            report["downgraded"].setdefault(classification.reason, []).append(path)
+        return True
+
+    def _classified_priority(self, path: str, classification) -> int:
+        """Downgraded files (e.g. vendored code) sink to the lowest priority."""
+        if classification.action == "downgrade":
+            return 0
+        return self._calculate_priority(path)
+
     def _should_document(self, filename: str) -> bool:
         """Check if file should be documented."""
         include_patterns = os.getenv('DOCSMITH_INCLUDE_PATTERNS', '*.py,*.js,*.ts,*.jsx,*.tsx').split(',')
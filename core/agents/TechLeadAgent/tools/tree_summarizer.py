@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+import posixpath
+from typing import Dict, List, Any, Callable, Awaitable
+from ....utils.cache.cache_manager import CacheManager
+from .....config.settings import CACHE_DIR, MAX_CONCURRENT_TASKS
+
+FileSummarizer = Callable[[str], Awaitable[str]]
+DirectorySummarizer = Callable[[str, Dict[str, str]], Awaitable[str]]
+
+class TreeSummarizer:
+    """Tool for bottom-up, cached summarization of a repository tree.
+
+    Files are summarized first, then every directory is summarized from its
+    children's summaries, deepest level first. Summaries are cached by
+    content: a file by its content hash, a directory by a hash of its
+    children's summaries, so an edit only re-summarizes its ancestor chain.
+    """
+
+    ROOT = ""
+
+    def __init__(
+        self,
+        summarize_file: FileSummarizer,
+        summarize_directory: DirectorySummarizer,
+        cache: CacheManager = None,
+        max_concurrency: int = MAX_CONCURRENT_TASKS
+    ):
+        self.summarize_file = summarize_file
+        self.summarize_directory = summarize_directory
+        # Summaries are keyed by content, so they never go stale
+        self.cache = cache or CacheManager(CACHE_DIR / "summaries", ttl=0)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.stats = {"cached": 0, "generated": 0}
+
+    async def summarize(self, files: Dict[str, str]) -> Dict[str, str]:
+        """
+        Summarize a repository tree.
+
+        Args:
+            files: Mapping of relative file path to content hash
+
+        Returns:
+            Summaries for every file and directory; the root is keyed by ""
+        """
+        summaries: Dict[str, str] = {}
+        children = self._build_tree(files)
+
+        file_results = await asyncio.gather(*[
+            self._summarize_file(path, digest) for path, digest in files.items()
+        ])
+        summaries.update(zip(files, file_results))
+
+        # Each directory level only depends on the level below it
+        for level in self._levels(children):
+            results = await asyncio.gather(*[
+                self._summarize_directory(directory, {
+                    posixpath.basename(child): summaries[child]
+                    for child in children[directory]
+                })
+                for directory in level
+            ])
+            summaries.update(zip(level, results))
+
+        return summaries
+
+    async def _summarize_file(self, path: str, digest: str) -> str:
+        """Summarize one file, reusing the cached summary for unchanged content."""
+        return await self._cached(
+            f"file_summary:{path}:{digest}",
+            lambda: self.summarize_file(path)
+        )
+
+    async def _summarize_directory(self, path: str, child_summaries: Dict[str, str]) -> str:
+        """Summarize one directory from its children's summaries."""
+        digest = hashlib.sha256()
+        for name in sorted(child_summaries):
+            digest.update(name.encode())
+            digest.update(b"\0")
+            digest.update(child_summaries[name].encode())
+            digest.update(b"\0")
+
+        return await self._cached(
+            f"dir_summary:{path}:{digest.hexdigest()}",
+            lambda: self.summarize_directory(path or ".", child_summaries)
+        )
+
+    async def _cached(self, key: str, produce: Callable[[], Awaitable[str]]) -> str:
+        cached = await self.cache.aget(key)
+        if cached is not None:
+            self.stats["cached"] += 1
+            return cached
+
+        async with self.semaphore:
+            summary = await produce()
+
+        await self.cache.aset(key, summary)
+        self.stats["generated"] += 1
+        return summary
+
+    def _build_tree(self, files: Dict[str, str]) -> Dict[str, List[str]]:
+        """Map every directory (including the root) to its direct children."""
+        children: Dict[str, List[str]] = {self.ROOT: []}
+
+        for path in sorted(files):
+            child = path
+            parent = posixpath.dirname(path)
+            while True:
+                is_new_parent = parent not in children
+                siblings = children.setdefault(parent, [])
+                if child not in siblings:
+                    siblings.append(child)
+                if parent == self.ROOT or not is_new_parent:
+                    break
+                child, parent = parent, posixpath.dirname(parent)
+
+        return children
+
+    def _levels(self, children: Dict[str, List[str]]) -> List[List[str]]:
+        """Group directories by depth, deepest first."""
+        by_depth: Dict[int, List[str]] = {}
+        for directory in children:
+            depth = directory.count("/") + 1 if directory else 0
+            by_depth.setdefault(depth, []).append(directory)
+        return [by_depth[depth] for depth in sorted(by_depth, reverse=True)]
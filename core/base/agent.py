@@ -1,9 +1,9 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from abc import ABC, abstractmethod
 import asyncio
 from ..llm.openai_client import openai_client
 from ..utils.logging_config import setup_logger
-from ...config.models import get_agent_model
+from ...config.models import get_agent_model, get_model_cascade
 from ...config.prompts.base_prompts import load_prompt_template
 
 logger = setup_logger(__name__)
@@ -14,6 +14,7 @@ class BaseAgent(ABC):
     def __init__(self, agent_type: str):
         self.agent_type = agent_type
         self.model_config = get_agent_model(agent_type)
+        self.model_cascade = get_model_cascade(agent_type)
         self.state: Dict[str, Any] = {}
         self.task_history: List[Dict[str, Any]] = []
         
@@ -47,16 +48,37 @@ class BaseAgent(ABC):
         self,
         prompt_type: str,
         prompt_name: str,
+        escalate: bool = False,
+        validator: Optional[Callable] = None,
+        complexity: Optional[int] = None,
+        max_output_tokens: Optional[int] = None,
         **kwargs: Any
     ) -> str:
-        """Get a completion using the agent's configured model."""
+        """Get a completion using the agent's configured model.
+
+        Agents with a model cascade try the cheapest model first; ``escalate``,
+        ``validator`` and ``complexity`` control when the stronger model is used.
+        ``max_output_tokens`` caps the response, e.g. at a budget plan's allowance.
+        """
         prompt_template = load_prompt_template(prompt_type, prompt_name)
         prompt = prompt_template.format(**kwargs)
         
-        response = await openai_client.get_completion(
-            prompt=prompt,
-            model_config=self.model_config
-        )
+        if len(self.model_cascade) > 1:
+            response = await openai_client.get_routed_completion(
+                prompt=prompt,
+                route=f"{self.agent_type}.{prompt_name}",
+                cascade=self.model_cascade,
+                validator=validator,
+                complexity=complexity,
+                escalate=escalate,
+                max_output_tokens=max_output_tokens
+            )
+        else:
+            response = await openai_client.get_completion(
+                prompt=prompt,
+                model_config=self.model_config,
+                max_output_tokens=max_output_tokens
+            )
         
         return response.choices[0].message.content
         
@@ -0,0 +1,279 @@
+from typing import Dict, List, Any, Callable, Optional, Tuple
+import math
+import posixpath
+from dataclasses import dataclass, field, asdict
+from ..utils.logging_config import setup_logger
+from .cost_calculator import calculate_cost
+from ...config.settings import (
+    MAX_TOKENS_PER_REQUEST,
+    BUDGET_OUTPUT_RATIO,
+    PROMPT_OVERHEAD_TOKENS,
+    MIN_OUTPUT_TOKENS,
+    SUMMARY_OUTPUT_TOKENS,
+    PLAN_RESERVED_REQUESTS,
+    PLAN_RESERVED_REQUEST_TOKENS
+)
+
+logger = setup_logger(__name__)
+
+# Upper bound on DP table cells (items x capacity buckets) before falling
+# back to the greedy density heuristic
+KNAPSACK_MAX_CELLS = 5_000_000
+KNAPSACK_RESOLUTION = 2000
+# Dollar budgets are planned in integer micro-dollars
+MICRODOLLARS = 1_000_000
+
+@dataclass
+class FileAllocation:
+    file_path: str
+    priority: int
+    input_tokens: int  # Prompt allowance, including template overhead
+    output_tokens: int  # Completion allowance
+    # The file's architecture summary request, and its line in the parent directory's
+    summary_input_tokens: int = 0
+    summary_output_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens + self.summary_input_tokens + self.summary_output_tokens
+
+    def cost(self, model: str) -> float:
+        return calculate_cost(
+            self.input_tokens + self.summary_input_tokens, model, self.output_tokens + self.summary_output_tokens
+        )
+
+@dataclass
+class DocumentationPlan:
+    model: str
+    token_budget: Optional[int]
+    budget_usd: Optional[float] = None
+    files: List[FileAllocation] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    # Set aside for requests made once per run rather than per file
+    reserved_input_tokens: int = 0
+    reserved_output_tokens: int = 0
+
+    @property
+    def planned_tokens(self) -> int:
+        return sum(f.total_tokens for f in self.files) + self.reserved_input_tokens + self.reserved_output_tokens
+
+    @property
+    def estimated_cost(self) -> float:
+        return sum(f.cost(self.model) for f in self.files) + calculate_cost(
+            self.reserved_input_tokens, self.model, self.reserved_output_tokens
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "token_budget": self.token_budget,
+            "budget_usd": self.budget_usd,
+            "planned_tokens": self.planned_tokens,
+            "estimated_cost": self.estimated_cost,
+            "reserved_tokens": self.reserved_input_tokens + self.reserved_output_tokens,
+            "files": [asdict(f) for f in self.files],
+            "skipped": self.skipped
+        }
+
+class BudgetPlanner:
+    """Selects and orders files to document within a dollar or token budget."""
+
+    def __init__(
+        self,
+        output_ratio: float = BUDGET_OUTPUT_RATIO,
+        prompt_overhead: int = PROMPT_OVERHEAD_TOKENS,
+        min_output_tokens: int = MIN_OUTPUT_TOKENS,
+        max_request_tokens: int = MAX_TOKENS_PER_REQUEST
+    ):
+        if not 0 < output_ratio < 1:
+            raise ValueError(f"output_ratio must be between 0 and 1: {output_ratio}")
+        self.output_ratio = output_ratio
+        self.prompt_overhead = prompt_overhead
+        self.min_output_tokens = min_output_tokens
+        self.max_request_tokens = max_request_tokens
+
+    def plan(
+        self,
+        tasks: List[Dict[str, Any]],
+        model: str,
+        budget_usd: Optional[float] = None,
+        token_budget: Optional[int] = None
+    ) -> DocumentationPlan:
+        """Plan which files to document and how many tokens each may use.
+
+        Each task needs a ``file_path`` and ``estimated_tokens``; ``priority``
+        defaults to 0. Without a budget every file is selected. A file's cost
+        covers its analysis and its architecture summary; the directory
+        summaries and the once-per-run requests are set aside first.
+        """
+        allocations = [self._allocate(task) for task in tasks]
+        reserved_input, reserved_output = self._reserve(tasks)
+
+        # Each budget is a (weight, capacity) constraint. Dollars are priced
+        # per file, since MIN_OUTPUT_TOKENS skews the input/output mix away
+        # from any fixed ratio a token limit could be derived from.
+        constraints: List[Tuple[Callable[[FileAllocation], int], int]] = []
+        if budget_usd is not None:
+            reserved = math.ceil(calculate_cost(reserved_input, model, reserved_output) * MICRODOLLARS)
+            constraints.append((
+                lambda a: math.ceil(a.cost(model) * MICRODOLLARS),
+                max(0, int(budget_usd * MICRODOLLARS) - reserved)
+            ))
+        if token_budget is not None:
+            constraints.append((lambda a: a.total_tokens, max(0, token_budget - reserved_input - reserved_output)))
+        if any(capacity == 0 for _, capacity in constraints):
+            logger.warning("Budget does not cover the fixed per-run requests; no files planned")
+
+        selected = allocations
+        over = [c for c in constraints if sum(c[0](a) for a in allocations) > c[1]]
+        if over:
+            # Optimize for the tightest budget, then trim to fit the others
+            over.sort(key=lambda c: sum(c[0](a) for a in allocations) / max(c[1], 1), reverse=True)
+            weight, capacity = over[0]
+            selected = self._trim(self._select(allocations, weight, capacity), over[1:])
+
+        selected_paths = {a.file_path for a in selected}
+        plan = DocumentationPlan(
+            model=model,
+            token_budget=token_budget,
+            budget_usd=budget_usd,
+            files=sorted(selected, key=lambda a: (-a.priority, a.file_path)),
+            skipped=[a.file_path for a in allocations if a.file_path not in selected_paths],
+            reserved_input_tokens=reserved_input,
+            reserved_output_tokens=reserved_output
+        )
+
+        logger.info(
+            f"Planned {len(plan.files)}/{len(allocations)} files using "
+            f"{plan.planned_tokens} tokens (est. ${plan.estimated_cost:.4f})"
+        )
+        return plan
+
+    def _allocate(self, task: Dict[str, Any]) -> FileAllocation:
+        """Assign prompt and output allowances for a single file."""
+        max_output = self.max_request_tokens // 2
+        max_input = self.max_request_tokens - max_output
+
+        input_tokens = min(
+            int(task.get("estimated_tokens", 0)) + self.prompt_overhead,
+            max_input
+        )
+        output_tokens = round(input_tokens * self.output_ratio / (1 - self.output_ratio))
+        output_tokens = max(self.min_output_tokens, min(output_tokens, max_output))
+
+        return FileAllocation(
+            file_path=task["file_path"],
+            priority=int(task.get("priority", 0)),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            summary_input_tokens=input_tokens + SUMMARY_OUTPUT_TOKENS,
+            summary_output_tokens=SUMMARY_OUTPUT_TOKENS
+        )
+
+    def _reserve(self, tasks: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Prompt and completion tokens for requests that are not per file.
+
+        Directory summaries are counted for every directory any task is in,
+        which bounds them whichever files are selected.
+        """
+        directories = {""}
+        for task in tasks:
+            parent = posixpath.dirname(task["file_path"])
+            while parent and parent not in directories:
+                directories.add(parent)
+                parent = posixpath.dirname(parent)
+
+        request_output = round(PLAN_RESERVED_REQUEST_TOKENS * self.output_ratio)
+        input_tokens = (
+            PLAN_RESERVED_REQUESTS * (PLAN_RESERVED_REQUEST_TOKENS - request_output) +
+            len(directories) * (self.prompt_overhead + SUMMARY_OUTPUT_TOKENS)
+        )
+        output_tokens = PLAN_RESERVED_REQUESTS * request_output + len(directories) * SUMMARY_OUTPUT_TOKENS
+        return input_tokens, output_tokens
+
+    def _select(
+        self,
+        allocations: List[FileAllocation],
+        weight: Callable[[FileAllocation], int],
+        budget: int
+    ) -> List[FileAllocation]:
+        """Select the highest-priority subset of files whose weights fit the budget."""
+        candidates = [a for a in allocations if weight(a) <= budget]
+        if not candidates:
+            return []
+
+        if len(candidates) * KNAPSACK_RESOLUTION <= KNAPSACK_MAX_CELLS:
+            return self._select_knapsack(candidates, weight, budget)
+        return self._select_greedy(candidates, weight, budget)
+
+    def _select_knapsack(
+        self,
+        candidates: List[FileAllocation],
+        weight: Callable[[FileAllocation], int],
+        budget: int
+    ) -> List[FileAllocation]:
+        """0/1 knapsack over priority (value) and token or dollar cost (weight)."""
+        # Bucket weights so the table stays small; rounding up keeps the
+        # selection within budget
+        unit = max(1, math.ceil(budget / KNAPSACK_RESOLUTION))
+        capacity = budget // unit
+        weights = [math.ceil(weight(a) / unit) for a in candidates]
+        # Every file is worth documenting, so shift priorities to be positive
+        values = [a.priority + 1 for a in candidates]
+
+        best = [0] * (capacity + 1)
+        taken = []
+        for weight, value in zip(weights, values):
+            row = bytearray(capacity + 1)
+            for c in range(capacity, weight - 1, -1):
+                candidate_value = best[c - weight] + value
+                if candidate_value > best[c]:
+                    best[c] = candidate_value
+                    row[c] = 1
+            taken.append(row)
+
+        selected = []
+        c = capacity
+        for i in range(len(candidates) - 1, -1, -1):
+            if taken[i][c]:
+                selected.append(candidates[i])
+                c -= weights[i]
+
+        return selected
+
+    def _select_greedy(
+        self,
+        candidates: List[FileAllocation],
+        weight: Callable[[FileAllocation], int],
+        budget: int
+    ) -> List[FileAllocation]:
+        """Greedy selection by priority per unit of cost for very large repositories."""
+        ranked = sorted(candidates, key=lambda a: self._density(a, weight), reverse=True)
+
+        selected = []
+        remaining = budget
+        for allocation in ranked:
+            if weight(allocation) <= remaining:
+                selected.append(allocation)
+                remaining -= weight(allocation)
+
+        return selected
+
+    def _trim(
+        self,
+        selected: List[FileAllocation],
+        constraints: List[Tuple[Callable[[FileAllocation], int], int]]
+    ) -> List[FileAllocation]:
+        """Drop the least valuable files per unit of cost until every budget holds."""
+        for weight, budget in constraints:
+            selected = sorted(selected, key=lambda a: self._density(a, weight), reverse=True)
+            total = sum(weight(a) for a in selected)
+            while selected and total > budget:
+                total -= weight(selected.pop())
+        return selected
+
+    def _density(self, allocation: FileAllocation, weight: Callable[[FileAllocation], int]) -> Tuple[float, int]:
+        return (allocation.priority + 1) / max(weight(allocation), 1), allocation.priority
+
+# Create singleton instance
+budget_planner = BudgetPlanner()
@@ -0,0 +1,187 @@
+from typing import Dict, List, Any, Optional
+import json
+from dataclasses import dataclass
+from ..utils.logging_config import setup_logger
+from .token_counter import count_tokens, truncate_to_token_limit
+from ...config.settings import REPO_CONTEXT_TOKENS
+
+logger = setup_logger(__name__)
+
+# Keys that carry raw file contents and never belong in a summary prompt
+OMITTED_KEYS = {"code", "content", "contents", "raw", "html_url", "url", "sha"}
+TRUNCATION_MARKER = "\n... (truncated)"
+
+@dataclass
+class ContextField:
+    name: str
+    value: Any
+    priority: int  # Higher priority fields are shrunk last
+    budget: int  # Token budget for this field on its own
+
+class ContextBuilder:
+    """Builds compact, token-budgeted prompt context from repository data."""
+
+    def __init__(
+        self,
+        model: str = "gpt-4-turbo-preview",
+        total_budget: int = REPO_CONTEXT_TOKENS
+    ):
+        self.model = model
+        self.total_budget = total_budget
+
+    def build(
+        self,
+        fields: List[ContextField],
+        total_budget: Optional[int] = None
+    ) -> str:
+        """Serialize fields within their own budgets and the overall budget."""
+        total_budget = total_budget or self.total_budget
+        rendered: Dict[str, str] = {}
+        tokens: Dict[str, int] = {}
+
+        for field in fields:
+            if field.value in (None, "", [], {}):
+                continue
+            text = self._fit(field.name, field.value, field.budget)
+            rendered[field.name] = text
+            tokens[field.name] = count_tokens(text, self.model)
+
+        # Shrink the lowest-priority fields first until everything fits
+        overflow = sum(tokens.values()) - total_budget
+        for field in sorted(fields, key=lambda f: f.priority):
+            if overflow <= 0:
+                break
+            if field.name not in rendered:
+                continue
+
+            target = tokens[field.name] - overflow
+            if target < 20:
+                overflow -= tokens.pop(field.name)
+                del rendered[field.name]
+                continue
+
+            text = self._fit(field.name, field.value, target)
+            new_tokens = count_tokens(text, self.model)
+            overflow -= tokens[field.name] - new_tokens
+            rendered[field.name] = text
+            tokens[field.name] = new_tokens
+
+        return "\n\n".join(
+            f"## {field.name}\n{rendered[field.name]}"
+            for field in fields
+            if field.name in rendered
+        )
+
+    def build_repo_context(
+        self,
+        repo_info: Dict[str, Any],
+        total_budget: Optional[int] = None
+    ) -> str:
+        """Build prompt context for repository-level prompts."""
+        analysis = repo_info.get("analysis", {})
+        fields = [
+            ContextField("Repository", {
+                key: repo_info.get(key)
+                for key in ("name", "description", "language", "topics")
+                if repo_info.get(key)
+            }, priority=5, budget=200),
+            ContextField("Analysis", analysis, priority=4, budget=800),
+            ContextField("Structure", repo_info.get("structure"), priority=3, budget=700),
+            ContextField("Files", [
+                task["file_path"] for task in repo_info.get("tasks", [])
+            ], priority=2, budget=400),
+            ContextField("Symbols", repo_info.get("symbols") or repo_info.get("components"),
+                         priority=1, budget=600)
+        ]
+        return self.build(fields, total_budget)
+
+    def serialize(self, value: Any, indent: int = 0) -> str:
+        """Serialize a value into a compact, deterministic text form."""
+        pad = "  " * indent
+
+        if isinstance(value, dict):
+            lines = []
+            for key in sorted(value, key=str):
+                if key in OMITTED_KEYS:
+                    continue
+                item = value[key]
+                if isinstance(item, list) and not any(isinstance(i, (dict, list)) for i in item):
+                    lines.append(f"{pad}{key}: {self.serialize(item)}")
+                elif isinstance(item, (dict, list)) and item:
+                    lines.append(f"{pad}{key}:")
+                    lines.append(self.serialize(item, indent + 1))
+                else:
+                    lines.append(f"{pad}{key}: {self._scalar(item)}")
+            return "\n".join(lines)
+
+        if isinstance(value, list):
+            if all(not isinstance(item, (dict, list)) for item in value):
+                return pad + ", ".join(self._scalar(item) for item in value)
+            lines = []
+            for item in value:
+                text = self.serialize(item, indent + 1).lstrip()
+                lines.append(f"{pad}- {text}")
+            return "\n".join(lines)
+
+        return pad + self._scalar(value)
+
+    def render_tree(self, tree: Dict[str, Any], max_depth: Optional[int] = None) -> str:
+        """Render a nested structure dict as an indented tree.
+
+        Directories below ``max_depth`` are collapsed into a file count.
+        """
+        lines = []
+
+        def walk(node: Dict[str, Any], depth: int) -> None:
+            pad = "  " * depth
+            for name in sorted(node, key=lambda n: (not isinstance(node[n], dict), n)):
+                child = node[name]
+                if not isinstance(child, dict):
+                    lines.append(f"{pad}{name}")
+                elif max_depth is not None and depth >= max_depth:
+                    lines.append(f"{pad}{name}/ ({self._count_files(child)} files)")
+                else:
+                    lines.append(f"{pad}{name}/")
+                    walk(child, depth + 1)
+
+        walk(tree, 0)
+        return "\n".join(lines)
+
+    def _fit(self, name: str, value: Any, budget: int) -> str:
+        """Serialize a field, summarizing or truncating it to the budget."""
+        if name == "Structure" and isinstance(value, dict):
+            # Collapse deeper directory levels before resorting to truncation
+            depth = self._tree_depth(value)
+            while depth >= 0:
+                text = self.render_tree(value, max_depth=depth)
+                if count_tokens(text, self.model) <= budget:
+                    return text
+                depth -= 1
+        else:
+            text = self.serialize(value)
+
+        if count_tokens(text, self.model) <= budget:
+            return text
+
+        marker_tokens = count_tokens(TRUNCATION_MARKER, self.model)
+        return truncate_to_token_limit(
+            text, self.model, max(budget - marker_tokens, 0)
+        ) + TRUNCATION_MARKER
+
+    def _scalar(self, value: Any) -> str:
+        if isinstance(value, str):
+            return " ".join(value.split())
+        return json.dumps(value, default=str)
+
+    def _tree_depth(self, tree: Dict[str, Any]) -> int:
+        children = [c for c in tree.values() if isinstance(c, dict)]
+        return 1 + max((self._tree_depth(c) for c in children), default=-1)
+
+    def _count_files(self, tree: Dict[str, Any]) -> int:
+        return sum(
+            self._count_files(c) if isinstance(c, dict) else 1
+            for c in tree.values()
+        )
+
+# Create singleton instance
+context_builder = ContextBuilder()
@@ -36,6 +36,7 @@ class CostTracker:
         self.requests: int = 0
         self.total_tokens: int = 0
         self.model_usage: Dict[str, Dict[str, float]] = {}
+        self.route_usage: Dict[str, Dict[str, float]] = {}
 
     def add_request(self, model: str, input_tokens: int, output_tokens: int) -> None:
         """Track the cost of a request."""
@@ -55,6 +56,50 @@ class CostTracker:
         self.model_usage[model]["requests"] += 1
         self.model_usage[model]["total_tokens"] += input_tokens + output_tokens
 
+    def add_route_result(
+        self,
+        route: str,
+        model: str,
+        escalation_reason: Optional[str],
+        cost: float,
+        baseline_cost: float
+    ) -> None:
+        """Track the outcome of a cascaded request.
+
+        ``baseline_cost`` is what the request would have cost on the
+        strongest model in the cascade.
+        """
+        if route not in self.route_usage:
+            self.route_usage[route] = {
+                "requests": 0,
+                "cheap_hits": 0,
+                "escalations": {},
+                "models": {},
+                "cost": 0.0,
+                "baseline_cost": 0.0
+            }
+
+        usage = self.route_usage[route]
+        usage["requests"] += 1
+        if escalation_reason is None:
+            usage["cheap_hits"] += 1
+        else:
+            usage["escalations"][escalation_reason] = usage["escalations"].get(escalation_reason, 0) + 1
+        usage["models"][model] = usage["models"].get(model, 0) + 1
+        usage["cost"] += cost
+        usage["baseline_cost"] += baseline_cost
+
+    def get_route_summary(self) -> Dict[str, Dict[str, any]]:
+        """Get hit rates and savings for each cascaded route."""
+        return {
+            route: {
+                **usage,
+                "hit_rate": usage["cheap_hits"] / usage["requests"] if usage["requests"] > 0 else 0,
+                "savings": usage["baseline_cost"] - usage["cost"]
+            }
+            for route, usage in self.route_usage.items()
+        }
+
     def get_summary(self) -> Dict[str, any]:
         """Get a summary of usage and costs."""
         return {
@@ -62,6 +107,7 @@ class CostTracker:
             "total_requests": self.requests,
             "total_tokens": self.total_tokens,
             "model_usage": self.model_usage,
+            "route_usage": self.get_route_summary(),
             "average_cost_per_request": self.total_cost / self.requests if self.requests > 0 else 0
         }
 
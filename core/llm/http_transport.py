@@ -0,0 +1,79 @@
+"""HTTP transport for LLM API clients."""
+from typing import Dict, Any, Tuple
+import httpx
+
+from ..utils.logging_config import setup_logger
+from ...config.settings import (
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_CONNECT_TIMEOUT,
+    LLM_READ_TIMEOUT,
+    LLM_HTTP2
+)
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+except ImportError:  # h2 is optional; HTTP/1.1 keep-alive is used without it
+    h2 = None
+
+logger = setup_logger(__name__)
+
+class PooledTransport(httpx.AsyncHTTPTransport):
+    """An httpx transport that reports how busy its connection pool is.
+
+    Requests beyond ``max_connections`` wait for a free connection, so an
+    in-flight count near that limit (or well above the open connections)
+    means the pool, not the API, is what requests are waiting on.
+    """
+
+    def __init__(self, limits: httpx.Limits, http2: bool):
+        super().__init__(limits=limits, http2=http2)
+        self.max_connections = limits.max_connections
+        self.http2 = http2
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.requests += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            self.in_flight -= 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Request counts and the state of the pooled connections."""
+        connections = list(getattr(self._pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "open_connections": len(connections),
+            "idle_connections": idle,
+            "max_connections": self.max_connections,
+            "utilization": (len(connections) - idle) / self.max_connections if self.max_connections else 0.0,
+            "http2": self.http2
+        }
+
+def build_http_client() -> Tuple[httpx.AsyncClient, PooledTransport]:
+    """An AsyncClient with explicit pool limits, timeouts and (if h2 is installed) HTTP/2, and its transport."""
+    http2 = LLM_HTTP2 and h2 is not None
+    if LLM_HTTP2 and not http2:
+        logger.debug("h2 is not installed; LLM requests use HTTP/1.1")
+    transport = PooledTransport(
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY
+        ),
+        http2=http2
+    )
+    client = httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(LLM_READ_TIMEOUT, connect=LLM_CONNECT_TIMEOUT)
+    )
+    return client, transport
@@ -1,7 +1,7 @@
 """OpenAI client module."""
-from typing import Dict, Any, Optional, AsyncGenerator
+from typing import Dict, Any, Optional, AsyncGenerator, Callable, List
 import asyncio
-from openai import OpenAI, AsyncOpenAI
+from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion
 
 from core.utils.logging_config import setup_logger
@@ -15,35 +15,86 @@ from core.utils.error_handler import (
     ModelError,
     APIError
 )
-from core.config.settings import OPENAI_API_KEY, OPENAI_ORG_ID
+from core.config.settings import (
+    OPENAI_API_KEY,
+    OPENAI_ORG_ID,
+    CASCADE_ESCALATION_TOKENS,
+    CASCADE_ESCALATION_COMPLEXITY,
+    LLM_WARM_CONNECTIONS
+)
 from core.config.models import ModelConfig
 from .token_counter import count_tokens
 from .cost_calculator import calculate_cost, cost_tracker
+from .http_transport import build_http_client
 
 logger = setup_logger(__name__)
 
+def is_usable_response(response: ChatCompletion) -> bool:
+    """Default cascade validator: a non-empty, non-truncated completion."""
+    choice = response.choices[0]
+    return bool(choice.message.content) and choice.finish_reason != "length"
+
 class OpenAIClient:
     def __init__(self):
-        # Initialize clients with or without org ID
-        client_args = {"api_key": OPENAI_API_KEY}
-        if OPENAI_ORG_ID:
-            client_args["organization"] = OPENAI_ORG_ID
-            
-        self.client = OpenAI(**client_args)
-        self.async_client = AsyncOpenAI(**client_args)
-        
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._http_client = None
+        self._transport = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """The API client, created on first use so importing opens no connections."""
+        if self._async_client is None:
+            # Initialize client with or without org ID
+            client_args = {"api_key": OPENAI_API_KEY}
+            if OPENAI_ORG_ID:
+                client_args["organization"] = OPENAI_ORG_ID
+            self._http_client, self._transport = build_http_client()
+            self._async_client = AsyncOpenAI(
+                **client_args,
+                http_client=self._http_client,
+                timeout=self._http_client.timeout
+            )
+        return self._async_client
+
+    async def warm_up(self, connections: int = LLM_WARM_CONNECTIONS) -> None:
+        """Open connections ahead of the first requests, so they skip the TLS handshake."""
+        if connections <= 0:
+            return
+        url = str(self.async_client.base_url)
+        results = await asyncio.gather(
+            *[self._http_client.head(url) for _ in range(connections)],
+            return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures:
+            logger.warning(f"Could not pre-open {len(failures)} of {connections} connections: {failures[0]}")
+
+    def connection_metrics(self) -> Dict[str, Any]:
+        """Pool utilization of the API transport; empty until the client is used."""
+        return self._transport.metrics() if self._transport is not None else {}
+
+    async def close(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+            self._http_client = self._transport = None
+
     @retry_with_exponential_backoff()
     async def get_completion(
         self,
         prompt: str,
         model_config: ModelConfig,
         cache_key: Optional[str] = None,
-        stream: bool = False
+        stream: bool = False,
+        max_output_tokens: Optional[int] = None
     ) -> ChatCompletion:
-        """Get a completion from OpenAI with retry logic and caching."""
+        """Get a completion from OpenAI with retry logic and caching.
+
+        ``max_output_tokens`` caps the response below the model's default.
+        """
         # Check cache first
         if cache_key and not stream:
-            cached_response = cache_manager.get(cache_key)
+            cached_response = await cache_manager.aget(cache_key)
             if cached_response is not None:
                 logger.debug(f"Cache hit for key: {cache_key}")
                 return cached_response
@@ -65,7 +116,7 @@ class OpenAIClient:
         logger.info(f"Estimated cost for completion: ${estimated_cost:.4f}")
 
         try:
-            response = await self._make_request(prompt, model_config, stream)
+            response = await self._make_request(prompt, model_config, stream, max_output_tokens)
             
             # Track actual usage and cost
             if not stream and hasattr(response, 'usage'):
@@ -77,7 +128,7 @@ class OpenAIClient:
             
             # Cache the response if appropriate
             if cache_key and not stream:
-                cache_manager.set(cache_key, response)
+                await cache_manager.aset(cache_key, response)
             
             return response
             
@@ -98,19 +149,89 @@ class OpenAIClient:
             else:
                 raise APIError(str(e))
 
+    async def get_routed_completion(
+        self,
+        prompt: str,
+        route: str,
+        cascade: List[ModelConfig],
+        validator: Optional[Callable[[ChatCompletion], bool]] = None,
+        complexity: Optional[int] = None,
+        escalate: bool = False,
+        cache_key: Optional[str] = None,
+        max_output_tokens: Optional[int] = None
+    ) -> ChatCompletion:
+        """Try the cheapest model in the cascade first, escalating only when needed.
+
+        Escalation happens up front for large or complex inputs and when the
+        caller flags the request (e.g. after a reviewer rejected the output),
+        and after the fact when ``validator`` rejects a cheaper model's response.
+        """
+        validator = validator or is_usable_response
+        strongest = cascade[-1]
+
+        reason = None
+        if escalate:
+            reason = "flagged"
+        elif count_tokens(prompt, strongest.model) > CASCADE_ESCALATION_TOKENS:
+            reason = "size"
+        elif complexity is not None and complexity > CASCADE_ESCALATION_COMPLEXITY:
+            reason = "complexity"
+
+        start = len(cascade) - 1 if reason else 0
+        cost = 0.0
+
+        for tier in range(start, len(cascade)):
+            model_config = cascade[tier]
+            response = await self.get_completion(
+                prompt,
+                model_config,
+                cache_key=f"{cache_key}:{model_config.model}" if cache_key else None,
+                max_output_tokens=max_output_tokens
+            )
+            cost += self._response_cost(response, model_config.model)
+
+            if model_config is strongest or validator(response):
+                break
+
+            reason = "validation"
+            logger.info(
+                f"Escalating {route} from {model_config.model} after failed validation"
+            )
+
+        cost_tracker.add_route_result(
+            route,
+            model_config.model,
+            reason,
+            cost,
+            self._response_cost(response, strongest.model)
+        )
+
+        return response
+
+    def _response_cost(self, response: ChatCompletion, model: str) -> float:
+        """Calculate what a response costs (or would cost) on a given model."""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return 0.0
+        return calculate_cost(usage.prompt_tokens, model, usage.completion_tokens)
+
     async def _make_request(
         self,
         prompt: str,
         model_config: ModelConfig,
-        stream: bool = False
+        stream: bool = False,
+        max_output_tokens: Optional[int] = None
     ) -> ChatCompletion:
         """Make the actual API request to OpenAI."""
         messages = [{"role": "user", "content": prompt}]
+        params = model_config.to_dict()
+        if max_output_tokens is not None:
+            params["max_tokens"] = max_output_tokens
         
         response = await self.async_client.chat.completions.create(
             messages=messages,
             stream=stream,
-            **model_config.to_dict()
+            **params
         )
         
         return response
@@ -1,3 +1,5 @@
 from .document_generator import DocumentGenerator
+from .markdown_sections import MarkdownSections
+from .section_generator import SectionGenerator
 
-__all__ = ['DocumentGenerator']
\ No newline at end of file
+__all__ = ['DocumentGenerator', 'MarkdownSections', 'SectionGenerator']
\ No newline at end of file
@@ -1,7 +1,11 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterable, Iterator, Tuple
+from itertools import groupby
 from pathlib import Path
 import os
+import re
 from ..utils.logging_config import setup_logger
+from .section_generator import SectionGenerator
+from .document_writer import DocumentWriter
 
 logger = setup_logger(__name__)
 
@@ -11,36 +15,44 @@ class DocumentGenerator:
     def __init__(self, output_dir: Path):
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.writer = DocumentWriter(output_dir)
         
-    def generate_documentation(
+    async def generate_documentation(
         self,
         content: Dict[str, Any],
         repo_info: Dict[str, Any]
     ) -> Dict[str, str]:
-        """Generate all documentation files."""
-        docs = {}
-        
-        # Generate README
-        readme = self._generate_readme(content, repo_info)
-        docs["README.md"] = readme
-        
-        # Generate API documentation if present
-        if content.get("has_api"):
-            api_docs = self._generate_api_docs(content["api_spec"])
-            docs["docs/api.md"] = api_docs
-            
-        # Generate architecture documentation
-        arch_docs = self._generate_architecture_docs(content)
-        docs["docs/architecture.md"] = arch_docs
-        
-        # Generate setup documentation
-        setup_docs = self._generate_setup_docs(content)
-        docs["docs/setup.md"] = setup_docs
-        
-        # Write files to disk
-        self._write_documentation(docs)
-        
-        return docs
+        """
+        Generate all documentation files concurrently.
+
+        Content values may be awaitables; each file is written as soon as
+        the content it needs is ready.
+        """
+        sections = SectionGenerator(persist=lambda path, text: self.writer.write({path: text}))
+        sections.add(
+            "README.md",
+            lambda inputs: self._generate_readme(inputs, inputs["repo_info"]),
+            ("repo_info", "description", "features", "installation", "usage",
+             "doc_links", "contributing", "license")
+        )
+        sections.add(
+            "docs/api.md",
+            lambda inputs: self._generate_api_docs(inputs["api_spec"]) if inputs.get("has_api") else None,
+            ("has_api", "api_spec")
+        )
+        sections.add(
+            "docs/architecture.md",
+            self._generate_architecture_docs,
+            ("architecture_overview", "components", "data_flow", "dependencies", "deployment", "sampling")
+        )
+        sections.add(
+            "docs/setup.md",
+            self._generate_setup_docs,
+            ("setup_overview", "prerequisites", "installation_steps", "configuration_guide",
+             "development_setup", "testing_guide")
+        )
+
+        return await sections.run({**content, "repo_info": repo_info})
         
     def _generate_readme(
         self,
@@ -85,6 +97,87 @@ For more detailed documentation, see:
             license=content.get("license", "")
         )
         
+    def render_api_docs(self, api_spec: Dict[str, Any]) -> str:
+        """Render API documentation without writing it to disk."""
+        return self._generate_api_docs(api_spec)
+
+    def stream_api_docs(
+        self,
+        groups: Iterable[Tuple[str, Iterable[Dict[str, Any]]]],
+        directory: str = "docs/api"
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Render API documentation one markdown file per tag, incrementally.
+
+        Args:
+            groups: (tag, endpoints) pairs; endpoints may be lazy iterators
+            directory: Output directory relative to the docs root
+
+        Yields:
+            (relative path, markdown chunk) pairs; each file starts with a
+            heading chunk followed by one chunk per endpoint
+        """
+        used = set()
+        for tag, endpoints in groups:
+            slug = re.sub(r'[^a-z0-9]+', '-', str(tag).lower()).strip('-') or 'default'
+            name, n = slug, 1
+            while name in used:
+                n += 1
+                name = f"{slug}-{n}"
+            used.add(name)
+
+            path = f"{directory}/{name}.md"
+            yield path, f"# {tag}\n\n"
+            for endpoint in endpoints:
+                yield path, self._render_endpoint(endpoint) + "\n"
+
+    def write_api_docs(
+        self,
+        groups: Iterable[Tuple[str, Iterable[Dict[str, Any]]]],
+        title: str,
+        description: str = "",
+        directory: str = "docs/api"
+    ) -> Dict[str, int]:
+        """
+        Stream per-tag API documentation to disk, plus an index page.
+
+        Chunks are written as they are rendered, so memory stays flat
+        however many operations the spec has; unchanged files are left alone.
+
+        Returns:
+            Operation counts keyed by relative path (the index maps to 0)
+        """
+        counts: Dict[str, int] = {}
+        titles: Dict[str, str] = {}
+        changed = 0
+        for path, chunks in groupby(self.stream_api_docs(groups, directory), key=lambda item: item[0]):
+            # The first chunk of each file is its heading
+            counts[path] = -1
+
+            def counted(path=path, chunks=chunks) -> Iterator[str]:
+                for _, chunk in chunks:
+                    if counts[path] < 0:
+                        titles[path] = chunk.lstrip("# ").strip()
+                    counts[path] += 1
+                    yield chunk
+
+            changed += self.writer.write_stream(path, counted())
+
+        index = [f"# {title}\n", f"{description}\n" if description else "", "## Tags\n"]
+        index.extend(
+            f"- [{titles[path]}]({Path(path).name}) ({count} operations)"
+            for path, count in counts.items()
+        )
+        index_path = f"{directory}/README.md"
+        self._write_documentation({index_path: "\n".join(index) + "\n"})
+        counts[index_path] = 0
+
+        logger.info(
+            f"Rendered {sum(counts.values())} operations to {len(counts) - 1} API docs "
+            f"({changed} changed)"
+        )
+        return counts
+
     def _generate_api_docs(self, api_spec: Dict[str, Any]) -> str:
         """Generate API documentation."""
         template = """# API Documentation
@@ -101,26 +194,25 @@ For more detailed documentation, see:
 ## Error Handling
 {errors}
 """
-        endpoints = []
-        for endpoint in api_spec.get("endpoints", []):
-            endpoints.append(f"""### {endpoint['method']} {endpoint['path']}
-{endpoint.get('description', '')}
-
-**Parameters:**
-{self._format_parameters(endpoint.get('parameters', []))}
-
-**Response:**
-```json
-{endpoint.get('response_example', '{}')}
-```
-""")
-            
         return template.format(
             description=api_spec.get("description", ""),
-            endpoints="\n".join(endpoints),
+            endpoints="\n".join(self._render_endpoint(e) for e in api_spec.get("endpoints", [])),
             auth=api_spec.get("authentication", ""),
             errors=api_spec.get("error_handling", "")
         )
+
+    def _render_endpoint(self, endpoint: Dict[str, Any]) -> str:
+        """Render one endpoint's markdown section."""
+        deprecated = "\n**Deprecated.**\n" if endpoint.get("deprecated") else ""
+        return (
+            f"### {endpoint['method']} {endpoint['path']}\n"
+            f"{endpoint.get('description', '')}\n"
+            f"{deprecated}\n"
+            f"**Parameters:**\n"
+            f"{self._format_parameters(endpoint.get('parameters', []))}\n\n"
+            f"**Response:**\n"
+            f"```json\n{endpoint.get('response_example') or '{}'}\n```\n"
+        )
         
     def _generate_architecture_docs(self, content: Dict[str, Any]) -> str:
         """Generate architecture documentation."""
@@ -145,13 +237,27 @@ For more detailed documentation, see:
             for comp in content.get("components", [])
         ])
         
-        return template.format(
+        docs = template.format(
             overview=content.get("architecture_overview", ""),
             components=components,
             data_flow=content.get("data_flow", ""),
             dependencies=content.get("dependencies", ""),
             deployment=content.get("deployment", "")
         )
+
+        sampling = content.get("sampling")
+        if sampling:
+            docs += (
+                f"\n## Coverage\n"
+                f"This overview is based on a stratified sample of "
+                f"{sampling['sampled_files']} of {sampling['total_files']} files "
+                f"({sampling['file_coverage']:.1%} of files, "
+                f"{sampling['token_coverage']:.1%} of source tokens) covering "
+                f"{sampling['covered_strata']} of {sampling['total_strata']} "
+                f"directory/language groups.\n"
+            )
+
+        return docs
         
     def _generate_setup_docs(self, content: Dict[str, Any]) -> str:
         """Generate setup documentation."""
@@ -183,14 +289,9 @@ For more detailed documentation, see:
             testing=content.get("testing_guide", "")
         )
         
-    def _write_documentation(self, docs: Dict[str, str]) -> None:
-        """Write documentation files to disk."""
-        for path, content in docs.items():
-            file_path = self.output_dir / path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+    def _write_documentation(self, docs: Dict[str, str]) -> List[str]:
+        """Write documentation files to disk, skipping unchanged ones."""
+        return self.writer.write_sync(docs)
                 
     def _format_parameters(self, parameters: List[Dict[str, Any]]) -> str:
         """Format API parameters into markdown table."""
@@ -0,0 +1,135 @@
+from typing import Dict, Iterable, List, Tuple
+from pathlib import Path
+import asyncio
+import hashlib
+import os
+import tempfile
+from ..utils.logging_config import setup_logger
+from ..utils.blocking_io import blocking_io
+
+logger = setup_logger(__name__)
+
+class DocumentWriter:
+    """Writes documentation files atomically, skipping ones whose content is unchanged.
+
+    A file is only rewritten when its size or content hash differs from the
+    new text, so re-runs that change a few documents touch only those. New
+    content goes to a temp file in the same directory and is renamed over
+    the target, so readers never see a half-written file. Async writes
+    hash and write on the shared disk pool.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        # Read the umask once; changing it from worker threads would race
+        umask = os.umask(0)
+        os.umask(umask)
+        self._default_mode = 0o666 & ~umask
+
+    async def write(self, docs: Dict[str, str]) -> List[str]:
+        """
+        Write documents without blocking the event loop.
+
+        Args:
+            docs: Content keyed by path relative to the root
+
+        Returns:
+            Relative paths that were created or changed
+        """
+        results = await asyncio.gather(*[
+            blocking_io.run("disk", self._write_one, path, content)
+            for path, content in docs.items()
+        ])
+        return self._changed(results)
+
+    def write_sync(self, docs: Dict[str, str]) -> List[str]:
+        """Blocking variant of ``write`` for synchronous callers.
+
+        Writes in the calling thread: sync callers usually already run on a
+        pool worker, and waiting there on the same pool could deadlock it.
+        """
+        return self._changed(self._write_one(path, content) for path, content in docs.items())
+
+    def _changed(self, results) -> List[str]:
+        results = list(results)
+        changed = [path for path, was_written in results if was_written]
+        logger.debug(f"Wrote {len(changed)} of {len(results)} documents; the rest were unchanged")
+        return changed
+
+    def write_stream(self, path: str, chunks: Iterable[str]) -> bool:
+        """
+        Write a document from chunks without holding it in memory.
+
+        The chunks go to a temp file while being hashed; it replaces the
+        target only if the content differs.
+
+        Returns:
+            Whether the file was created or changed
+        """
+        target = self.root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        digest, size = hashlib.sha256(), 0
+        fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    data = chunk.encode('utf-8')
+                    digest.update(data)
+                    size += len(data)
+                    f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            if self._matches(target, size, digest.digest()):
+                os.unlink(temp_path)
+                return False
+            self._replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return True
+
+    def _write_one(self, path: str, content: str) -> Tuple[str, bool]:
+        target = self.root / path
+        data = content.encode('utf-8')
+        if self._matches(target, len(data), hashlib.sha256(data).digest()):
+            return path, False
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self._replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return path, True
+
+    def _matches(self, target: Path, size: int, digest: bytes) -> bool:
+        """Check whether a file already holds content of the given size and hash."""
+        try:
+            # A size mismatch settles it without reading the file
+            if target.stat().st_size != size:
+                return False
+            existing = hashlib.sha256()
+            with open(target, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 16), b''):
+                    existing.update(block)
+            return existing.digest() == digest
+        except FileNotFoundError:
+            return False
+
+    def _replace(self, temp_path: str, target: Path) -> None:
+        # mkstemp creates 0600 files; keep the target's mode, or the umask default
+        os.chmod(temp_path, self._mode(target))
+        os.replace(temp_path, target)
+
+    def _mode(self, target: Path) -> int:
+        try:
+            return target.stat().st_mode & 0o777
+        except FileNotFoundError:
+            return self._default_mode
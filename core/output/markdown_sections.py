@@ -0,0 +1,146 @@
+from typing import Dict, Any, List, Optional
+import re
+from ..utils.logging_config import setup_logger
+
+logger = setup_logger(__name__)
+
+class MarkdownSections:
+    """A markdown document split into heading-delimited sections.
+
+    Each heading starts a new, flat section that runs to the next heading of
+    any level. Sections get stable ids from their heading path (e.g.
+    "usage/cli"), so targeted edits can be expressed as patches against ids
+    and applied locally instead of regenerating the whole document.
+    """
+
+    HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+    FENCE = re.compile(r'^\s*(```|~~~)')
+    WORD = re.compile(r'[a-z0-9]+')
+    # Text before the first heading
+    PREAMBLE = "_preamble"
+    ACTIONS = ("replace", "insert_after", "delete")
+
+    def __init__(self, text: str):
+        self.sections = self._split(text)
+
+    def render(self) -> str:
+        """Reassemble the document."""
+        return "".join(section["text"] for section in self.sections)
+
+    def get(self, section_id: str) -> Optional[Dict[str, Any]]:
+        for section in self.sections:
+            if section["id"] == section_id:
+                return section
+        return None
+
+    def outline(self) -> str:
+        """One line per section: id, heading and approximate size."""
+        return "\n".join(
+            f"- {s['id']}: {s['title'] or '(untitled)'} (~{len(s['text'].split())} words)"
+            for s in self.sections if s["id"]
+        )
+
+    def find(self, query: str, limit: int = 3) -> List[str]:
+        """Rank sections by word overlap with a change request; headings count triple."""
+        terms = set(self.WORD.findall(query.lower()))
+        scored = []
+        for position, section in enumerate(self.sections):
+            if not section["id"]:
+                continue
+            title = set(self.WORD.findall(section["title"].lower()))
+            body = set(self.WORD.findall(section["text"].lower()))
+            score = 3 * len(terms & title) + len(terms & body)
+            if score:
+                scored.append((-score, position, section["id"]))
+        return [section_id for _, _, section_id in sorted(scored)[:limit]]
+
+    def apply(self, patches: List[Dict[str, Any]], editable: Optional[set] = None) -> List[Dict[str, Any]]:
+        """
+        Apply section patches in order.
+
+        Args:
+            patches: {"section", "action", "content"} dicts
+            editable: Ids that may be replaced; others can only be
+                deleted or have sections inserted after them
+
+        Returns:
+            The patches that were rejected
+        """
+        rejected = []
+        for patch in patches:
+            if not isinstance(patch, dict):
+                rejected.append({"patch": patch, "reason": "not an object"})
+                continue
+            action, section_id = patch.get("action"), patch.get("section")
+            content = str(patch.get("content") or "")
+            position = next(
+                (i for i, s in enumerate(self.sections) if s["id"] == section_id), None
+            )
+
+            if action not in self.ACTIONS:
+                reason = f"unknown action {action}"
+            elif position is None:
+                reason = f"unknown section {section_id}"
+            elif action == "replace" and editable is not None and section_id not in editable:
+                reason = f"section {section_id} was not shown in full"
+            elif action != "delete" and not content.strip():
+                reason = "empty content"
+            else:
+                reason = None
+
+            if reason:
+                rejected.append({"patch": patch, "reason": reason})
+                continue
+
+            section = self.sections[position]
+            if action == "delete":
+                del self.sections[position]
+            elif action == "replace":
+                # Keep the original heading when the model returns only the body
+                if section["title"] and not self.HEADING.match(content.lstrip().split("\n", 1)[0]):
+                    content = section["text"].split("\n", 1)[0] + "\n" + content
+                section["text"] = self._terminate(content)
+            else:
+                # Inserted sections are not addressable by later patches
+                self.sections.insert(position + 1, {
+                    "id": None, "level": 0, "title": "", "text": self._terminate(content)
+                })
+
+        for item in rejected:
+            logger.warning(f"Rejected section patch: {item['reason']}")
+        return rejected
+
+    def _split(self, text: str) -> List[Dict[str, Any]]:
+        sections = [{"id": self.PREAMBLE, "level": 0, "title": "", "lines": []}]
+        path: List[str] = []
+        used = set()
+        in_fence = False
+
+        for line in text.splitlines(keepends=True):
+            if self.FENCE.match(line):
+                in_fence = not in_fence
+            match = None if in_fence else self.HEADING.match(line.rstrip("\n"))
+            if not match:
+                sections[-1]["lines"].append(line)
+                continue
+
+            level, title = len(match.group(1)), match.group(2)
+            slug = "-".join(self.WORD.findall(title.lower())) or "section"
+            path = path[:level - 1] + [""] * max(0, level - 1 - len(path)) + [slug]
+            section_id = "/".join(p for p in path if p)
+            base, n = section_id, 1
+            while section_id in used:
+                n += 1
+                section_id = f"{base}-{n}"
+            used.add(section_id)
+            sections.append({"id": section_id, "level": level, "title": title, "lines": [line]})
+
+        # The preamble is kept even when empty so content can be inserted at the top
+        return [
+            {"id": s["id"], "level": s["level"], "title": s["title"], "text": "".join(s["lines"])}
+            for s in sections
+        ]
+
+    def _terminate(self, content: str) -> str:
+        """Ensure a section ends with a blank line so headings stay separated."""
+        return content.rstrip("\n") + "\n\n"
@@ -0,0 +1,102 @@
+from typing import Dict, Any, List, Callable, Optional, Sequence, Tuple
+from dataclasses import dataclass
+import asyncio
+import inspect
+import time
+from ..utils.logging_config import setup_logger
+
+logger = setup_logger(__name__)
+
+@dataclass
+class Section:
+    """A documentation section and the content keys it is rendered from."""
+    path: str
+    producer: Callable[[Dict[str, Any]], Any]
+    inputs: Tuple[str, ...] = ()
+
+class SectionGenerator:
+    """Renders documentation sections concurrently and assembles them in order.
+
+    Each section is an independent producer that declares the content keys
+    it needs. Content values may be awaitables (e.g. LLM calls already in
+    flight); a section starts as soon as its own inputs resolve, so the
+    phase takes as long as the slowest section rather than the sum. Each
+    section is persisted the moment it completes, and the assembled result
+    always follows registration order.
+    """
+
+    def __init__(self, persist: Optional[Callable[[str, str], Any]] = None):
+        self.sections: List[Section] = []
+        self.persist = persist
+
+    def add(
+        self,
+        path: str,
+        producer: Callable[[Dict[str, Any]], Any],
+        inputs: Sequence[str] = ()
+    ) -> None:
+        """
+        Register a section.
+
+        Args:
+            path: Output path of the section
+            producer: Sync or async callable taking a dict of its declared
+                inputs (keys missing from the content are left out) and
+                returning the section text, or None to skip the section
+            inputs: Content keys the producer reads
+        """
+        if any(section.path == path for section in self.sections):
+            raise ValueError(f"Section already registered: {path}")
+        self.sections.append(Section(path, producer, tuple(inputs)))
+
+    async def run(self, content: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Render every section concurrently.
+
+        Sections that succeed are persisted even if another one fails; the
+        first failure is re-raised once all sections have finished.
+
+        Returns:
+            Section texts keyed by path, in registration order
+        """
+        # Each awaitable input is awaited once, however many sections share it
+        resolved = {
+            key: asyncio.ensure_future(value) if inspect.isawaitable(value) else value
+            for key, value in content.items()
+        }
+        results = await asyncio.gather(
+            *[self._render(section, resolved) for section in self.sections],
+            return_exceptions=True
+        )
+
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise errors[0]
+        return {
+            section.path: text
+            for section, text in zip(self.sections, results)
+            if text is not None
+        }
+
+    async def _render(self, section: Section, resolved: Dict[str, Any]) -> Optional[str]:
+        started = time.monotonic()
+        try:
+            inputs = {}
+            for key in section.inputs:
+                if key in resolved:
+                    value = resolved[key]
+                    inputs[key] = await value if isinstance(value, asyncio.Future) else value
+
+            text = section.producer(inputs)
+            if inspect.isawaitable(text):
+                text = await text
+        except Exception as e:
+            logger.error(f"Section {section.path} failed: {str(e)}")
+            raise
+
+        if text is not None and self.persist:
+            persisted = self.persist(section.path, text)
+            if inspect.isawaitable(persisted):
+                await persisted
+        logger.debug(f"Section {section.path} ready in {time.monotonic() - started:.2f}s")
+        return text
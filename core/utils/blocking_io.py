@@ -0,0 +1,114 @@
+from typing import Dict, Any, Callable, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+import asyncio
+import contextvars
+import threading
+import time
+from ..utils.logging_config import setup_logger
+from ...config.settings import IO_POOL_SIZES, IO_SLOW_WAIT_SECONDS
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+@dataclass
+class PoolStats:
+    """Counters for one pool; times are in seconds."""
+    workers: int
+    queued: int = 0
+    active: int = 0
+    max_queued: int = 0
+    completed: int = 0
+    failed: int = 0
+    wait_time: float = 0.0
+    max_wait: float = 0.0
+    blocking_time: float = 0.0
+    max_blocking: float = 0.0
+
+class BlockingIO:
+    """Runs blocking calls on bounded thread pools, off the event loop.
+
+    Git, GitHub API and disk calls each get their own pool, so a slow
+    clone or API request cannot starve file reads (or the LLM requests
+    awaiting on the loop). Every call is timed: how long it queued for a
+    worker and how long it blocked one. A queue wait above
+    IO_SLOW_WAIT_SECONDS means that pool is the bottleneck and is logged.
+    """
+
+    def __init__(self, pool_sizes: Dict[str, int] = IO_POOL_SIZES):
+        self._executors = {
+            name: ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"io-{name}")
+            for name, size in pool_sizes.items()
+        }
+        self._stats = {name: PoolStats(workers=size) for name, size in pool_sizes.items()}
+        self._lock = threading.Lock()
+
+    async def run(self, pool: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Await a blocking call on the named pool ("git", "github" or "disk").
+
+        Context variables are carried into the worker, as with asyncio.to_thread.
+        """
+        future = self.submit(pool, func, *args, **kwargs)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A call cancelled before it started never reaches the worker
+            if future.cancel():
+                with self._lock:
+                    self._stats[pool].queued -= 1
+            raise
+
+    def submit(self, pool: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Schedule a blocking call on the named pool and return its future."""
+        if pool not in self._executors:
+            raise ValueError(f"Unknown I/O pool: {pool}")
+        stats = self._stats[pool]
+        submitted = time.monotonic()
+        with self._lock:
+            stats.queued += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+
+        def call() -> T:
+            started = time.monotonic()
+            waited = started - submitted
+            with self._lock:
+                stats.queued -= 1
+                stats.active += 1
+                stats.wait_time += waited
+                stats.max_wait = max(stats.max_wait, waited)
+            if waited > IO_SLOW_WAIT_SECONDS:
+                logger.warning(
+                    f"{getattr(func, '__qualname__', func)} waited {waited:.2f}s "
+                    f"for the {pool} pool ({stats.queued} still queued)"
+                )
+
+            failed = False
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                blocked = time.monotonic() - started
+                with self._lock:
+                    stats.active -= 1
+                    stats.completed += 1
+                    stats.failed += failed
+                    stats.blocking_time += blocked
+                    stats.max_blocking = max(stats.max_blocking, blocked)
+
+        return self._executors[pool].submit(contextvars.copy_context().run, call)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of each pool's queue depth, wait and blocking times."""
+        with self._lock:
+            return {name: asdict(stats) for name, stats in self._stats.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait)
+
+# Create singleton instance
+blocking_io = BlockingIO()
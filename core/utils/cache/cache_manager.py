@@ -5,6 +5,7 @@ import pickle
 from pathlib import Path
 from datetime import datetime, timedelta
 from ...utils.logging_config import setup_logger
+from ...utils.blocking_io import blocking_io
 from ....config.settings import CACHE_DIR, CACHE_TTL, CACHE_ENABLED
 
 logger = setup_logger(__name__)
@@ -50,6 +51,14 @@ class CacheManager:
         except Exception as e:
             logger.warning(f"Cache set failed for key {key}: {str(e)}")
             
+    async def aget(self, key: str) -> Optional[Any]:
+        """Get a value from the cache without blocking the event loop."""
+        return await blocking_io.run("disk", self.get, key)
+
+    async def aset(self, key: str, value: Any) -> None:
+        """Set a value in the cache without blocking the event loop."""
+        await blocking_io.run("disk", self.set, key, value)
+
     def delete(self, key: str) -> None:
         """Delete a value from the cache."""
         try:
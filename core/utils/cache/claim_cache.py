@@ -0,0 +1,72 @@
+from typing import Optional, Any, Callable, Dict
+import hashlib
+from .cache_manager import CacheManager
+from ...utils.logging_config import setup_logger
+from ....config.settings import CACHE_DIR
+
+logger = setup_logger(__name__)
+
+class ClaimCache:
+    """Caches documentation claim verdicts across runs.
+
+    A verdict is stored with hashes of the files its evidence came from and
+    is reused only while all of them are unchanged. Verdicts that rest on
+    missing evidence are also pinned to a snapshot of the whole repository.
+    Entries are scoped to a repository, since the same claim and file paths
+    can mean different things elsewhere.
+    """
+
+    def __init__(self, cache: Optional[CacheManager] = None):
+        # Entries validate themselves against file hashes, so they never expire
+        self.cache = cache or CacheManager(CACHE_DIR / "claims", ttl=0)
+        self.stats = {"hits": 0, "misses": 0}
+
+    def fingerprint(self, normalized_claim: str) -> str:
+        """Hash a normalized claim."""
+        return hashlib.sha256(normalized_claim.encode()).hexdigest()
+
+    def get_verdict(
+        self,
+        repo: str,
+        fingerprint: str,
+        file_hash: Callable[[str], Optional[str]],
+        snapshot: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached verdict if its evidence still holds.
+
+        Args:
+            repo: Repository identity, such as its URL
+            fingerprint: Claim fingerprint
+            file_hash: Returns the current content hash of a repository file
+            snapshot: Current repository snapshot signature
+        """
+        entry = self.cache.get(self._key(repo, fingerprint))
+        valid = (
+            entry is not None and
+            (entry["snapshot"] is None or entry["snapshot"] == snapshot) and
+            all(file_hash(path) == digest for path, digest in entry["files"].items())
+        )
+        self.stats["hits" if valid else "misses"] += 1
+        return entry["verdict"] if valid else None
+
+    def set_verdict(
+        self,
+        repo: str,
+        fingerprint: str,
+        verdict: Dict[str, Any],
+        files: Dict[str, Optional[str]],
+        snapshot: Optional[str] = None
+    ) -> None:
+        """Cache a verdict with the file hashes (and snapshot) it depends on."""
+        self.cache.set(self._key(repo, fingerprint), {
+            "verdict": verdict,
+            "files": files,
+            "snapshot": snapshot
+        })
+
+    def _key(self, repo: str, fingerprint: str) -> str:
+        return f"claim:{repo}:{fingerprint}"
+
+# Create singleton instance
+claim_cache = ClaimCache()
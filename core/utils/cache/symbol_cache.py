@@ -0,0 +1,71 @@
+from typing import Optional, Any, Dict, List
+import hashlib
+import io
+import re
+import tokenize
+from .cache_manager import CacheManager
+from ...utils.logging_config import setup_logger
+from ....config.settings import CACHE_DIR
+
+logger = setup_logger(__name__)
+
+class SymbolCache:
+    """Caches generated symbol descriptions by a normalized hash of their source.
+
+    Keys are content-addressed, so an edit to one function only invalidates
+    that function's description, not the rest of its module.
+    """
+
+    def __init__(self, cache: Optional[CacheManager] = None):
+        # Entries are keyed by content, so they never go stale
+        self.cache = cache or CacheManager(CACHE_DIR / "symbols", ttl=0)
+        self.stats = {"hits": 0, "misses": 0}
+
+    def fingerprint(self, signature: str, source: str, language: str) -> str:
+        """Hash a symbol's signature and body, ignoring formatting and comments."""
+        normalized = self._normalize(source, language)
+        return hashlib.sha256(
+            f"{language}\0{' '.join(signature.split())}\0{normalized}".encode()
+        ).hexdigest()
+
+    def get_description(self, fingerprint: str) -> Optional[str]:
+        """Get a cached description for a symbol fingerprint."""
+        description = self.cache.get(f"symbol:{fingerprint}")
+        self.stats["hits" if description is not None else "misses"] += 1
+        return description
+
+    def set_description(self, fingerprint: str, description: str) -> None:
+        """Cache a generated description for a symbol fingerprint."""
+        self.cache.set(f"symbol:{fingerprint}", description)
+
+    def get_file_summary(self, repo: str, file_path: str) -> Optional[Dict[str, Any]]:
+        """Get the last generated purpose for a repository-relative file and the symbols it covered."""
+        return self.cache.get(f"file_summary:{repo}:{file_path}")
+
+    def set_file_summary(self, repo: str, file_path: str, purpose: str, fingerprints: List[str]) -> None:
+        """Record a file's generated purpose along with its symbol fingerprints."""
+        self.cache.set(f"file_summary:{repo}:{file_path}", {
+            "purpose": purpose,
+            "symbols": sorted(fingerprints)
+        })
+
+    def _normalize(self, source: str, language: str) -> str:
+        """Strip comments and collapse whitespace so cosmetic edits keep the hash."""
+        if language == "python":
+            try:
+                tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+                return " ".join(
+                    tok.string for tok in tokens
+                    if tok.type not in (tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE,
+                                        tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER)
+                )
+            except (tokenize.TokenError, IndentationError, SyntaxError):
+                logger.debug("Falling back to whitespace normalization for Python symbol")
+        elif language in ("javascript", "typescript", "react"):
+            source = re.sub(r'/\*.*?\*/', ' ', source, flags=re.DOTALL)
+            source = re.sub(r'(?<![:\'"])//[^\n]*', ' ', source)
+
+        return " ".join(source.split())
+
+# Create singleton instance
+symbol_cache = SymbolCache()
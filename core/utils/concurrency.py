@@ -0,0 +1,28 @@
+from typing import List, Any, Awaitable, Callable, Iterable, TypeVar
+import asyncio
+from ...config.settings import MAX_CONCURRENT_TASKS
+
+T = TypeVar("T")
+
+async def gather_bounded(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    limit: int = MAX_CONCURRENT_TASKS
+) -> List[T]:
+    """Run coroutine factories concurrently, at most ``limit`` at a time.
+
+    Factories are used instead of coroutines so that nothing starts before
+    a slot is free. Results are returned in input order.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(*[run(factory) for factory in factories])
+
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    if size < 1:
+        raise ValueError(f"Chunk size must be positive: {size}")
+    return [items[i:i + size] for i in range(0, len(items), size)]
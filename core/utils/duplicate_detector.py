@@ -0,0 +1,168 @@
+from typing import Dict, List, Any, Optional, Tuple
+import difflib
+import hashlib
+import random
+import re
+import zlib
+from ..utils.logging_config import setup_logger
+from ...config.settings import (
+    DUPLICATE_SIMILARITY_THRESHOLD,
+    MINHASH_PERMUTATIONS,
+    MINHASH_BANDS,
+    SHINGLE_SIZE
+)
+
+logger = setup_logger(__name__)
+
+# Mersenne prime for the universal hash that spreads shingle CRCs
+MERSENNE_PRIME = (1 << 61) - 1
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+
+class DuplicateDetector:
+    """Groups exact and near-duplicate files so each group is analyzed once.
+
+    Files are fed one at a time. Exact copies are matched on a hash of their
+    whitespace-normalized text; near-duplicates on a MinHash signature of
+    token shingles, bucketed with LSH banding so each file is only compared
+    against a handful of candidate representatives. Only representatives'
+    signatures are kept, so memory grows with the number of distinct files.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DUPLICATE_SIMILARITY_THRESHOLD,
+        num_perm: int = MINHASH_PERMUTATIONS,
+        bands: int = MINHASH_BANDS,
+        shingle_size: int = SHINGLE_SIZE,
+        seed: int = 0
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        self._mix_a = rng.randrange(1, MERSENNE_PRIME)
+        self._mix_b = rng.randrange(0, MERSENNE_PRIME)
+        self._exact: Dict[str, str] = {}
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = {}
+        self.groups: Dict[str, List[Dict[str, Any]]] = {}
+
+    def add(self, path: str, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Add a file to the index.
+
+        Returns:
+            {"duplicate_of", "similarity"} when the file matches an earlier
+            representative, otherwise None (the file becomes a representative)
+        """
+        normalized = " ".join(text.split())
+        digest = hashlib.sha256(normalized.encode("utf-8", "replace")).hexdigest()
+        if digest in self._exact:
+            return self._join(path, self._exact[digest], 1.0)
+
+        signature = self._signature(normalized)
+        if signature is not None:
+            match, similarity = self._best_candidate(signature)
+            if match is not None:
+                self._exact[digest] = match
+                return self._join(path, match, similarity)
+
+        self._exact[digest] = path
+        if signature is not None:
+            self._signatures[path] = signature
+            for key in self._band_keys(signature):
+                self._buckets.setdefault(key, []).append(path)
+        return None
+
+    def add_exact(self, path: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Add a file known only by a content hash (e.g. a git blob SHA)."""
+        if content_hash in self._exact:
+            return self._join(path, self._exact[content_hash], 1.0)
+        self._exact[content_hash] = path
+        return None
+
+    def by_path(self) -> Dict[str, Dict[str, Any]]:
+        """Map each duplicate's path to its {"duplicate_of", "similarity"}, as returned by add."""
+        return {
+            member["path"]: {"duplicate_of": representative, "similarity": member["similarity"]}
+            for representative, members in sorted(self.groups.items())
+            for member in members
+        }
+
+    @staticmethod
+    def diff_note(representative: str, original: str, copy: str, similarity: float) -> str:
+        """Describe how a duplicate differs from the representative it reuses."""
+        if similarity >= 1.0 and " ".join(original.split()) == " ".join(copy.split()):
+            return f"Identical to {representative}."
+
+        added = removed = 0
+        for line in difflib.unified_diff(original.splitlines(), copy.splitlines(), lineterm="", n=0):
+            if line.startswith("+") and not line.startswith("+++"):
+                added += 1
+            elif line.startswith("-") and not line.startswith("---"):
+                removed += 1
+        return (
+            f"Near-duplicate of {representative} ({similarity:.0%} similar): "
+            f"{added} lines added, {removed} removed."
+        )
+
+    def _join(self, path: str, representative: str, similarity: float) -> Dict[str, Any]:
+        logger.debug(f"{path} duplicates {representative} (similarity {similarity:.2f})")
+        self.groups.setdefault(representative, []).append({"path": path, "similarity": similarity})
+        return {"duplicate_of": representative, "similarity": similarity}
+
+    def _best_candidate(self, signature: Tuple[int, ...]) -> Tuple[Optional[str], float]:
+        """Find the most similar representative sharing at least one LSH band."""
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self._buckets.get(key, ()))
+
+        best, best_similarity = None, 0.0
+        for candidate in sorted(candidates):
+            other = self._signatures[candidate]
+            similarity = sum(a == b for a, b in zip(signature, other)) / len(signature)
+            if similarity > best_similarity:
+                best, best_similarity = candidate, similarity
+
+        if best_similarity >= self.threshold:
+            return best, best_similarity
+        return None, 0.0
+
+    def _signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """MinHash signature over token shingles; None for files too short to shingle.
+
+        Uses one-permutation hashing: each shingle is hashed once and lands in
+        one of ``num_perm`` bins, keeping the minimum per bin. Empty bins borrow
+        from the next non-empty bin, so the cost is linear in file length.
+        """
+        tokens = TOKEN_PATTERN.findall(text)
+        if len(tokens) < self.shingle_size:
+            return None
+
+        num_bins = self.bands * self.rows
+        mins = [None] * num_bins
+        for i in range(len(tokens) - self.shingle_size + 1):
+            shingle = "\x1f".join(tokens[i:i + self.shingle_size]).encode("utf-8", "replace")
+            h = (self._mix_a * zlib.crc32(shingle) + self._mix_b) % MERSENNE_PRIME
+            slot, value = h % num_bins, h // num_bins
+            if mins[slot] is None or value < mins[slot]:
+                mins[slot] = value
+
+        # Rotation densification; the offset keeps borrowed values distinct
+        signature = list(mins)
+        for slot in range(num_bins):
+            distance = 1
+            while signature[slot] is None:
+                borrowed = mins[(slot + distance) % num_bins]
+                if borrowed is not None:
+                    signature[slot] = borrowed + distance * MERSENNE_PRIME
+                distance += 1
+        return tuple(signature)
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
@@ -0,0 +1,139 @@
+from typing import Dict, List, Any, Tuple
+import math
+import os
+import random
+from ..utils.logging_config import setup_logger
+from ...config.settings import (
+    SAMPLING_COVERAGE_TARGET,
+    SAMPLING_MAX_FILES,
+    SAMPLING_STRATUM_DEPTH,
+    SAMPLING_SEED
+)
+
+logger = setup_logger(__name__)
+
+class StratifiedSampler:
+    """Picks a representative subset of repository files for architecture analysis.
+
+    Files are grouped into strata by directory prefix and language. Every
+    stratum is represented, and within a stratum files are drawn weighted by
+    priority and size. Sampling is seeded, so repeated runs pick the same
+    files and keep hitting the summary caches.
+    """
+
+    def __init__(
+        self,
+        coverage_target: float = SAMPLING_COVERAGE_TARGET,
+        max_files: int = SAMPLING_MAX_FILES,
+        stratum_depth: int = SAMPLING_STRATUM_DEPTH,
+        seed: int = SAMPLING_SEED
+    ):
+        if not 0 < coverage_target <= 1:
+            raise ValueError(f"coverage_target must be in (0, 1]: {coverage_target}")
+        self.coverage_target = coverage_target
+        self.max_files = max_files
+        self.stratum_depth = stratum_depth
+        self.seed = seed
+
+    def sample(self, tasks: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Sample file tasks (as produced by RepoAnalyzer).
+
+        Returns:
+            Tuple of (sampled tasks, coverage statistics)
+        """
+        strata: Dict[str, List[Dict[str, Any]]] = {}
+        for task in tasks:
+            strata.setdefault(self._stratum(task["file_path"]), []).append(task)
+
+        quotas = self._allocate(strata)
+        rng = random.Random(self.seed)
+        sampled = []
+        for name in sorted(strata):
+            sampled.extend(self._draw(strata[name], quotas.get(name, 0), rng))
+
+        stats = self._coverage(tasks, sampled, strata, quotas)
+        logger.info(
+            f"Sampled {stats['sampled_files']}/{stats['total_files']} files "
+            f"across {stats['covered_strata']}/{stats['total_strata']} strata"
+        )
+        return sampled, stats
+
+    def _stratum(self, file_path: str) -> str:
+        """Stratum key: leading directories plus file extension."""
+        directory = os.path.dirname(file_path).replace(os.sep, "/")
+        prefix = "/".join(directory.split("/")[:self.stratum_depth]) if directory else "."
+        return f"{prefix}:{os.path.splitext(file_path)[1].lower() or 'none'}"
+
+    def _allocate(self, strata: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
+        """Decide how many files to draw from each stratum."""
+        quotas = {
+            name: max(1, math.ceil(len(members) * self.coverage_target))
+            for name, members in strata.items()
+        }
+        total = sum(quotas.values())
+        if total <= self.max_files:
+            return quotas
+
+        # Over the cap: keep one file from as many strata as fit (heaviest
+        # first), then share what is left proportionally to stratum size
+        ranked = sorted(strata, key=lambda n: sum(self._weight(t) for t in strata[n]), reverse=True)
+        kept = ranked[:self.max_files]
+        quotas = {name: 1 for name in kept}
+
+        spare = self.max_files - len(kept)
+        extra_demand = {name: len(strata[name]) * self.coverage_target - 1 for name in kept}
+        demand_total = sum(d for d in extra_demand.values() if d > 0)
+        if spare > 0 and demand_total > 0:
+            # Largest remainder: floor every share, then hand the leftover files
+            # to the biggest fractions so the quotas add up to the cap
+            shares = {
+                name: spare * demand / demand_total
+                for name, demand in extra_demand.items() if demand > 0
+            }
+            for name, share in shares.items():
+                quotas[name] += int(share)
+            leftover = spare - sum(int(share) for share in shares.values())
+            by_remainder = sorted(shares, key=lambda n: (shares[n] - int(shares[n]), n), reverse=True)
+            for name in by_remainder[:leftover]:
+                quotas[name] += 1
+
+        return quotas
+
+    def _draw(self, members: List[Dict[str, Any]], quota: int, rng: random.Random) -> List[Dict[str, Any]]:
+        """Weighted sampling without replacement (Efraimidis-Spirakis)."""
+        if quota >= len(members):
+            return list(members)
+        keyed = sorted(
+            members,
+            key=lambda t: rng.random() ** (1.0 / self._weight(t)),
+            reverse=True
+        )
+        return keyed[:quota]
+
+    def _weight(self, task: Dict[str, Any]) -> float:
+        """Favor high-priority files, and larger files with diminishing returns."""
+        size = task.get("size", 0) or 0
+        return (task.get("priority", 0) + 1) * math.log2(2 + size / 1024)
+
+    def _coverage(
+        self,
+        tasks: List[Dict[str, Any]],
+        sampled: List[Dict[str, Any]],
+        strata: Dict[str, List[Dict[str, Any]]],
+        quotas: Dict[str, int]
+    ) -> Dict[str, Any]:
+        total_tokens = sum(t.get("estimated_tokens", 0) for t in tasks)
+        sampled_tokens = sum(t.get("estimated_tokens", 0) for t in sampled)
+        return {
+            "total_files": len(tasks),
+            "sampled_files": len(sampled),
+            "file_coverage": len(sampled) / len(tasks) if tasks else 1.0,
+            "total_strata": len(strata),
+            "covered_strata": sum(1 for q in quotas.values() if q > 0),
+            "token_coverage": sampled_tokens / total_tokens if total_tokens else 1.0,
+            "strata": {
+                name: {"files": len(members), "sampled": min(quotas.get(name, 0), len(members))}
+                for name, members in sorted(strata.items())
+            }
+        }
@@ -0,0 +1,176 @@
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+import os
+import re
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from github import Auth, Github
+from ..utils.logging_config import setup_logger
+from ..utils.error_handler import APIError
+from ..utils.cache.cache_manager import CacheManager
+from ...config.settings import (
+    CACHE_DIR, IO_POOL_SIZES, GITHUB_PAGE_CONCURRENCY, GITHUB_RATE_LIMIT_RESERVE,
+    GITHUB_MAX_RETRIES, GITHUB_TIMEOUT
+)
+
+logger = setup_logger(__name__)
+
+LAST_PAGE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+class GitHubAPI:
+    """Shared access to the GitHub REST API.
+
+    Reads go through one pooled HTTP session and are conditional: each
+    response's ETag is cached on disk with its body, and a 304 reply (which
+    does not count against the rate limit) is served from that cache. List
+    endpoints fetch their remaining pages concurrently once the first page
+    says how many there are. Every response updates the known quota; when
+    it runs low, requests are spread out until the reset instead of failing.
+    Writes go through ``client``, a PyGithub client with the same token.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = "https://api.github.com",
+        cache: CacheManager = None,
+        pool_size: int = IO_POOL_SIZES["github"]
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.session = requests.Session()
+        # Room for every GitHub pool worker plus concurrent page fetches
+        adapter = HTTPAdapter(pool_maxsize=pool_size + GITHUB_PAGE_CONCURRENCY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "DocSmith"
+        })
+        # Entries are revalidated on every use, so they never need to expire
+        self.cache = cache or CacheManager(CACHE_DIR / "github", ttl=0)
+        self.client = Github(auth=Auth.Token(token), base_url=self.base_url, per_page=100, pool_size=pool_size)
+        self._pages = ThreadPoolExecutor(max_workers=GITHUB_PAGE_CONCURRENCY, thread_name_prefix="github-pages")
+        self._lock = threading.Lock()
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.stats = {"requests": 0, "not_modified": 0}
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a JSON resource by API path (or full URL), revalidating any cached copy."""
+        return self._get(self._url(path, params))[0]
+
+    def paginate(self, path: str, params: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        GET every item of a list endpoint.
+
+        The first page's Link header gives the last page number; the other
+        pages are then fetched concurrently. Items keep page order.
+        """
+        params = {"per_page": 100, **(params or {})}
+        items, link = self._get(self._url(path, {**params, "page": 1}))
+        match = LAST_PAGE.search(link or '')
+        if not match:
+            return list(items)
+
+        items = list(items)
+        pages = self._pages.map(
+            lambda page: self._get(self._url(path, {**params, "page": page}))[0],
+            range(2, int(match.group(1)) + 1)
+        )
+        for page in pages:
+            items.extend(page)
+        return items
+
+    def throttle(self) -> None:
+        """Once the quota is low, wait so the rest lasts until it resets."""
+        with self._lock:
+            remaining, reset_at = self.remaining, self.reset_at
+        if remaining is None or remaining > GITHUB_RATE_LIMIT_RESERVE:
+            return
+        wait = max(0.0, reset_at - time.time())
+        if remaining > 0:
+            wait /= remaining
+        if wait > 0:
+            logger.info(f"GitHub quota low ({remaining} left); waiting {wait:.1f}s")
+            time.sleep(wait)
+
+    def _url(self, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        url = path if path.startswith(('http://', 'https://')) else f"{self.base_url}/{path.lstrip('/')}"
+        # Sorted so the same request always maps to the same cache entry
+        return f"{url}?{urlencode(sorted(params.items()))}" if params else url
+
+    def _get(self, url: str) -> Tuple[Any, str]:
+        """Conditional GET; returns the decoded body and the Link header."""
+        key = f"etag:{url}"
+        cached = self.cache.get(key)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+
+        for attempt in range(GITHUB_MAX_RETRIES + 1):
+            self.throttle()
+            response = self.session.get(url, headers=headers, timeout=GITHUB_TIMEOUT)
+            self._record_quota(response)
+            retry_after = self._retry_after(response)
+            if retry_after is None or attempt == GITHUB_MAX_RETRIES:
+                break
+            logger.warning(f"GitHub rate limit hit; retrying {url} in {retry_after:.0f}s")
+            time.sleep(retry_after)
+
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["not_modified"] += response.status_code == 304
+        if response.status_code == 304 and cached:
+            return cached["data"], cached["link"]
+        if response.status_code >= 400:
+            raise APIError(f"GitHub API returned {response.status_code} for {url}: {response.text[:200]}")
+
+        data = response.json()
+        link = response.headers.get('Link', '')
+        if response.headers.get('ETag'):
+            self.cache.set(key, {"etag": response.headers['ETag'], "data": data, "link": link})
+        return data, link
+
+    def _record_quota(self, response: requests.Response) -> None:
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        remaining, reset = int(remaining), float(reset)
+        with self._lock:
+            # Concurrent responses arrive out of order; within one window the lowest count is current
+            if self.remaining is None or reset > self.reset_at or remaining < self.remaining:
+                self.remaining, self.reset_at = remaining, reset
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, or None."""
+        if response.status_code not in (403, 429):
+            return None
+        # Secondary rate limits say how long to back off; primary ones when the quota resets
+        if response.headers.get('Retry-After'):
+            return float(response.headers['Retry-After'])
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            return max(1.0, float(response.headers.get('X-RateLimit-Reset', 0)) - time.time() + 1)
+        return None
+
+_shared: Dict[Tuple[str, str], GitHubAPI] = {}
+_shared_lock = threading.Lock()
+
+def shared_github_api(token: str = None, base_url: str = None) -> GitHubAPI:
+    """
+    The process-wide GitHubAPI for a token, created on first use.
+
+    ``base_url`` defaults to DOCSMITH_GITHUB_API_URL, for GitHub Enterprise
+    or a local stand-in.
+    """
+    token = token or os.getenv('GITHUB_TOKEN')
+    if not token:
+        raise ValueError("GitHub token not provided and GITHUB_TOKEN env var not set")
+    base_url = base_url or os.getenv('DOCSMITH_GITHUB_API_URL', 'https://api.github.com')
+    with _shared_lock:
+        if (token, base_url) not in _shared:
+            _shared[(token, base_url)] = GitHubAPI(token, base_url)
+        return _shared[(token, base_url)]
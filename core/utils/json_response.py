@@ -0,0 +1,19 @@
+from typing import Dict, Any, Optional
+import json
+import re
+
+FENCED_OBJECT = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.DOTALL)
+
+def parse_json_object(content: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parse the JSON object from an LLM response, or return None if there is none."""
+    # Models sometimes wrap JSON in a markdown code fence
+    fenced = FENCED_OBJECT.search(content or "")
+    if fenced:
+        content = fenced.group(1)
+
+    try:
+        data = json.loads(content)
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+    return data if isinstance(data, dict) else None
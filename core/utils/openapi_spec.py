@@ -0,0 +1,253 @@
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+import json
+import re
+from pathlib import Path
+from ..utils.logging_config import setup_logger
+
+try:
+    import yaml
+except ImportError:  # PyYAML is optional; JSON specs load without it
+    yaml = None
+
+logger = setup_logger(__name__)
+
+SPEC_STEMS = ('openapi', 'swagger')
+SPEC_SUFFIXES = ('.json', '.yaml', '.yml')
+IGNORED_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build'}
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+# Matches `openapi: 3.0.1` in YAML and `"swagger": "2.0"` in (even minified) JSON
+VERSION_PATTERN = re.compile(
+    r'''(?:^|[{,])\s*["']?(openapi|swagger)["']?\s*:\s*["']?(\d[\w.]*)''',
+    re.MULTILINE
+)
+HEAD_BYTES = 4096
+
+def find_specs(repo_path: str, files: Optional[List[str]] = None) -> List[Dict[str, str]]:
+    """
+    Find OpenAPI/Swagger documents shipped in a repository.
+
+    Candidates are named like openapi.yaml, swagger.json or api.openapi.yml
+    and must declare an openapi/swagger version near the top of the file.
+    YAML documents are skipped when PyYAML is not installed, so callers fall
+    back to extracting routes instead of failing to load the spec.
+
+    Returns:
+        [{"path", "version"}], shallowest first
+    """
+    root = Path(repo_path)
+    if files is None:
+        files = [
+            str(p.relative_to(root)) for p in root.rglob('*')
+            if p.is_file() and not IGNORED_DIRS & set(p.relative_to(root).parts)
+        ]
+
+    specs = []
+    for path in files:
+        name = Path(path).name.lower()
+        stem, suffix = Path(name).stem, Path(name).suffix
+        if suffix not in SPEC_SUFFIXES or not any(
+            stem == s or stem.endswith('.' + s) for s in SPEC_STEMS
+        ):
+            continue
+        with open(root / path, 'r', encoding='utf-8', errors='replace') as f:
+            match = VERSION_PATTERN.search(f.read(HEAD_BYTES))
+        if not match:
+            continue
+        if suffix != '.json' and yaml is None:
+            logger.warning(f"Skipping API spec {path}: install pyyaml to read YAML specs")
+            continue
+        specs.append({"path": path, "version": match.group(2)})
+
+    return sorted(specs, key=lambda s: (len(Path(s["path"]).parts), s["path"]))
+
+def load_spec(path: Path) -> "OpenAPISpec":
+    """Parse an OpenAPI 3 or Swagger 2 document from JSON or YAML."""
+    return OpenAPISpec(_read_document(Path(path)), Path(path))
+
+def _read_document(path: Path) -> Dict[str, Any]:
+    text = path.read_text(encoding='utf-8')
+    if path.suffix == '.json':
+        return json.loads(text)
+    if yaml is None:
+        raise ImportError(f"PyYAML is required to read {path}; install pyyaml or ship JSON")
+    # The C loader is several times faster on large specs when libyaml is present
+    return yaml.load(text, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+class OpenAPISpec:
+    """A parsed OpenAPI/Swagger document with lazily resolved references.
+
+    Nothing is dereferenced up front: a ``$ref`` is only followed when an
+    operation that uses it is rendered, and each target is looked up once.
+    Operations are produced one at a time, so rendering never holds more
+    than the parsed document and the endpoint being written.
+    """
+
+    def __init__(self, document: Dict[str, Any], path: Path):
+        self.document = document
+        self.path = path
+        self._external: Dict[Path, Dict[str, Any]] = {path.resolve(): document}
+        self._resolved: Dict[Tuple[Path, str], Any] = {}
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.document.get('openapi') or self.document.get('swagger')
+
+    @property
+    def title(self) -> str:
+        return (self.document.get('info') or {}).get('title') or self.path.stem
+
+    @property
+    def description(self) -> str:
+        return (self.document.get('info') or {}).get('description') or ''
+
+    def resolve(self, node: Any, base: Optional[Path] = None) -> Any:
+        """Follow a node's ``$ref`` chain (local or file-relative) to its target."""
+        base = (base or self.path).resolve()
+        seen = set()
+        while isinstance(node, dict) and isinstance(node.get('$ref'), str):
+            ref = node['$ref']
+            if (base, ref) in seen:
+                logger.warning(f"Circular $ref {ref} in {self.path}")
+                return {}
+            seen.add((base, ref))
+            node, base = self._lookup(base, ref)
+        return node
+
+    def operations(self) -> Iterator[Dict[str, Any]]:
+        """Yield every operation as an endpoint dict, in document order."""
+        for path, item in (self.document.get('paths') or {}).items():
+            item = self.resolve(item)
+            for method in HTTP_METHODS:
+                if isinstance(item.get(method), dict):
+                    yield self._endpoint(path, method, item)
+
+    def tag_groups(self) -> Iterator[Tuple[str, Iterator[Dict[str, Any]]]]:
+        """Yield (tag, operations) pairs; untagged operations go under "default".
+
+        Only (path, method) keys are grouped up front; endpoints are built
+        lazily while each group is consumed.
+        """
+        groups: Dict[str, List[Tuple[str, str]]] = {}
+        for name in (t.get('name') for t in self.document.get('tags') or [] if isinstance(t, dict)):
+            groups.setdefault(name, [])
+        for path, item in (self.document.get('paths') or {}).items():
+            item = self.resolve(item)
+            for method in HTTP_METHODS:
+                operation = item.get(method)
+                if isinstance(operation, dict):
+                    # Like most renderers, list an operation under its first tag only
+                    tag = (operation.get('tags') or ['default'])[0]
+                    groups.setdefault(tag, []).append((path, method))
+
+        for tag, keys in groups.items():
+            if keys:
+                yield tag, (self._endpoint(path, method, self.resolve(self.document['paths'][path]))
+                            for path, method in keys)
+
+    def _endpoint(self, path: str, method: str, item: Dict[str, Any]) -> Dict[str, Any]:
+        operation = item[method]
+        # Operation parameters override path-level ones with the same name and location
+        parameters: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for param in (item.get('parameters') or []) + (operation.get('parameters') or []):
+            param = self.resolve(param)
+            if isinstance(param, dict) and param.get('name'):
+                parameters[(param['name'], param.get('in', ''))] = self._parameter(param)
+
+        body = self.resolve(operation.get('requestBody'))
+        if isinstance(body, dict):
+            parameters[('body', 'body')] = {
+                "name": "body",
+                "in": "body",
+                "type": self._schema_type(self._media_schema(body.get('content'))),
+                "required": bool(body.get('required')),
+                "description": self._inline(body.get('description'))
+            }
+
+        description = "\n\n".join(
+            text for text in (operation.get('summary'), operation.get('description')) if text
+        )
+        return {
+            "method": method.upper(),
+            "path": path,
+            "description": description,
+            "parameters": list(parameters.values()),
+            "handler": operation.get('operationId'),
+            "file": str(self.path),
+            "line": None,
+            "framework": "openapi",
+            "tags": operation.get('tags') or ['default'],
+            "deprecated": bool(operation.get('deprecated')),
+            "response_example": self._response_example(operation)
+        }
+
+    def _parameter(self, param: Dict[str, Any]) -> Dict[str, Any]:
+        # Swagger 2 puts the type on the parameter, OpenAPI 3 in its schema
+        schema = param.get('schema') if 'schema' in param else param
+        return {
+            "name": param['name'],
+            "in": param.get('in', ''),
+            "type": self._schema_type(schema),
+            "required": bool(param.get('required')),
+            "description": self._inline(param.get('description'))
+        }
+
+    def _schema_type(self, schema: Any) -> str:
+        """Short type label; referenced schemas are named, not expanded."""
+        if not isinstance(schema, dict):
+            return "object"
+        if isinstance(schema.get('$ref'), str):
+            return schema['$ref'].rsplit('/', 1)[-1]
+        if schema.get('type') == 'array':
+            return f"array[{self._schema_type(schema.get('items'))}]"
+        for combinator in ('oneOf', 'anyOf', 'allOf'):
+            if isinstance(schema.get(combinator), list):
+                joiner = ' & ' if combinator == 'allOf' else ' | '
+                return joiner.join(self._schema_type(s) for s in schema[combinator])
+        return schema.get('type') or "object"
+
+    def _response_example(self, operation: Dict[str, Any]) -> str:
+        """JSON example of the first successful response, if the spec has one."""
+        responses = operation.get('responses') or {}
+        # YAML parses unquoted status codes as integers
+        for code, response in sorted(responses.items(), key=lambda r: str(r[0])):
+            response = self.resolve(response)
+            if not str(code).startswith('2') or not isinstance(response, dict):
+                continue
+            example = (response.get('examples') or {}).get('application/json')  # Swagger 2
+            for media_type, media in (response.get('content') or {}).items():
+                if example is not None or 'json' not in media_type or not isinstance(media, dict):
+                    continue
+                example = media.get('example')
+                if example is None and media.get('examples'):
+                    first = self.resolve(next(iter(media['examples'].values())))
+                    example = first.get('value') if isinstance(first, dict) else None
+            if example is not None:
+                return json.dumps(example, indent=2, default=str)
+        return ""
+
+    def _media_schema(self, content: Any) -> Any:
+        if not isinstance(content, dict) or not content:
+            return None
+        media = content.get('application/json') or next(iter(content.values()))
+        return media.get('schema') if isinstance(media, dict) else None
+
+    def _inline(self, text: Any) -> str:
+        """Flatten text so it fits in a markdown table cell."""
+        return " ".join(str(text or '').split()).replace('|', '\\|')
+
+    def _lookup(self, base: Path, ref: str) -> Tuple[Any, Path]:
+        location, _, pointer = ref.partition('#')
+        target = (base.parent / location).resolve() if location else base
+        key = (target, pointer)
+        if key not in self._resolved:
+            if target not in self._external:
+                self._external[target] = _read_document(target)
+            node = self._external[target]
+            for part in [p for p in pointer.split('/') if p]:
+                part = part.replace('~1', '/').replace('~0', '~')
+                node = node.get(part) if isinstance(node, dict) else None
+                if node is None:
+                    logger.warning(f"Unresolvable $ref {ref} in {self.path}")
+                    break
+            self._resolved[key] = node if node is not None else {}
+        return self._resolved[key], target
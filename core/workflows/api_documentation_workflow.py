@@ -1,6 +1,11 @@
 from typing import Dict, Any, List
+from pathlib import Path
 from ..base import BaseWorkflow, WorkflowStatus
 from ..utils.logging_config import setup_logger
+from ..output import DocumentGenerator
+from ..utils.openapi_spec import load_spec
+from ..utils.blocking_io import blocking_io
+from ...config.settings import DOCS_DIR
 
 logger = setup_logger(__name__)
 
@@ -9,6 +14,7 @@ class APIDocumentationWorkflow(BaseWorkflow):
     
     def __init__(self):
         super().__init__("api_documentation")
+        self.doc_generator = DocumentGenerator(DOCS_DIR)
         
     def define_steps(self) -> List[Dict[str, Any]]:
         """Define the steps for API documentation generation."""
@@ -36,29 +42,72 @@ class APIDocumentationWorkflow(BaseWorkflow):
         ]
         
     async def _detect_api_framework(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Detect the API framework used in the repository."""
+        """Detect the API framework used in the repository from its imports."""
         return await self.agency.delegate("tech_lead", "code_analyst", {
             "type": "detect_framework",
             "repo_info": params["repo_info"]
         })
         
     async def _extract_endpoints(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract API endpoints and their specifications."""
+        """Extract API endpoints statically from route declarations."""
+        framework_info = params["previous_step"]
+        if framework_info.get("specs"):
+            # Rendered straight from the spec in the next step
+            return {"endpoints": [], "specs": framework_info["specs"], "repo_path": framework_info["repo_path"]}
+
         return await self.agency.delegate("tech_lead", "code_analyst", {
             "type": "extract_endpoints",
-            "framework_info": params["previous_step"]
+            "framework_info": framework_info
         })
         
     async def _generate_api_docs(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate API documentation."""
-        return await self.agency.delegate("tech_lead", "code_analyst", {
-            "type": "generate_api_docs",
+        """Generate API documentation, using the LLM only for missing prose."""
+        if params["previous_step"].get("specs"):
+            # Parsing and streaming a large spec is all disk and CPU work
+            return await blocking_io.run("disk", self._render_specs, params["previous_step"])
+
+        described = await self.agency.delegate("tech_lead", "code_analyst", {
+            "type": "describe_endpoints",
             "endpoints": params["previous_step"]["endpoints"]
         })
+
+        return {
+            "documentation": {
+                "docs/api.md": self.doc_generator.render_api_docs({"endpoints": described["endpoints"]})
+            },
+            "endpoints": described["endpoints"]
+        }
         
+    def _render_specs(self, extracted: Dict[str, Any]) -> Dict[str, Any]:
+        """Stream per-tag documentation for each OpenAPI/Swagger spec found."""
+        specs = extracted["specs"]
+        documentation = {}
+        for spec_info in specs:
+            spec = load_spec(Path(extracted["repo_path"]) / spec_info["path"])
+            # Several specs (one per service, say) each get their own directory
+            directory = "docs/api"
+            if len(specs) > 1:
+                directory += "/" + Path(spec_info["path"]).with_suffix("").as_posix().replace("/", "-")
+            counts = self.doc_generator.write_api_docs(
+                spec.tag_groups(), spec.title, spec.description, directory
+            )
+            # Already on disk; the PR commits these files straight from there
+            documentation.update({path: self.doc_generator.output_dir / path for path in counts})
+
+        return {"documentation": documentation, "endpoints": [], "specs": specs}
+
     async def _validate_api_docs(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate generated API documentation."""
+        if params["previous_step"].get("specs"):
+            # Docs rendered from the repository's own spec need no LLM review
+            return {
+                "status": "approved",
+                "documentation": params["previous_step"]["documentation"],
+                "validation_results": []
+            }
+
         return await self.agency.delegate("tech_lead", "doc_reviewer", {
             "type": "validate_api_docs",
-            "documentation": params["previous_step"]["documentation"]
+            "documentation": params["previous_step"]["documentation"],
+            "endpoints": params["previous_step"]["endpoints"]
         })
\ No newline at end of file
@@ -1,9 +1,11 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Awaitable
 from pathlib import Path
+import asyncio
 from ..base import BaseWorkflow, WorkflowStatus
 from ..utils.logging_config import setup_logger
 from ..output import DocumentGenerator
-from ...config.settings import DOCS_DIR
+from ..utils.file_sampler import StratifiedSampler
+from ...config.settings import DOCS_DIR, SAMPLING_FILE_THRESHOLD
 
 logger = setup_logger(__name__)
 
@@ -53,51 +55,98 @@ class DocumentationWorkflow(BaseWorkflow):
         })
         
     async def _analyze_code(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze code and gather documentation content."""
-        analysis = await self.agency.delegate("tech_lead", "code_analyst", {
+        """Start code, architecture and file analysis; documentation awaits their results."""
+        # Started rather than awaited, so each documentation section can
+        # begin as soon as the analysis it needs is done
+        analysis = asyncio.ensure_future(self.agency.delegate("tech_lead", "code_analyst", {
             "type": "analyze_repository",
             "repo_info": params["previous_step"]
-        })
+        }))
         
-        # Enhance analysis with architecture information
-        arch_analysis = await self.agency.delegate("tech_lead", "code_analyst", {
+        arch_task = {
             "type": "analyze_architecture",
-            "repo_info": params["previous_step"],
-            "code_analysis": analysis
-        })
+            "repo_path": params["previous_step"]["path"]
+        }
+        sampling = None
+        repo_analysis = params.get("repo_analysis", {})
+        plan = repo_analysis.get("plan")
+        tasks = params["previous_step"].get("tasks") or repo_analysis.get("tasks")
+        if tasks is not None:
+            # Leaf summaries cover the files the plan budgeted for, never duplicates
+            candidates = [task for task in tasks if "duplicate_of" not in task]
+            if plan:
+                planned = {allocation["file_path"] for allocation in plan["files"]}
+                candidates = [task for task in candidates if task["file_path"] in planned]
+            # Huge repositories only need representative coverage for architecture
+            if params.get("sample_architecture", len(candidates) > SAMPLING_FILE_THRESHOLD):
+                candidates, sampling = StratifiedSampler().sample(candidates)
+            arch_task["files"] = [task["file_path"] for task in candidates]
+
+        # Enhance analysis with architecture information
+        arch_analysis = asyncio.ensure_future(self.agency.delegate("tech_lead", "tech_lead", arch_task))
+
+        # Document the files the budget plan selected, within its allowances
+        file_docs = None
+        if plan and plan["files"]:
+            file_docs = asyncio.ensure_future(self.agency.delegate("tech_lead", "code_analyst", {
+                "type": "analyze_files",
+                "repo_url": params["previous_step"]["url"],
+                "repo_path": params["previous_step"]["path"],
+                "files": [allocation["file_path"] for allocation in plan["files"]],
+                "duplicates": repo_analysis.get("duplicates", {}),
+                "plan": plan
+            }))
         
         return {
             "analysis": analysis,
             "architecture": arch_analysis,
+            "files": file_docs,
+            "sampling": sampling,
             "repo_info": params["previous_step"]
         }
         
     async def _generate_documentation(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Generate documentation using analyzed content."""
         previous_step = params["previous_step"]
+        analysis = previous_step["analysis"]
+        architecture = previous_step["architecture"]
         
-        # Prepare content for documentation generation
+        # Prepare content for documentation generation; values resolve as
+        # the analyses still running finish
         content = {
-            "description": previous_step["analysis"].get("description", ""),
-            "features": previous_step["analysis"].get("features", []),
-            "architecture_overview": previous_step["architecture"].get("overview", ""),
-            "components": previous_step["architecture"].get("components", []),
-            "has_api": previous_step["analysis"].get("has_api", False),
-            "setup_overview": previous_step["analysis"].get("setup_instructions", ""),
-            "installation_steps": previous_step["analysis"].get("installation", ""),
-            "usage": previous_step["analysis"].get("usage", ""),
+            "description": self._field(analysis, "description", ""),
+            "features": self._field(analysis, "features", []),
+            "architecture_overview": self._field(architecture, "overview", ""),
+            "components": self._field(architecture, "components", []),
+            "has_api": self._field(analysis, "has_api", False),
+            "setup_overview": self._field(analysis, "setup_instructions", ""),
+            "installation_steps": self._field(analysis, "installation", ""),
+            "usage": self._field(analysis, "usage", ""),
+            "sampling": previous_step.get("sampling"),
         }
         
-        # Generate documentation files
-        documentation = self.doc_generator.generate_documentation(
-            content,
-            previous_step["repo_info"]
-        )
+        # Generate documentation files, one concurrent section per file
+        tasks = [task for task in (analysis, architecture, previous_step.get("files")) if task]
+        try:
+            documentation = await self.doc_generator.generate_documentation(
+                content,
+                previous_step["repo_info"]
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        # Surface analysis failures even when no section awaited them
+        await asyncio.gather(*tasks)
         
         return {
             "documentation": documentation,
             "repo_info": previous_step["repo_info"]
         }
+
+    @staticmethod
+    async def _field(source: Awaitable[Dict[str, Any]], key: str, default: Any) -> Any:
+        return (await source).get(key, default)
         
     async def _review_documentation(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Review generated documentation."""
@@ -147,7 +196,8 @@ class DocumentationWorkflow(BaseWorkflow):
                 return {
                     "status": "success",
                     "pr_url": result["steps"]["create_pull_request"]["pr_url"],
-                    "documentation": result["steps"]["generate_documentation"]["documentation"]
+                    "documentation": result["steps"]["generate_documentation"]["documentation"],
+                    "sampling": result["steps"]["analyze_code"].get("sampling")
                 }
             else:
                 logger.error(f"Documentation workflow failed: {result['error']}")
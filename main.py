@@ -7,6 +7,8 @@ from typing import List, Tuple
 # Import from core package using absolute imports
 from core.utils.logging_config import setup_logger
 from core.llm.cost_calculator import cost_tracker
+from core.utils.blocking_io import blocking_io
+from core.llm.openai_client import openai_client
 from core.base.agent_manager import agent_manager
 from core.base.workflow_manager import workflow_manager
 from core.agents.tech_lead import TechLeadAgent
@@ -104,6 +106,8 @@ async def main(repo_url: str) -> None:
         # Initialize agency with communication paths
         agency = Agency(
             communication_paths=[
+                # Workflows run on the tech lead's behalf, including its own analyses
+                ("tech_lead", "tech_lead"),
                 ("tech_lead", "code_analyst"),
                 ("tech_lead", "doc_reviewer"),
                 ("tech_lead", "github"),
@@ -116,6 +120,7 @@ async def main(repo_url: str) -> None:
         
         print(f"\nStarting documentation generation for {repo_url}")
         print("=" * 50)
+        await openai_client.warm_up()
         
         # Process the repository
         result = await agency.process_repository(repo_url)
@@ -133,6 +138,31 @@ async def main(repo_url: str) -> None:
         print(f"Total Cost: ${cost_summary['total_cost']:.4f}")
         print(f"Total Tokens: {cost_summary['total_tokens']}")
         print(f"Total Requests: {cost_summary['total_requests']}")
+        for route, usage in cost_summary['route_usage'].items():
+            print(
+                f"  {route}: {usage['hit_rate']:.0%} cheap-model hits, "
+                f"saved ${usage['savings']:.4f}"
+            )
+
+        # Print blocking I/O summary
+        print("\nBlocking I/O:")
+        print("-" * 30)
+        for pool, stats in blocking_io.metrics().items():
+            print(
+                f"  {pool}: {stats['completed']} calls, "
+                f"max queue {stats['max_queued']}/{stats['workers']}, "
+                f"waited {stats['wait_time']:.2f}s, blocked {stats['blocking_time']:.2f}s"
+            )
+
+        # Print LLM connection pool summary
+        connections = openai_client.connection_metrics()
+        if connections:
+            print(
+                f"\nLLM connections: {connections['open_connections']} open "
+                f"(max {connections['max_connections']}), peak {connections['peak_in_flight']} "
+                f"requests in flight, HTTP/2 {'on' if connections['http2'] else 'off'}"
+            )
+        await openai_client.close()
         
     except Exception as e:
         logger.error(f"Error processing repository: {str(e)}")